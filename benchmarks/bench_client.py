@@ -0,0 +1,238 @@
+"""Benchmarks of the pyscx clients against a local mock of the STALCRAFT: X API.
+
+Measures the throughput and the latency percentiles of the synchronous client (sequential and
+threaded) and of the asynchronous client, the parsing cost of every model and the memory taken
+by 10 000 parsed objects. No network access or tokens are needed.
+
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --requests 2000 --concurrency 32 --latency 0.005 --json results.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import math
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import requests
+
+from pyscx import API, AsyncAPI, Server, Token, TokenType
+from pyscx.decoding import decode, loads
+from pyscx.history import PriceHistory
+from pyscx.mock import MockAPIServer
+from pyscx.objects import (
+    AuctionLot,
+    AuctionRedeemedLot,
+    CharacterInfo,
+    Clan,
+    ClanMember,
+    FullCharacterInfo,
+)
+from pyscx.views import view_class
+
+
+TOKEN = Token(value="benchmark", type=TokenType.APPLICATION)
+ITEM = "1kv2"
+MEMORY_OBJECTS = 10_000
+
+# Model, path on the mock server and the key holding the items (None for plain lists and objects).
+PARSE_CASES = (
+    (AuctionRedeemedLot, f"/EU/auction/{ITEM}/history?limit=200", "prices"),
+    (AuctionLot, f"/EU/auction/{ITEM}/lots?limit=200", "lots"),
+    (Clan, "/EU/clans?limit=200", "data"),
+    (ClanMember, "/EU/clan/1/members", None),
+    (CharacterInfo, "/EU/characters", None),
+    (FullCharacterInfo, "/EU/character/by-name/Test-1/profile", None),
+)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> dict[str, Any]:
+    result = {
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+    print(
+        f"  {name:<24} {result['requests_per_second']:>10.1f} req/s"
+        f"  p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms"
+    )
+    return result
+
+
+def timed(call: Callable[[], Any], latencies: list[float]) -> None:
+    started = time.perf_counter()
+    call()
+    latencies.append(time.perf_counter() - started)
+
+
+def bench_sync(api: API, call: Callable[[API], Any], count: int, concurrency: int) -> dict[str, Any]:
+    results = {}
+
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for _ in range(count):
+        timed(lambda: call(api), latencies)
+    results["sync"] = report("sync", latencies, time.perf_counter() - started)
+
+    latencies = []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(timed, lambda: call(api), latencies) for _ in range(count)]:
+            future.result()
+    results["threaded"] = report(f"threaded ({concurrency})", latencies, time.perf_counter() - started)
+    return results
+
+
+def bench_async(url: str, call: Callable[[AsyncAPI], Any], count: int, concurrency: int, **options) -> dict:
+    async def run() -> dict[str, Any]:
+        latencies: list[float] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with AsyncAPI(tokens=TOKEN, server=Server.DEMO, base_url=url, **options) as api:
+
+            async def one() -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    await call(api)
+                    latencies.append(time.perf_counter() - started)
+
+            await one()  # Opens the connection pool outside of the measurement.
+            latencies.clear()
+            started = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(count)))
+            return report(f"async ({concurrency})", latencies, time.perf_counter() - started)
+
+    return asyncio.run(run())
+
+
+def bench_throughput(server: MockAPIServer, args: argparse.Namespace) -> dict[str, Any]:
+    scenarios = {
+        "clan_info": lambda api: api.clans(region="EU").get_info(clan_id="1"),
+        "item_history_200": lambda api: api.auction(region="EU").get_item_history(item_id=ITEM, limit=200),
+    }
+    results: dict[str, Any] = {}
+    for fast_parsing in (False, True):
+        for name, call in scenarios.items():
+            label = f"{name}{'/fast' if fast_parsing else ''}"
+            print(f"{label}:")
+            api = API(tokens=TOKEN, server=Server.DEMO, base_url=server.url, fast_parsing=fast_parsing)
+            call(api)  # Warms up the connection and the payload cache of the server.
+            results[label] = bench_sync(api, call, args.requests, args.concurrency)
+            try:
+                results[label]["async"] = bench_async(
+                    server.url, call, args.requests, args.concurrency, fast_parsing=fast_parsing
+                )
+            except ImportError:
+                print("  async                    skipped, aiohttp is not installed")
+    return results
+
+
+def bench_parsing(server: MockAPIServer, repeat: int) -> dict[str, Any]:
+    print("parse cost per object:")
+    results = {}
+    headers = {"Authorization": f"Bearer {TOKEN.value}"}
+    for model, path, key in PARSE_CASES:
+        content = requests.get(f"{server.url}{path}", headers=headers).content
+        data = loads(content)
+        raw = data[key] if key else data
+        count = len(raw) if isinstance(raw, list) else 1
+
+        def strict() -> Any:
+            data = json.loads(content)
+            items = data[key] if key else data
+            return [model(**item) for item in items] if isinstance(items, list) else model(**items)
+
+        costs = {}
+        parsers = (
+            ("strict", strict),
+            ("fast", lambda: decode(content, model, key)),
+            ("lazy", lambda: decode(content, view_class(model), key)),
+        )
+        for name, parse in parsers:
+            parse()
+            started = time.perf_counter()
+            for _ in range(repeat):
+                parse()
+            costs[name] = (time.perf_counter() - started) / repeat / count * 1e6
+
+        results[model.__name__] = {
+            "objects": count,
+            "bytes": len(content),
+            **{f"{name}_us": cost for name, cost in costs.items()},
+        }
+        print(
+            f"  {model.__name__:<20} {count:>4} objects  strict {costs['strict']:>8.2f} us"
+            f"  fast {costs['fast']:>8.2f} us  lazy {costs['lazy']:>8.2f} us"
+        )
+    return results
+
+
+def measure(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_memory(server: MockAPIServer) -> dict[str, Any]:
+    print(f"memory per {MEMORY_OBJECTS} objects:")
+    prices = [server.payloads.redeemed_lot(ITEM, index) for index in range(MEMORY_OBJECTS)]
+    content = json.dumps({"prices": prices}).encode()
+
+    builds = {
+        "raw dicts": lambda: loads(content)["prices"],
+        "AuctionRedeemedLot": lambda: decode(content, AuctionRedeemedLot, "prices"),
+        "lazy views": lambda: decode(content, view_class(AuctionRedeemedLot), "prices"),
+        "PriceHistory": lambda: PriceHistory.from_records(loads(content)["prices"]),
+    }
+
+    results = {}
+    for name, build in builds.items():
+        try:
+            size = measure(build)
+        except ImportError:
+            print(f"  {name:<20} skipped, numpy is not installed")
+            continue
+        results[name] = size
+        print(f"  {name:<20} {size / 2**20:>8.2f} MiB")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="API calls per client and scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="workers of the concurrent clients")
+    parser.add_argument("--latency", type=float, default=0.0, help="latency added by the server, in seconds")
+    parser.add_argument("--repeat", type=int, default=50, help="repetitions of every parsing measurement")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to a JSON file")
+    args = parser.parse_args()
+
+    with MockAPIServer(history_size=MEMORY_OBJECTS, latency=args.latency) as server:
+        results = {
+            "throughput": bench_throughput(server, args),
+            "parsing": bench_parsing(server, args.repeat),
+            "memory": bench_memory(server),
+        }
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
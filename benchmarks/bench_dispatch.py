@@ -0,0 +1,45 @@
+"""Microbenchmark of the per-call overhead of the pyscx method dispatch.
+
+Times, in nanoseconds per operation, the resolution of a method group, its binding to a region,
+the lookup of a method and a whole API call answered from a warm response cache, so no network
+round trip is included.
+
+    python benchmarks/bench_dispatch.py
+    python benchmarks/bench_dispatch.py --number 200000
+"""
+
+import argparse
+import timeit
+
+from pyscx import API, Server, Token, TokenType
+from pyscx.cache import ResponseCache
+from pyscx.mock import MockAPIServer
+
+
+TOKEN = Token(value="benchmark", type=TokenType.APPLICATION)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100_000, help="operations per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements, the best one is reported")
+    args = parser.parse_args()
+
+    with MockAPIServer() as server:
+        api = API(tokens=TOKEN, server=Server.DEMO, base_url=server.url, cache=ResponseCache(default_ttl=3600))
+        api.clans(region="EU").get_info(clan_id="1")  # Warms up the cache.
+
+        cases = {
+            "group access": lambda: api.clans,
+            "region binding": lambda: api.clans(region="EU"),
+            "method lookup": lambda: api.clans(region="EU").get_info,
+            "cached call": lambda: api.clans(region="EU").get_info(clan_id="1"),
+        }
+        for name, case in cases.items():
+            number = args.number if name != "cached call" else args.number // 10
+            best = min(timeit.repeat(case, number=number, repeat=args.repeat))
+            print(f"  {name:<16} {best / number * 1e9:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-from .api import API
+from .api import API, AsyncAPI
 from .http import Server
-from .token import Token, TokenType
+from .token import Token, TokenPool, TokenType
 
 
-__all__ = ("Server", "API", "Token", "TokenType")
+__all__ = ("Server", "API", "AsyncAPI", "Token", "TokenPool", "TokenType")
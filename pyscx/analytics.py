@@ -0,0 +1,718 @@
+from datetime import timedelta, timezone
+from typing import Any, Hashable, Iterable, Iterator
+
+from .columnar import naive_utc, np, require_numpy
+from .history import PriceHistory
+from .objects import AuctionLot, AuctionRedeemedLot
+
+
+def _group_starts(sorted_codes: "np.ndarray") -> "np.ndarray":
+    """Returns the positions where a new group begins in an array of sorted group codes."""
+    if not len(sorted_codes):
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+
+
+def _group_median(values: "np.ndarray", codes: "np.ndarray", count: int) -> "np.ndarray":
+    """Calculates the median of every group at once. Every code below `count` must occur in `codes`."""
+    sorted_values = values[np.lexsort((values, codes))]
+    sizes = np.bincount(codes, minlength=count)
+    starts = np.cumsum(sizes) - sizes
+    return (sorted_values[starts + (sizes - 1) // 2] + sorted_values[starts + sizes // 2]) / 2
+
+
+def outlier_mask(values: Any, groups: Any = None, threshold: float = 3.5) -> "np.ndarray":
+    """Flags prices that lie far from the other prices of their group.
+
+    The modified z-score of every value, its distance to the median of the group scaled by the
+    median absolute deviation, is compared to the threshold. Groups whose median absolute deviation
+    is zero are scaled by the mean absolute deviation instead. All groups are processed at once.
+
+    .. code-block:: python
+
+        history = api.auction(region="EU").get_history_columns(item_id="1kv2", limit=200)
+        clean = history[~outlier_mask(history.unit_price)]
+
+    Args:
+        values (Any): The prices. NaN values are never flagged and do not affect the other values.
+        groups (Any): The group of every value, e.g. item identifiers. Defaults to a single group.
+        threshold (float): The modified z-score above which a value is an outlier.
+
+    Returns:
+        numpy.ndarray: A boolean mask, true for the outliers.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    require_numpy("Market analytics")
+    values = np.asarray(values, dtype=np.float64)
+    mask = np.zeros(len(values), dtype=bool)
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return mask
+
+    if groups is None:
+        codes, count = np.zeros(len(valid), dtype=np.intp), 1
+    else:
+        unique, codes = np.unique(np.asarray(groups)[valid], return_inverse=True)
+        codes, count = codes.ravel(), len(unique)
+
+    points = values[valid]
+    deviation = np.abs(points - _group_median(points, codes, count)[codes])
+    mad = _group_median(deviation, codes, count)
+    mean_deviation = np.bincount(codes, weights=deviation, minlength=count) / np.bincount(codes, minlength=count)
+    scale = np.where(mad > 0, mad / 0.6745, mean_deviation * 1.253314)[codes]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mask[valid] = deviation / scale > threshold
+    return mask
+
+
+class DepthCurve:
+    """The order book of an item: its buyout lots from the cheapest to the most expensive one.
+
+    Lots are bought whole, so the cost of a quantity is the total buyout price of the cheapest
+    lots holding at least that many items.
+
+    Attributes:
+        price (numpy.ndarray): The buyout prices of a single item of every lot, ascending, as float64.
+        amount (numpy.ndarray): The numbers of items in the lots, as int64.
+        volume (numpy.ndarray): The number of items available up to every lot, as int64.
+        cost (numpy.ndarray): The total buyout price of the lots up to every lot, as float64.
+    """
+
+    __slots__ = ("price", "amount", "volume", "cost")
+
+    def __init__(self, price: Any, amount: Any) -> None:
+        """Initializes the curve.
+
+        Args:
+            price (Any): The unit buyout prices of the lots, in ascending order.
+            amount (Any): The numbers of items in the lots.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        require_numpy("Market analytics")
+        self.price = np.asarray(price, dtype=np.float64)
+        self.amount = np.asarray(amount, dtype=np.int64)
+        self.volume = np.cumsum(self.amount)
+        self.cost = np.cumsum(self.price * self.amount)
+
+    def _lookup(self, column: "np.ndarray", quantity: Any) -> Any:
+        quantity = np.asarray(quantity)
+        index = np.searchsorted(self.volume, quantity, side="left")
+        # Quantities beyond the available volume map to the NaN appended at the end.
+        return np.where(quantity > 0, np.append(column, np.nan)[index], 0.0)[()]
+
+    def cost_of(self, quantity: Any) -> Any:
+        """Calculates the cost of buying the quantity of items from the cheapest lots.
+
+        Args:
+            quantity (Any): The number of items, or an array of numbers.
+
+        Returns:
+            Any: The total buyout price, or NaN if fewer items are on sale.
+        """
+        return self._lookup(self.cost, quantity)
+
+    def price_at(self, quantity: Any) -> Any:
+        """Returns the unit price of the most expensive lot needed to buy the quantity of items.
+
+        Args:
+            quantity (Any): The number of items, or an array of numbers.
+
+        Returns:
+            Any: The marginal unit price, or NaN if fewer items are on sale.
+        """
+        return self._lookup(self.price, quantity)
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def __repr__(self) -> str:
+        volume = int(self.volume[-1]) if len(self) else 0
+        return f"{type(self).__name__}(lots={len(self)}, volume={volume})"
+
+
+class LotBook:
+    """Columnar representation of the active auction lots of one or many items.
+
+    The lots of a whole item catalog fit in a single book, and every aggregate is computed for all
+    items in one vectorized pass. Rows are only materialized into `AuctionLot` objects when they are
+    accessed by index or iterated over. Lots without a buyout price have a `buyout_price` of 0 and
+    are left out of the buyout aggregates.
+
+    .. code-block:: python
+
+        result = api.auction(region="EU").get_items_lots(item_ids=catalog, limit=200)
+        book = LotBook.concat(result.values.values()).active().without_outliers()
+        cheapest = book.cheapest(3)
+        print(book.depth("1kv2").cost_of(50))
+
+    Attributes:
+        item_id (numpy.ndarray): The identifiers of the items, as strings.
+        amount (numpy.ndarray): The numbers of items in the lots, as int64.
+        start_price (numpy.ndarray): The starting prices of the lots, as int64.
+        current_price (numpy.ndarray): The current bids, as int64. Lots without a bid have a 0.
+        buyout_price (numpy.ndarray): The buyout prices of the lots, as int64.
+        start_time (numpy.ndarray): The moments the lots were created, as naive UTC datetime64[ms].
+        end_time (numpy.ndarray): The moments the lots close, as naive UTC datetime64[ms].
+        additional (numpy.ndarray): The additional data of the lots, as objects. Empty data is stored as None.
+    """
+
+    __slots__ = (
+        "item_id",
+        "amount",
+        "start_price",
+        "current_price",
+        "buyout_price",
+        "start_time",
+        "end_time",
+        "additional",
+    )
+
+    def __init__(
+        self,
+        item_id: Any,
+        amount: Any,
+        start_price: Any,
+        current_price: Any,
+        buyout_price: Any,
+        start_time: Any,
+        end_time: Any,
+        additional: Any = None,
+    ) -> None:
+        """Initializes the book from its columns.
+
+        Args:
+            item_id (Any): The identifiers of the items.
+            amount (Any): The numbers of items in the lots.
+            start_price (Any): The starting prices of the lots.
+            current_price (Any): The current bids, 0 for lots without a bid.
+            buyout_price (Any): The buyout prices of the lots.
+            start_time (Any): The moments the lots were created, in UTC.
+            end_time (Any): The moments the lots close, in UTC.
+            additional (Any): The additional data of the lots. Defaults to no additional data.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the columns have different lengths.
+        """
+        require_numpy("Market analytics")
+        self.item_id = np.asarray(item_id, dtype=str)
+        self.amount = np.asarray(amount, dtype=np.int64)
+        self.start_price = np.asarray(start_price, dtype=np.int64)
+        self.current_price = np.asarray(current_price, dtype=np.int64)
+        self.buyout_price = np.asarray(buyout_price, dtype=np.int64)
+        self.start_time = np.asarray(start_time, dtype="datetime64[ms]")
+        self.end_time = np.asarray(end_time, dtype="datetime64[ms]")
+        if additional is None:
+            additional = np.full(len(self.item_id), None, dtype=object)
+        self.additional = np.asarray(additional, dtype=object)
+
+        if len({len(getattr(self, column)) for column in self.__slots__}) > 1:
+            raise ValueError("All columns of the lot book must have the same length.")
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> "LotBook":
+        """Builds the book from the raw lots returned by the API.
+
+        Args:
+            records (list[dict[str, Any]]): The decoded lots, as found under the `lots` key of the response.
+
+        Returns:
+            LotBook: The columnar lots.
+        """
+        require_numpy("Market analytics")
+        count = len(records)
+        additional = np.empty(count, dtype=object)
+        additional[:] = [record.get("additional") or None for record in records]
+
+        def column(key: str) -> "np.ndarray":
+            return np.fromiter((record.get(key) or 0 for record in records), dtype=np.int64, count=count)
+
+        return cls(
+            item_id=[record["itemId"] for record in records],
+            amount=column("amount"),
+            start_price=column("startPrice"),
+            current_price=column("currentPrice"),
+            buyout_price=column("buyoutPrice"),
+            start_time=np.array([naive_utc(record["startTime"]) for record in records], dtype="datetime64[ms]"),
+            end_time=np.array([naive_utc(record["endTime"]) for record in records], dtype="datetime64[ms]"),
+            additional=additional,
+        )
+
+    @classmethod
+    def from_lots(cls, lots: Iterable[AuctionLot]) -> "LotBook":
+        """Builds the book from lot objects, e.g. those yielded by `iter_lots`.
+
+        Args:
+            lots (Iterable[AuctionLot]): The active lots.
+
+        Returns:
+            LotBook: The columnar lots.
+        """
+        return cls.from_records([lot.raw() for lot in lots])
+
+    @classmethod
+    def concat(cls, books: Iterable["LotBook"]) -> "LotBook":
+        """Joins several books, e.g. those of every item of a catalog, into one.
+
+        Args:
+            books (Iterable[LotBook]): The books to join, in order.
+
+        Returns:
+            LotBook: The joined book.
+        """
+        books = list(books)
+        if not books:
+            return cls([], [], [], [], [], [], [])
+        return cls(*(np.concatenate([getattr(book, column) for book in books]) for column in cls.__slots__))
+
+    @property
+    def unit_buyout(self) -> "np.ndarray":
+        """Returns the buyout price of a single item of every lot.
+
+        Returns:
+            numpy.ndarray: The unit buyout prices, as float64. Lots without a buyout price have a NaN.
+        """
+        with np.errstate(invalid="ignore"):
+            return np.where(self.buyout_price > 0, self.buyout_price / np.maximum(self.amount, 1), np.nan)
+
+    @property
+    def items(self) -> "np.ndarray":
+        """Returns the identifiers of the items in the book.
+
+        Returns:
+            numpy.ndarray: The sorted unique item identifiers.
+        """
+        return np.unique(self.item_id)
+
+    def _buyout_order(self) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Orders the lots with a buyout price by item and unit price.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The positions of the lots in that order,
+                their unit prices and the positions where the lots of the next item begin.
+        """
+        price = self.unit_buyout
+        valid = np.flatnonzero(~np.isnan(price))
+        item_id = self.item_id[valid]
+        order = valid[np.lexsort((price[valid], item_id))]
+        return order, price[order], _group_starts(self.item_id[order])
+
+    def for_item(self, item_id: str) -> "LotBook":
+        """Returns the lots of a single item.
+
+        Args:
+            item_id (str): The identifier of the item.
+
+        Returns:
+            LotBook: The lots of the item.
+        """
+        return self[self.item_id == item_id]
+
+    def active(self, at: Any = None) -> "LotBook":
+        """Returns the lots that are still open.
+
+        Args:
+            at (Any): The moment to check the lots at, as a naive UTC datetime or datetime64. Defaults to now.
+
+        Returns:
+            LotBook: The lots closing after the moment.
+        """
+        moment = np.datetime64("now", "ms") if at is None else np.datetime64(at, "ms")
+        return self[self.end_time > moment]
+
+    def update(self, book: "LotBook") -> "LotBook":
+        """Replaces the lots of the items present in a newer book, e.g. a fresh page of `get_item_lots`.
+
+        Args:
+            book (LotBook): The current lots of some items.
+
+        Returns:
+            LotBook: The lots of the other items, followed by the lots of the newer book.
+        """
+        kept = self[~np.isin(self.item_id, np.unique(book.item_id))]
+        return type(self).concat([kept, book])
+
+    def cheapest(self, n: int = 1) -> "LotBook":
+        """Returns the cheapest buyout lots of every item, by unit price.
+
+        Args:
+            n (int): The maximum number of lots per item.
+
+        Returns:
+            LotBook: The lots, grouped by item and ordered from the cheapest one.
+
+        Raises:
+            ValueError: If `n` is not positive.
+        """
+        if n < 1:
+            raise ValueError("At least one lot per item must be requested.")
+        order, _, starts = self._buyout_order()
+        positions = np.arange(len(order))
+        rank = positions - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        return self[order[rank < n]]
+
+    def depth(self, item_id: str) -> DepthCurve:
+        """Builds the depth curve of a single item.
+
+        Args:
+            item_id (str): The identifier of the item.
+
+        Returns:
+            DepthCurve: The buyout lots of the item, from the cheapest one.
+        """
+        return self.for_item(item_id).depth_curves().get(item_id, DepthCurve([], []))
+
+    def depth_curves(self) -> dict[str, DepthCurve]:
+        """Builds the depth curves of all items with a single sort.
+
+        Returns:
+            dict[str, DepthCurve]: The curves, keyed by item identifier.
+        """
+        order, price, starts = self._buyout_order()
+        bounds = starts[1:]
+        return {
+            str(item_id): DepthCurve(prices, amounts)
+            for item_id, prices, amounts in zip(
+                self.item_id[order[starts]], np.split(price, bounds), np.split(self.amount[order], bounds)
+            )
+        }
+
+    def outlier_mask(self, threshold: float = 3.5) -> "np.ndarray":
+        """Flags lots whose unit buyout price lies far from the other lots of the same item.
+
+        Args:
+            threshold (float): The modified z-score above which a lot is an outlier, see `outlier_mask`.
+
+        Returns:
+            numpy.ndarray: A boolean mask, true for the outliers. Lots without a buyout price are never flagged.
+        """
+        return outlier_mask(self.unit_buyout, self.item_id, threshold)
+
+    def without_outliers(self, threshold: float = 3.5) -> "LotBook":
+        """Returns the book without the lots flagged by `outlier_mask`.
+
+        Args:
+            threshold (float): The modified z-score above which a lot is an outlier.
+
+        Returns:
+            LotBook: The remaining lots.
+        """
+        return self[~self.outlier_mask(threshold)]
+
+    def row(self, index: int) -> AuctionLot:
+        """Materializes a single lot into a lot object.
+
+        Args:
+            index (int): The position of the lot.
+
+        Returns:
+            AuctionLot: The lot.
+        """
+
+        def moment(column: "np.ndarray") -> Any:
+            return column[index].astype("datetime64[us]").item().replace(tzinfo=timezone.utc)
+
+        return AuctionLot(
+            itemId=str(self.item_id[index]),
+            amount=int(self.amount[index]),
+            startPrice=int(self.start_price[index]),
+            currentPrice=int(self.current_price[index]) or None,
+            buyoutPrice=int(self.buyout_price[index]),
+            startTime=moment(self.start_time),
+            endTime=moment(self.end_time),
+            additional=self.additional[index] or {},
+        )
+
+    def __len__(self) -> int:
+        return len(self.item_id)
+
+    def __iter__(self) -> Iterator[AuctionLot]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __getitem__(self, index: Any) -> "AuctionLot | LotBook":
+        if isinstance(index, (int, np.integer)):
+            return self.row(index)
+        return type(self)(*(getattr(self, column)[index] for column in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(lots={len(self)}, items={len(self.items)})"
+
+
+def _interval(interval: Any) -> "np.timedelta64":
+    if isinstance(interval, (int, float)):
+        interval = timedelta(seconds=interval)
+    interval = np.timedelta64(interval, "ms")
+    if interval <= np.timedelta64(0, "ms"):
+        raise ValueError("The interval of the candles must be positive.")
+    return interval
+
+
+class Candles:
+    """Time-bucketed OHLC candles of the unit sale prices of an item.
+
+    Every candle covers one interval, aligned to the Unix epoch, in which at least one sale was made.
+    Candles are built from a `PriceHistory` in one vectorized pass, and candles built from different
+    sales can be merged, so new sales are added without recomputing the older ones.
+
+    .. code-block:: python
+
+        history = api.auction(region="EU").get_history_columns(item_id="1kv2", limit=200)
+        hourly = Candles.from_history(history, interval=timedelta(hours=1))
+        print(hourly.close, hourly.vwap)
+
+    Attributes:
+        interval (numpy.timedelta64): The length of every candle.
+        start (numpy.ndarray): The start of every candle, ascending, as naive UTC datetime64[ms].
+        open (numpy.ndarray): The unit price of the first sale of every candle, as float64.
+        high (numpy.ndarray): The highest unit price of every candle, as float64.
+        low (numpy.ndarray): The lowest unit price of every candle, as float64.
+        close (numpy.ndarray): The unit price of the last sale of every candle, as float64.
+        volume (numpy.ndarray): The number of items sold in every candle, as int64.
+        turnover (numpy.ndarray): The total price of the lots sold in every candle, as int64.
+        count (numpy.ndarray): The number of lots sold in every candle, as int64.
+        first_time (numpy.ndarray): The moment of the first sale of every candle, as datetime64[ms].
+        last_time (numpy.ndarray): The moment of the last sale of every candle, as datetime64[ms].
+    """
+
+    __slots__ = (
+        "interval",
+        "start",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "turnover",
+        "count",
+        "first_time",
+        "last_time",
+    )
+
+    def __init__(
+        self,
+        interval: Any,
+        start: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any,
+        turnover: Any,
+        count: Any,
+        first_time: Any,
+        last_time: Any,
+    ) -> None:
+        """Initializes the candles from their columns.
+
+        Args:
+            interval (Any): The length of every candle, as seconds, a timedelta or a timedelta64.
+            start (Any): The starts of the candles, in ascending order.
+            open (Any): The opening unit prices.
+            high (Any): The highest unit prices.
+            low (Any): The lowest unit prices.
+            close (Any): The closing unit prices.
+            volume (Any): The numbers of items sold.
+            turnover (Any): The total prices of the lots sold.
+            count (Any): The numbers of lots sold.
+            first_time (Any): The moments of the first sales.
+            last_time (Any): The moments of the last sales.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the interval is not positive.
+        """
+        require_numpy("Market analytics")
+        self.interval = _interval(interval)
+        self.start = np.asarray(start, dtype="datetime64[ms]")
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.int64)
+        self.turnover = np.asarray(turnover, dtype=np.int64)
+        self.count = np.asarray(count, dtype=np.int64)
+        self.first_time = np.asarray(first_time, dtype="datetime64[ms]")
+        self.last_time = np.asarray(last_time, dtype="datetime64[ms]")
+
+    @classmethod
+    def from_history(cls, history: PriceHistory, interval: Any) -> "Candles":
+        """Aggregates the sales of a price history into candles.
+
+        Args:
+            history (PriceHistory): The sales, in any order.
+            interval (Any): The length of every candle, as seconds, a timedelta or a timedelta64.
+
+        Returns:
+            Candles: The candles of the intervals with at least one sale.
+        """
+        interval = _interval(interval)
+        step = interval.astype(np.int64)
+        time = history.time.astype(np.int64)
+        bucket = time // step * step
+        order = np.lexsort((time, bucket))
+        bucket, time = bucket[order], time[order]
+        price = history.unit_price[order]
+        starts = _group_starts(bucket)
+        ends = np.r_[starts[1:], len(bucket)] - 1
+        if not len(starts):
+            return cls(interval, *([[]] * 10))
+        return cls(
+            interval,
+            start=bucket[starts],
+            open=price[starts],
+            high=np.maximum.reduceat(price, starts),
+            low=np.minimum.reduceat(price, starts),
+            close=price[ends],
+            volume=np.add.reduceat(history.amount[order], starts),
+            turnover=np.add.reduceat(history.price[order], starts),
+            count=ends - starts + 1,
+            first_time=time[starts],
+            last_time=time[ends],
+        )
+
+    @classmethod
+    def from_lots(cls, lots: Iterable[AuctionRedeemedLot], interval: Any) -> "Candles":
+        """Aggregates redeemed lot objects, e.g. those returned by `sync_history`, into candles.
+
+        Args:
+            lots (Iterable[AuctionRedeemedLot]): The sales, in any order.
+            interval (Any): The length of every candle, as seconds, a timedelta or a timedelta64.
+
+        Returns:
+            Candles: The candles of the intervals with at least one sale.
+        """
+        return cls.from_history(PriceHistory.from_lots(lots), interval)
+
+    @property
+    def vwap(self) -> "np.ndarray":
+        """Returns the volume-weighted average unit price of every candle.
+
+        Returns:
+            numpy.ndarray: The total price of the lots divided by the number of items, as float64.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.turnover / self.volume
+
+    def merge(self, other: "Candles") -> "Candles":
+        """Combines the candles with candles of other sales of the same item.
+
+        Candles with the same start are joined: the open and close come from the earliest and the
+        latest sale, the other values are combined. The sales of both sides must be distinct.
+
+        Args:
+            other (Candles): The candles to add, with the same interval.
+
+        Returns:
+            Candles: The combined candles.
+
+        Raises:
+            ValueError: If the intervals of the candles differ.
+        """
+        if self.interval != other.interval:
+            raise ValueError("Only candles with the same interval can be merged.")
+        columns = {
+            column: np.concatenate([getattr(self, column), getattr(other, column)])
+            for column in self.__slots__[1:]
+        }
+        start = columns["start"]
+        by_first = np.lexsort((columns["first_time"], start))
+        by_last = np.lexsort((columns["last_time"], start))
+        starts = _group_starts(start[by_first])
+        ends = np.r_[starts[1:], len(start)] - 1
+        if not len(starts):
+            return self
+
+        def combine(ufunc: "np.ufunc", column: str) -> "np.ndarray":
+            return ufunc.reduceat(columns[column][by_first], starts)
+
+        return type(self)(
+            self.interval,
+            start=start[by_first][starts],
+            open=columns["open"][by_first][starts],
+            high=combine(np.maximum, "high"),
+            low=combine(np.minimum, "low"),
+            close=columns["close"][by_last][ends],
+            volume=combine(np.add, "volume"),
+            turnover=combine(np.add, "turnover"),
+            count=combine(np.add, "count"),
+            first_time=columns["first_time"][by_first][starts],
+            last_time=columns["last_time"][by_last][ends],
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(candles={len(self)}, interval={self.interval})"
+
+
+class CandleBuilder:
+    """Keeps the candles of many items up to date as new sales stream in.
+
+    .. code-block:: python
+
+        builder = CandleBuilder(interval=timedelta(minutes=15))
+        watermarks = HistoryWatermarks()
+        while True:
+            for item_id in catalog:
+                new_lots = api.auction(region="EU").sync_history(item_id=item_id, watermarks=watermarks)
+                builder.update(item_id, new_lots)
+            print(builder["1kv2"].vwap[-1])
+
+    Attributes:
+        interval (numpy.timedelta64): The length of every candle.
+    """
+
+    __slots__ = ("interval", "_candles")
+
+    def __init__(self, interval: Any) -> None:
+        """Initializes the builder.
+
+        Args:
+            interval (Any): The length of every candle, as seconds, a timedelta or a timedelta64.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the interval is not positive.
+        """
+        require_numpy("Market analytics")
+        self.interval = _interval(interval)
+        self._candles: dict[Hashable, Candles] = {}
+
+    def update(self, key: Hashable, lots: "PriceHistory | Iterable[AuctionRedeemedLot]") -> Candles:
+        """Adds new sales of an item to its candles.
+
+        Args:
+            key (Hashable): The key of the item, e.g. its identifier or a (region, item) pair.
+            lots (PriceHistory | Iterable[AuctionRedeemedLot]): The sales not added before.
+
+        Returns:
+            Candles: All candles of the item.
+        """
+        if isinstance(lots, PriceHistory):
+            candles = Candles.from_history(lots, self.interval)
+        else:
+            candles = Candles.from_lots(lots, self.interval)
+        current = self._candles.get(key)
+        if current is not None:
+            candles = current.merge(candles)
+        self._candles[key] = candles
+        return candles
+
+    def keys(self) -> list[Hashable]:
+        """Returns the keys of the items with candles."""
+        return list(self._candles)
+
+    def __getitem__(self, key: Hashable) -> Candles:
+        return self._candles[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._candles
+
+    def __len__(self) -> int:
+        return len(self._candles)
@@ -1,9 +1,29 @@
 from typing import Any, Collection
 
-from .http import APISession, Server
-from .methods import MethodsGroupFabric
-from .token import Token, TokenType
-from .exceptions import MissingTokenError
+from .cache import CacheBackend
+from .http import APISession, AsyncAPISession, Server
+from .metrics import MetricsExporter
+from .methods import AsyncMethodsGroupFabric, MethodsGroupFabric
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import RequestScheduler
+from .token import Token, TokenPool, TokenType
+from .transport import Transport
+from .exceptions import InvalidMethodGroup, MissingTokenError
+
+
+class _MethodGroupAttribute:
+    """Resolves a method group of an `API` object with a single dictionary lookup."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, api: "API | None", owner: type) -> Any:
+        if api is None:
+            return self
+        return api._fabrics[self.name]
 
 
 class API:
@@ -13,29 +33,82 @@ class API:
     tokens and send HTTP requests to various API endpoints using the appropriate method groups.
     """
 
-    __slots__ = ("_http", "_tokens")
-
-    def __init__(self, tokens: Token | Collection[Token], server: Server) -> None:
+    __slots__ = ("_http", "_tokens", "_fabrics")
+
+    _session_class = APISession
+    _fabric_class = MethodsGroupFabric
+
+    def __init__(
+        self,
+        tokens: Token | Collection[Token] | TokenPool,
+        server: Server,
+        cache: CacheBackend | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        coalesce: bool = False,
+        fast_parsing: bool = False,
+        metrics: MetricsExporter | None = None,
+        base_url: str | None = None,
+        transport: Transport | None = None,
+        scheduler: RequestScheduler | None = None,
+    ) -> None:
         """Initializes the API object with the provided tokens and server.
 
         Args:
-            tokens (Token | Collection[Token]): A single token or a collection of tokens to be used for authentication.
+            tokens (Token | Collection[Token] | TokenPool): A single token, a collection of tokens or a token pool
+                to be used for authentication. Several tokens of the same type are used in turn.
             server (Server): The server instance representing the target API server.
+            cache (CacheBackend | None): An optional cache of API responses. Disabled by default.
+                Calls answered from the same cached response share the model instances they return,
+                which should therefore not be mutated.
+            rate_limiter (RateLimiter | None): An optional limiter pacing requests to the API quota.
+                Disabled by default.
+            retry (RetryPolicy | None): An optional policy for retrying failed requests. Disabled by default.
+            coalesce (bool): Whether identical API calls made at the same time share one request and
+                one parsed result. Disabled by default.
+            fast_parsing (bool): Whether response bodies are validated into the models in one pass over
+                the raw bytes, decoded with `orjson` if it is installed. The resulting objects are the same
+                as with the default parsing, which wraps every decoded object separately. Disabled by default.
+            metrics (MetricsExporter | None): An optional exporter receiving the latency, size, parsing time,
+                status code, retry and cache measurements of every call, per endpoint. Disabled by default.
+            base_url (str | None): An optional URL to send the requests to instead of the one of `server`,
+                e.g. the URL of a `MockAPIServer` or of a proxy.
+            transport (Transport | None): Optional connection pooling, timeout, keep-alive and compression
+                settings, including the default deadline of every call. Defaults to `Transport()`.
+            scheduler (RequestScheduler | None): An optional scheduler sending the requests in the order of
+                their `priority` argument within the rate quota, instead of `rate_limiter`. Share one
+                scheduler between the API objects of a process. Disabled by default.
         """
-        self._http = APISession(server)
         self._tokens = self._unpack(tokens)
-
-    def _unpack(self, tokens) -> dict[TokenType, str]:
-        stored = {}
-        tokens = [tokens] if isinstance(tokens, Token) else tokens
-        for token in tokens:
-            stored[token.type] = token.value
-
-        return stored
+        self._http = self._session_class(
+            server,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            coalesce=coalesce,
+            fast_parsing=fast_parsing,
+            metrics=metrics,
+            base_url=base_url,
+            transport=transport,
+            scheduler=scheduler,
+            tokens=self._tokens,
+        )
+        self._http.response_hooks.append(self._tokens.observe)
+        self._fabrics = {
+            group: self._fabric_class(group=group, tokens=self._tokens, http=self._http)
+            for group in self._fabric_class._method_groups
+        }
+
+    def _unpack(self, tokens) -> TokenPool:
+        if isinstance(tokens, TokenPool):
+            return tokens
+        return TokenPool(tokens)
 
     def get_token(self, type: TokenType) -> str:
         """Retrieves a token of the specified type from the stored tokens.
 
+        If several tokens of the type are stored, the one the next request would be sent with is returned.
+
         Args:
             type (TokenType): The type of the token to retrieve.
 
@@ -46,24 +119,62 @@ class API:
             MissingTokenError: If no token of the specified type is found.
         """
         try:
-            return self.__api_tokens[type]
+            return self._tokens[type]
         except KeyError:
             raise MissingTokenError(type=type)
 
-    def __getattribute__(self, name: str) -> Any:
-        """Intercepts attribute access and returns the appropriate method group for API interaction.
+    def __getattr__(self, name: str) -> Any:
+        """Returns the method group factory for API interaction.
 
-        This method is triggered whenever an attribute is accessed on the `API` object. If the requested attribute
-        is not found on the object itself, the method dynamically creates and returns an instance of `MethodsGroupFabric`,
-        which is responsible for generating method groups for API endpoints.
+        Known method groups are resolved by class attributes, and their `MethodsGroupFabric` is created
+        once per `API` object. This method is only triggered for other names, which are interpreted as
+        the name of a method group.
 
         Args:
             name (str): The name of the attribute being accessed.
 
         Returns:
-            MethodsGroupFabric: An instance of the appropriate method group factory, allowing access to various API endpoints.
+            MethodsGroupFabric: The method group factory, allowing access to various API endpoints.
+
+        Raises:
+            InvalidMethodGroup: If there is no method group with the name.
         """
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            return MethodsGroupFabric(group=name, tokens=self._tokens, http=self._http)
+            return self._fabrics[name]
+        except KeyError:
+            raise InvalidMethodGroup(group=name) from None
+
+
+class AsyncAPI(API):
+    """Asynchronous API Object Class for interacting with the STALCRAFT: X API.
+
+    The class provides the same interface as `API`, but every API method returns a coroutine.
+    Requests are sent through a pooled `aiohttp` session, while the method groups, token handling
+    and data models are shared with the synchronous client, so both clients return identical results.
+
+    .. code-block:: python
+
+        async with AsyncAPI(tokens=app_token, server=Server.DEMO) as api:
+            lots = await api.auction(region="EU").get_item_lots(item_id="1kv2")
+    """
+
+    __slots__ = ()
+
+    _session_class = AsyncAPISession
+    _fabric_class = AsyncMethodsGroupFabric
+
+    async def close(self) -> None:
+        """Closes the connection pool of the underlying HTTP session."""
+        await self._http.close()
+
+    async def __aenter__(self) -> "AsyncAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+for _group in MethodsGroupFabric._method_groups:
+    setattr(API, _group, _MethodGroupAttribute(_group))
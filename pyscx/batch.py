@@ -0,0 +1,144 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+
+DEFAULT_MAX_WORKERS = 8
+"""The default number of requests of a batch running at the same time."""
+
+
+class BatchItem:
+    """The outcome of a single request of a batch.
+
+    Attributes:
+        key (Hashable): The name or identifier the request was made for.
+        value (Any): The result of the request, or None if it failed.
+        error (Exception | None): The exception raised by the request, if it failed.
+    """
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(self, key: Hashable, value: Any = None, error: Exception | None = None) -> None:
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the request succeeded.
+
+        Returns:
+            bool: True if the request did not raise an exception.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"{type(self).__name__}(key={self.key!r}, {outcome})"
+
+
+class BatchResult(list):
+    """The outcomes of all requests of a batch.
+
+    The result is a list of `BatchItem` objects, either in the order of the input keys or in the
+    order the requests completed. Failed requests do not abort the batch: their exceptions are
+    collected in the corresponding items.
+    """
+
+    @property
+    def values(self) -> dict[Hashable, Any]:
+        """Returns the results of the successful requests.
+
+        Returns:
+            dict[Hashable, Any]: The results, keyed by the names or identifiers of the requests.
+        """
+        return {item.key: item.value for item in self if item.ok}
+
+    @property
+    def errors(self) -> dict[Hashable, Exception]:
+        """Returns the exceptions of the failed requests.
+
+        Returns:
+            dict[Hashable, Exception]: The exceptions, keyed by the names or identifiers of the requests.
+        """
+        return {item.key: item.error for item in self if not item.ok}
+
+    def merged(self) -> list[tuple[Hashable, Any]]:
+        """Returns the results of the successful requests merged into one list, tagged with their keys.
+
+        Results that are lists are flattened, so every element becomes a separate entry.
+
+        Returns:
+            list[tuple[Hashable, Any]]: Pairs of the name or identifier of the request and a result.
+        """
+        return [
+            (item.key, value)
+            for item in self
+            if item.ok
+            for value in (item.value if isinstance(item.value, list) else [item.value])
+        ]
+
+
+def _call(func: Callable[[Hashable], Any], key: Hashable) -> BatchItem:
+    try:
+        return BatchItem(key, value=func(key))
+    except Exception as error:
+        return BatchItem(key, error=error)
+
+
+def run_batch(
+    func: Callable[[Hashable], Any],
+    keys: Iterable[Hashable],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+) -> BatchResult:
+    """Calls the function for every key on a bounded thread pool.
+
+    Args:
+        func (Callable[[Hashable], Any]): The function making a single request.
+        keys (Iterable[Hashable]): The names or identifiers to make the requests for.
+        max_workers (int): The maximum number of requests running at the same time.
+        ordered (bool): Whether to return the items in the order of the keys,
+            rather than in the order the requests completed.
+
+    Returns:
+        BatchResult: The outcomes of all requests.
+    """
+    keys = list(keys)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys) or 1))) as executor:
+        futures = [executor.submit(_call, func, key) for key in keys]
+        completed = futures if ordered else as_completed(futures)
+        return BatchResult(future.result() for future in completed)
+
+
+async def run_batch_async(
+    func: Callable[[Hashable], Awaitable[Any]],
+    keys: Iterable[Hashable],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+) -> BatchResult:
+    """Awaits the coroutine function for every key, with bounded concurrency.
+
+    Args:
+        func (Callable[[Hashable], Awaitable[Any]]): The coroutine function making a single request.
+        keys (Iterable[Hashable]): The names or identifiers to make the requests for.
+        max_workers (int): The maximum number of requests running at the same time.
+        ordered (bool): Whether to return the items in the order of the keys,
+            rather than in the order the requests completed.
+
+    Returns:
+        BatchResult: The outcomes of all requests.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def call(key: Hashable) -> BatchItem:
+        async with semaphore:
+            try:
+                return BatchItem(key, value=await func(key))
+            except Exception as error:
+                return BatchItem(key, error=error)
+
+    tasks = [asyncio.ensure_future(call(key)) for key in keys]
+    if ordered:
+        return BatchResult(await asyncio.gather(*tasks))
+    return BatchResult([await task for task in asyncio.as_completed(tasks)])
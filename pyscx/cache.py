@@ -0,0 +1,527 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Hashable, Iterable, Mapping
+
+from cachetools import LRUCache, TLRUCache
+
+from .http import BufferedResponse, endpoint_template
+from .token import Token, TokenType
+
+
+DEFAULT_TTL = {
+    "regions": 24 * 60 * 60,
+    "{region}/emission": 60,
+    "{region}/friends/{character}": 60,
+    "{region}/auction/{item}/history": 60,
+    "{region}/auction/{item}/lots": 15,
+    "{region}/characters": 60,
+    "{region}/character/by-name/{character}/profile": 5 * 60,
+    "{region}/clan/{clan-id}/info": 10 * 60,
+    "{region}/clan/{clan-id}/members": 5 * 60,
+    "{region}/clans": 10 * 60,
+}
+"""Default time-to-live of cached responses (in seconds), per endpoint template."""
+
+USER_SCOPED_ENDPOINTS = frozenset(
+    {
+        "{region}/characters",
+        "{region}/friends/{character}",
+        "{region}/clan/{clan-id}/members",
+    }
+)
+"""Templates of the endpoints answering with data of the user the token belongs to, cached per token."""
+
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+_EVICTION_BATCH = 64
+
+
+class CacheStats:
+    """Snapshot of the response cache counters.
+
+    Attributes:
+        hits (int): Number of requests served from the cache.
+        misses (int): Number of requests that had to be sent to the server.
+        evictions (int): Number of live entries dropped because the cache was full.
+        expirations (int): Number of entries dropped because their TTL ran out.
+        revalidations (int): Number of stale entries confirmed by the server with `304 Not Modified`.
+        size (int): Number of entries currently stored in the cache.
+    """
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "revalidations", "size")
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        evictions: int = 0,
+        expirations: int = 0,
+        revalidations: int = 0,
+        size: int = 0,
+    ) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.revalidations = revalidations
+        self.size = size
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the share of requests served from the cache.
+
+        Returns:
+            float: The ratio of hits to all lookups, or 0.0 if there were no lookups.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class _CountingTLRUCache(TLRUCache):
+    """`TLRUCache` that reports evicted and expired entries to the owning cache."""
+
+    def __init__(self, owner: "ResponseCache", maxsize: int, ttu) -> None:
+        super().__init__(maxsize=maxsize, ttu=ttu)
+        self._owner = owner
+
+    def popitem(self):
+        item = super().popitem()
+        self._owner._stats.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self._owner._stats.expirations += len(expired)
+        return expired
+
+
+class CacheBackend:
+    """Base class of the API response caches.
+
+    A cache backend decides how long the responses of every endpoint stay fresh, and is consulted
+    by the session before and after each request. Backends keeping stale entries may also provide
+    conditional request validators, so that unchanged data is confirmed with `304 Not Modified`
+    instead of being downloaded again.
+    """
+
+    def __init__(
+        self,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = 60,
+        per_token: Iterable[str] = USER_SCOPED_ENDPOINTS,
+    ) -> None:
+        """Initializes the cache backend.
+
+        Args:
+            ttl (Mapping[str, float] | None): Time-to-live overrides (in seconds), keyed by endpoint template.
+                A value of 0 disables caching of the endpoint.
+            default_ttl (float): Time-to-live of endpoints missing from both `ttl` and `DEFAULT_TTL`.
+            per_token (Iterable[str]): Templates of the endpoints whose responses are cached per token
+                rather than per token type.
+        """
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.default_ttl = default_ttl
+        self.per_token = frozenset(per_token)
+
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> float:
+        """Returns the time-to-live of responses of the resource.
+
+        Args:
+            url (str): The path of the API resource, relative to the server URL.
+
+        Returns:
+            float: The time-to-live in seconds.
+        """
+        return self.ttl.get(endpoint_template(url), self.default_ttl)
+
+    def is_per_token(self, endpoint: str) -> bool:
+        """Returns whether the responses of the endpoint are cached per token rather than per token type.
+
+        Args:
+            endpoint (str): The endpoint template.
+
+        Returns:
+            bool: True if the endpoint is one of `per_token`.
+        """
+        return endpoint in self.per_token
+
+    def _key_ttl(self, key: tuple) -> float:
+        """Returns the time-to-live of the response stored under the key, using the endpoint template in it."""
+        return self.ttl.get(key[-1], self.default_ttl)
+
+    def make_key(
+        self,
+        server: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        endpoint: str | None = None,
+        token: Token | TokenType | str | None = None,
+    ) -> tuple[Hashable, ...]:
+        """Builds the cache key of a request.
+
+        Requests authorized by a token type or by a `Token` are keyed by the type of the token, so all
+        tokens of a type share the cached responses, however many of them a `TokenPool` holds. Requests
+        to the `per_token` endpoints, or authorized by a bare token value or by the headers alone, are
+        keyed by a digest of the token.
+
+        Args:
+            server (str): The base URL of the API server.
+            url (str): The path of the API resource, relative to the server URL.
+            params (Mapping[str, Any] | None): Query parameters of the request.
+            headers (Mapping[str, str] | None): Headers of the request.
+            endpoint (str | None): The endpoint template of the resource. Resolved from `url` if not given.
+            token (Token | TokenType | str | None): The token the request is authorized with, or its type.
+
+        Returns:
+            tuple[Hashable, ...]: The cache key.
+        """
+        endpoint = endpoint or endpoint_template(url)
+        query = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        if isinstance(token, Token) and not self.is_per_token(endpoint):
+            token = token.type
+        if isinstance(token, TokenType):
+            credential = token.value
+        else:
+            if isinstance(token, Token):
+                token = token.value
+            authorization = f"Bearer {token}" if token else (headers or {}).get("Authorization")
+            credential = hashlib.sha256(authorization.encode()).hexdigest() if authorization else None
+        return (server, url.strip("/"), query, credential, endpoint)
+
+    def get(self, key: tuple) -> Any | None:
+        """Looks up a fresh cached response.
+
+        Args:
+            key (tuple): The cache key built by `make_key`.
+
+        Returns:
+            Any | None: The cached response, or None on a miss.
+        """
+        raise NotImplementedError
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Stores a successful response in the cache.
+
+        Args:
+            key (tuple): The cache key built by `make_key`.
+            value (Any): The response to store.
+        """
+        raise NotImplementedError
+
+    def validators(self, key: tuple) -> dict[str, str]:
+        """Returns conditional request headers for a stale entry.
+
+        Args:
+            key (tuple): The cache key built by `make_key`.
+
+        Returns:
+            dict[str, str]: `If-None-Match`/`If-Modified-Since` headers, or an empty dict.
+        """
+        return {}
+
+    def revalidate(self, key: tuple, response: Any) -> Any | None:
+        """Handles a `304 Not Modified` answer to a conditional request.
+
+        Args:
+            key (tuple): The cache key built by `make_key`.
+            response (Any): The `304` response of the server.
+
+        Returns:
+            Any | None: The stored response, refreshed, or None if the entry no longer exists.
+        """
+        return None
+
+    def clear(self) -> None:
+        """Removes all entries from the cache. The counters are kept."""
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: The current hit, miss, eviction and expiration counters.
+        """
+        size = self._size()
+        with self._lock:
+            s = self._stats
+            return CacheStats(s.hits, s.misses, s.evictions, s.expirations, s.revalidations, size)
+
+
+class ResponseCache(CacheBackend):
+    """In-memory TTL cache for successful API responses.
+
+    Entries are keyed on the server, the resource path, the query parameters and the access token,
+    so responses fetched with one user's token are never served to another one. Each endpoint has
+    its own time-to-live (see `DEFAULT_TTL`), and once `maxsize` is reached the least recently used
+    entries are evicted. The cache is thread-safe and may be shared between several API objects.
+
+    .. code-block:: python
+
+        cache = ResponseCache(ttl={"{region}/auction/{item}/lots": 5}, maxsize=10_000)
+        api = API(tokens=app_token, server=Server.PRODUCTION, cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = 60,
+        maxsize: int = 1024,
+        per_token: Iterable[str] = USER_SCOPED_ENDPOINTS,
+    ) -> None:
+        """Initializes the response cache.
+
+        Args:
+            ttl (Mapping[str, float] | None): Time-to-live overrides (in seconds), keyed by endpoint template.
+                A value of 0 disables caching of the endpoint.
+            default_ttl (float): Time-to-live of endpoints missing from both `ttl` and `DEFAULT_TTL`.
+            maxsize (int): The maximum number of cached responses.
+            per_token (Iterable[str]): Templates of the endpoints whose responses are cached per token
+                rather than per token type.
+        """
+        super().__init__(ttl, default_ttl, per_token)
+        self.maxsize = maxsize
+        self._entries = _CountingTLRUCache(self, maxsize, ttu=self._expires_at)
+
+    def _expires_at(self, key: tuple, value: Any, now: float) -> float:
+        return now + self._key_ttl(key)
+
+    def get(self, key: tuple) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+            return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        if self._key_ttl(key) <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = _CountingTLRUCache(self, self.maxsize, ttu=self._expires_at)
+
+    def _size(self) -> int:
+        with self._lock:
+            self._entries.expire()
+            return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """Persistent SQLite-backed cache for API responses with conditional revalidation.
+
+    Response bodies are stored on disk together with their validators (`ETag`, `Last-Modified`,
+    `Date`), so they survive restarts of the process. Fresh entries are served straight from disk.
+    Stale entries are revalidated with a conditional GET: a `304 Not Modified` answer skips the body
+    download, and, for entries recently used by the process, the parsing of the body into models as
+    well. Models built from a reused response are shared between callers and should not be mutated,
+    while every caller gets its own list of them.
+
+    Once the stored bodies exceed `max_bytes`, the least recently used entries are evicted.
+
+    .. code-block:: python
+
+        cache = DiskCache("~/.cache/pyscx.sqlite3", max_bytes=512 * 1024**2)
+        api = API(tokens=app_token, server=Server.PRODUCTION, cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = 60,
+        max_bytes: int = 256 * 1024**2,
+        memory_entries: int = 256,
+        per_token: Iterable[str] = USER_SCOPED_ENDPOINTS,
+    ) -> None:
+        """Initializes the disk cache, creating the database file if needed.
+
+        Args:
+            path (str | os.PathLike): The path of the SQLite database file.
+            ttl (Mapping[str, float] | None): Time-to-live overrides (in seconds), keyed by endpoint template.
+                A value of 0 disables caching of the endpoint.
+            default_ttl (float): Time-to-live of endpoints missing from both `ttl` and `DEFAULT_TTL`.
+            max_bytes (int): The maximum total size of the stored response bodies.
+            memory_entries (int): The number of recently used responses (and their models) kept in memory.
+            per_token (Iterable[str]): Templates of the endpoints whose responses are cached per token
+                rather than per token type.
+        """
+        super().__init__(ttl, default_ttl, per_token)
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_bytes = max_bytes
+
+        self._recent = LRUCache(maxsize=memory_entries)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            """
+        )
+        # The total size of the stored bodies, kept up to date on every write rather than summed on every `set`.
+        self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _encode_key(key: tuple) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def _restore(self, key: str, row: tuple) -> BufferedResponse:
+        url, status, headers, body, stored_at, expires_at = row
+        response = BufferedResponse(url, status, json.loads(headers), body, reusable=True)
+        self._recent[key] = (stored_at, expires_at, response)
+        return response
+
+    def get(self, key: tuple) -> Any | None:
+        encoded, now = self._encode_key(key), time.time()
+        with self._lock:
+            recent = self._recent.get(encoded)
+            if recent is not None and recent[1] > now:
+                self._stats.hits += 1
+                return recent[2]
+
+            row = self._db.execute(
+                "SELECT url, status, headers, body, stored_at, expires_at FROM responses"
+                " WHERE key = ? AND expires_at > ?",
+                (encoded, now),
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            self._stats.hits += 1
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, encoded))
+            if recent is not None and recent[0] == row[4]:
+                self._recent[encoded] = (row[4], row[5], recent[2])
+                return recent[2]
+            return self._restore(encoded, row)
+
+    def set(self, key: tuple, value: Any) -> None:
+        ttl = self._key_ttl(key)
+        if ttl <= 0:
+            return
+
+        encoded, now, body = self._encode_key(key), time.time(), value.content
+        headers = {name: value.headers[name] for name in _STORED_HEADERS if name in value.headers}
+        with self._lock:
+            replaced = self._db.execute("SELECT size FROM responses WHERE key = ?", (encoded,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    encoded,
+                    value.url,
+                    value.status_code,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified") or headers.get("Date"),
+                    now,
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._bytes += len(body) - (replaced[0] if replaced is not None else 0)
+            self._recent.pop(encoded, None)
+            self._evict()
+
+    def validators(self, key: tuple) -> dict[str, str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified FROM responses WHERE key = ?", (self._encode_key(key),)
+            ).fetchone()
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        validators = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def revalidate(self, key: tuple, response: Any) -> Any | None:
+        encoded, now = self._encode_key(key), time.time()
+        with self._lock:
+            updated = self._db.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ?,"
+                " etag = COALESCE(?, etag) WHERE key = ?",
+                (now + self._key_ttl(key), now, response.headers.get("ETag"), encoded),
+            )
+            if not updated.rowcount:
+                return None
+
+            self._stats.revalidations += 1
+            row = self._db.execute(
+                "SELECT url, status, headers, body, stored_at, expires_at FROM responses WHERE key = ?",
+                (encoded,),
+            ).fetchone()
+            recent = self._recent.get(encoded)
+            if recent is not None and recent[0] == row[4]:
+                self._recent[encoded] = (row[4], row[5], recent[2])
+                return recent[2]
+            return self._restore(encoded, row)
+
+    def _evict(self) -> None:
+        """Deletes the least recently used responses, a few at a time, until the cache fits in `max_bytes`."""
+        while self._bytes > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT ?", (_EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                return
+            for key, size in rows:
+                if self._bytes <= self.max_bytes:
+                    return
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._recent.pop(key, None)
+                self._stats.evictions += 1
+                self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._recent.clear()
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def _size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def require_numpy(feature: str = "Columnar data") -> None:
+    """Ensures that the optional `numpy` dependency is installed.
+
+    Args:
+        feature (str): The feature needing `numpy`, named in the error message.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    if np is None:
+        raise ImportError(f"{feature} requires 'numpy'. Install it with `pip install pyscx[numpy]`.")
+
+
+def naive_utc(value: str) -> str:
+    """Converts an ISO 8601 timestamp into a naive UTC one, the only form parsed by `numpy.datetime64`.
+
+    Args:
+        value (str): The timestamp, as returned by the API.
+
+    Returns:
+        str: The same moment in UTC, without a timezone.
+    """
+    if value.endswith("Z"):
+        return value[:-1]
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat()
@@ -0,0 +1,512 @@
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .methods import MAX_PAGE_LIMIT
+from .scheduler import BATCH
+from .storage import SnapshotStore
+from .token import TokenType
+
+if TYPE_CHECKING:
+    from .api import API
+
+
+CLANS = "clans"
+"""The stage listing the clans of every region, page by page."""
+MEMBERS = "members"
+"""The stage fetching the members of every clan."""
+PROFILES = "profiles"
+"""The stage fetching the profile of every clan member."""
+
+STAGES = (CLANS, MEMBERS, PROFILES)
+"""The stages of a crawl, in pipeline order."""
+
+DEFAULT_WORKERS = {CLANS: 1, MEMBERS: 4, PROFILES: 8}
+"""The default number of worker threads per stage."""
+
+PENDING, DONE, FAILED = 0, 1, 2
+
+Task = tuple[str, str, str]
+"""A unit of crawl work, as `(stage, region, key)`: a page offset, a clan identifier or a character name."""
+
+
+class CrawlCheckpoint:
+    """Persistent SQLite record of the tasks of a crawl and of their state.
+
+    A task is marked as done in the same transaction that records the tasks it discovered, so
+    the checkpoint always holds every task still to be done, whenever the crawl is interrupted.
+
+    .. code-block:: python
+
+        checkpoint = CrawlCheckpoint("~/scx/crawl.sqlite3")
+        print(checkpoint.counts())  # {"clans": {"done": 3, ...}, "members": {...}, ...}
+        checkpoint.clear()  # Starts the next crawl from scratch.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Initializes the checkpoint, creating the database file if needed.
+
+        Args:
+            path (str | os.PathLike): The path of the SQLite database file, or `":memory:"`.
+        """
+        self.path = path if path == ":memory:" else os.path.expanduser(os.fspath(path))
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS tasks (
+                stage TEXT NOT NULL,
+                region TEXT NOT NULL,
+                key TEXT NOT NULL,
+                state INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                UNIQUE (stage, region, key)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state);
+            """
+        )
+
+    def add(self, tasks: Iterable[Task]) -> list[Task]:
+        """Records new pending tasks in one transaction, ignoring the tasks already recorded.
+
+        Args:
+            tasks (Iterable[Task]): The tasks to record.
+
+        Returns:
+            list[Task]: The tasks that were not recorded yet.
+        """
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                added = self._insert(tasks)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return added
+
+    def complete(self, task: Task, children: Iterable[Task] = ()) -> list[Task]:
+        """Marks a task as done and records the tasks it discovered, in one transaction.
+
+        Args:
+            task (Task): The completed task.
+            children (Iterable[Task]): The tasks discovered by the completed one.
+
+        Returns:
+            list[Task]: The discovered tasks that were not recorded yet.
+        """
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                added = self._insert(children)
+                self._db.execute(
+                    "UPDATE tasks SET state = ?, error = NULL WHERE stage = ? AND region = ? AND key = ?",
+                    (DONE, *task),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return added
+
+    def fail(self, task: Task, error: BaseException | str) -> None:
+        """Marks a task as failed, keeping the error for inspection.
+
+        Args:
+            task (Task): The failed task.
+            error (BaseException | str): The error the task failed with.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE tasks SET state = ?, error = ? WHERE stage = ? AND region = ? AND key = ?",
+                (FAILED, repr(error) if isinstance(error, BaseException) else error, *task),
+            )
+
+    def _insert(self, tasks: Iterable[Task]) -> list[Task]:
+        added = []
+        for task in tasks:
+            cursor = self._db.execute("INSERT OR IGNORE INTO tasks (stage, region, key) VALUES (?, ?, ?)", task)
+            if cursor.rowcount:
+                added.append(task)
+        return added
+
+    def horizon(self) -> int:
+        """Returns the position of the last recorded task, tasks recorded later have a higher position."""
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(MAX(rowid), 0) FROM tasks").fetchone()[0]
+
+    def pending(self, after: int = 0, until: int | None = None, limit: int = 1000) -> list[tuple[int, Task]]:
+        """Returns pending tasks in the order they were recorded.
+
+        Args:
+            after (int): Only tasks recorded after this position are returned.
+            until (int | None): Only tasks recorded up to this position are returned. Defaults to all.
+            limit (int): The maximum number of tasks to return.
+
+        Returns:
+            list[tuple[int, Task]]: The positions and the tasks.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT rowid, stage, region, key FROM tasks WHERE state = ? AND rowid > ? AND rowid <= ? "
+                "ORDER BY rowid LIMIT ?",
+                (PENDING, after, until if until is not None else sys.maxsize, limit),
+            ).fetchall()
+        return [(rowid, (stage, region, key)) for rowid, stage, region, key in rows]
+
+    def failures(self, stage: str | None = None) -> dict[Task, str]:
+        """Returns the failed tasks and their errors.
+
+        Args:
+            stage (str | None): The stage to return the failures of. Defaults to all stages.
+
+        Returns:
+            dict[Task, str]: The errors of the failed tasks.
+        """
+        sql = "SELECT stage, region, key, error FROM tasks WHERE state = ?"
+        args: tuple = (FAILED,)
+        if stage is not None:
+            sql, args = sql + " AND stage = ?", (FAILED, stage)
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return {(stage, region, key): error for stage, region, key, error in rows}
+
+    def retry_failed(self) -> int:
+        """Makes the failed tasks pending again, so the next run retries them.
+
+        Returns:
+            int: The number of tasks to be retried.
+        """
+        with self._lock:
+            return self._db.execute(
+                "UPDATE tasks SET state = ?, error = NULL WHERE state = ?", (PENDING, FAILED)
+            ).rowcount
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """Returns the number of pending, done and failed tasks per stage."""
+        names = {PENDING: "pending", DONE: "done", FAILED: "failed"}
+        counts = {stage: dict.fromkeys(names.values(), 0) for stage in STAGES}
+        with self._lock:
+            rows = self._db.execute("SELECT stage, state, COUNT(*) FROM tasks GROUP BY stage, state").fetchall()
+        for stage, state, count in rows:
+            counts.setdefault(stage, dict.fromkeys(names.values(), 0))[names[state]] = count
+        return counts
+
+    def clear(self) -> None:
+        """Forgets every task, so the next crawl starts from scratch."""
+        with self._lock:
+            self._db.execute("DELETE FROM tasks")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "CrawlCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StageStats:
+    """The progress of a crawl stage.
+
+    Attributes:
+        name (str): The name of the stage.
+        workers (int): The number of worker threads of the stage.
+        processed (int): The number of completed tasks.
+        failed (int): The number of failed tasks.
+        produced (int): The number of objects fetched.
+        busy (int): The number of tasks being processed right now.
+        backlog (int): The number of tasks waiting in the queue of the stage.
+        elapsed (float): The number of seconds since the crawl started.
+    """
+
+    __slots__ = ("name", "workers", "processed", "failed", "produced", "busy", "backlog", "elapsed")
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        processed: int = 0,
+        failed: int = 0,
+        produced: int = 0,
+        busy: int = 0,
+        backlog: int = 0,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.workers = workers
+        self.processed = processed
+        self.failed = failed
+        self.produced = produced
+        self.busy = busy
+        self.backlog = backlog
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of tasks completed per second since the crawl started."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, processed={self.processed}, failed={self.failed}, "
+            f"produced={self.produced}, busy={self.busy}, backlog={self.backlog}, "
+            f"throughput={self.throughput:.1f}/s)"
+        )
+
+
+class Crawler:
+    """A streaming crawl of every clan, clan member and member profile of the server.
+
+    The crawl runs as a pipeline of three stages: `clans` lists the clans of every region page by page,
+    `members` fetches the members of every clan and `profiles` fetches the profile of every member.
+    Every stage runs on its own worker threads and feeds the next one through a bounded queue, so
+    profiles are fetched while clans are still being listed and a slow stage holds back the stages
+    before it instead of piling up work in memory.
+
+    Every completed task is recorded in a `CrawlCheckpoint` together with the tasks it discovered.
+    If the crawl is interrupted, running it again with the same checkpoint file resumes it where it
+    stopped: done tasks are skipped and only the pending ones are fetched.
+
+    The fetched objects are passed to `on_result` and, if a `store` is given, stored in it before
+    the task is marked as done, so no object is lost between two runs.
+
+    .. code-block:: python
+
+        api = API(server=Server.PRODUCTION, tokens=[app_token, user_token], scheduler=RequestScheduler())
+        crawler = Crawler(api, "~/scx/crawl.sqlite3", store=SnapshotStore("~/scx/snapshots.sqlite3"))
+        crawler.run(progress=print, report_interval=60)
+    """
+
+    def __init__(
+        self,
+        api: "API",
+        checkpoint: CrawlCheckpoint | str | os.PathLike,
+        regions: Iterable[str] | None = None,
+        workers: dict[str, int] | None = None,
+        queue_size: int = 1000,
+        store: SnapshotStore | None = None,
+        on_result: Callable[[str, str, Any], None] | None = None,
+        priority: str | None = BATCH,
+    ) -> None:
+        """Initializes the crawler.
+
+        Args:
+            api (API): The client to crawl with. It needs both an application and a user token.
+            checkpoint (CrawlCheckpoint | str | os.PathLike): The checkpoint, or the path of its database file.
+            regions (Iterable[str] | None): The regions to crawl. Defaults to every region of the server.
+            workers (dict[str, int] | None): The number of worker threads per stage, missing stages
+                keep the number from `DEFAULT_WORKERS`.
+            queue_size (int): The maximum number of tasks waiting in the queue of every stage.
+            store (SnapshotStore | None): The store to save the fetched objects in, if any.
+            on_result (Callable[[str, str, Any], None] | None): The function called with the stage,
+                the region and the objects fetched by every task, from the worker threads.
+            priority (str | None): The priority of the crawl requests, for the scheduler of the client.
+
+        Raises:
+            ValueError: If a stage is unknown or has no workers, or if the queue size is not positive.
+        """
+        workers = {**DEFAULT_WORKERS, **(workers or {})}
+        if set(workers) - set(STAGES) or min(workers.values()) < 1:
+            raise ValueError(f"Every stage of {STAGES} needs at least one worker.")
+        if queue_size < 1:
+            raise ValueError("The queue size must be positive.")
+
+        self.api = api
+        self.checkpoint = checkpoint if isinstance(checkpoint, CrawlCheckpoint) else CrawlCheckpoint(checkpoint)
+        self.regions = [region.upper() for region in regions] if regions is not None else None
+        self.workers = workers
+        self.store = store
+        self.on_result = on_result
+        self.priority = priority
+
+        self._queues = {stage: queue.Queue(maxsize=queue_size) for stage in STAGES}
+        self._stats = {stage: StageStats(stage, workers[stage]) for stage in STAGES}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._finished = threading.Event()
+        self._outstanding = 0
+        self._started = 0.0
+
+    def run(
+        self,
+        progress: Callable[[dict[str, StageStats]], None] | None = None,
+        report_interval: float = 10.0,
+    ) -> dict[str, StageStats]:
+        """Runs the crawl until every task is done or `stop` is called.
+
+        Args:
+            progress (Callable[[dict[str, StageStats]], None] | None): The function called with the stats
+                of every stage every `report_interval` seconds while the crawl runs.
+            report_interval (float): The number of seconds between two progress reports.
+
+        Returns:
+            dict[str, StageStats]: The final stats of every stage.
+
+        Raises:
+            MissingTokenError: If the client lacks an application or a user token.
+        """
+        clans = self.api.clans(region=None)
+        clans._check_token(TokenType.APPLICATION, {})
+        clans._check_token(TokenType.USER, {})
+
+        regions = self.regions if self.regions is not None else self.api.clans.region_ids()
+        self.checkpoint.add((CLANS, region, "0") for region in regions)
+        horizon = self.checkpoint.horizon()
+
+        self._stopping.clear()
+        self._finished.clear()
+        self._outstanding = 1
+        self._started = time.monotonic()
+        for stats in self._stats.values():
+            stats.processed = stats.failed = stats.produced = stats.busy = 0
+
+        threads = [
+            threading.Thread(target=self._work, args=(stage,), name=f"crawler-{stage}-{index}", daemon=True)
+            for stage in STAGES
+            for index in range(self.workers[stage])
+        ]
+        threads.append(threading.Thread(target=self._resume, args=(horizon,), name="crawler-resume", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while not self._finished.wait(report_interval if progress is not None else None):
+                progress(self.stats())
+        finally:
+            self._stopping.set()
+            for thread in threads:
+                thread.join()
+            for stage_queue in self._queues.values():
+                while not stage_queue.empty():
+                    stage_queue.get_nowait()
+        return self.stats()
+
+    def stop(self) -> None:
+        """Stops the crawl: running tasks are completed, queued ones stay pending in the checkpoint."""
+        self._stopping.set()
+        self._finished.set()
+
+    def stats(self) -> dict[str, StageStats]:
+        """Returns a snapshot of the progress of every stage."""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        with self._lock:
+            return {
+                stage: StageStats(
+                    stage,
+                    stats.workers,
+                    stats.processed,
+                    stats.failed,
+                    stats.produced,
+                    stats.busy,
+                    self._queues[stage].qsize(),
+                    elapsed,
+                )
+                for stage, stats in self._stats.items()
+            }
+
+    def _resume(self, horizon: int) -> None:
+        """Queues the tasks left pending by previous runs, the tasks found by this run are queued directly."""
+        position = 0
+        try:
+            while not self._stopping.is_set():
+                tasks = self.checkpoint.pending(after=position, until=horizon)
+                if not tasks:
+                    break
+                for position, task in tasks:
+                    self._schedule(task)
+        finally:
+            self._done()
+
+    def _schedule(self, task: Task) -> None:
+        with self._lock:
+            self._outstanding += 1
+        stage_queue = self._queues[task[0]]
+        while not self._stopping.is_set():
+            try:
+                stage_queue.put(task, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _done(self) -> None:
+        with self._lock:
+            self._outstanding -= 1
+            finished = self._outstanding == 0
+        if finished:
+            self._finished.set()
+
+    def _work(self, stage: str) -> None:
+        stage_queue = self._queues[stage]
+        stats = self._stats[stage]
+        while not self._stopping.is_set():
+            try:
+                task = stage_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            with self._lock:
+                stats.busy += 1
+            try:
+                while task is not None and not self._stopping.is_set():
+                    task = self._process(task, stats)
+            finally:
+                with self._lock:
+                    stats.busy -= 1
+                self._done()
+
+    def _process(self, task: Task, stats: StageStats) -> Task | None:
+        """Runs a task, records it and queues the tasks it discovered.
+
+        Returns:
+            Task | None: The next page of a clan listing, which is fetched by the same worker.
+        """
+        stage, region, key = task
+        try:
+            objects, children, next_task = self._fetch(stage, region, key)
+            if self.store is not None:
+                self.store.put(region, objects)
+            if self.on_result is not None:
+                self.on_result(stage, region, objects)
+            added = self.checkpoint.complete(task, children + ([next_task] if next_task else []))
+        except Exception as error:
+            self.checkpoint.fail(task, error)
+            with self._lock:
+                stats.failed += 1
+            return None
+
+        with self._lock:
+            stats.processed += 1
+            stats.produced += len(objects) if isinstance(objects, list) else 1
+        for child in added:
+            if child != next_task:
+                self._schedule(child)
+        return next_task if next_task in added else None
+
+    def _fetch(self, stage: str, region: str, key: str) -> tuple[Any, list[Task], Task | None]:
+        """Fetches the objects of a task.
+
+        Returns:
+            tuple[Any, list[Task], Task | None]: The objects, the tasks of the next stage and the next page.
+        """
+        if stage == CLANS:
+            offset = int(key)
+            clans = self.api.clans(region=region).get_all(
+                offset=offset, limit=MAX_PAGE_LIMIT, priority=self.priority
+            )
+            next_page = (CLANS, region, str(offset + len(clans))) if len(clans) == MAX_PAGE_LIMIT else None
+            return clans, [(MEMBERS, region, clan.id) for clan in clans], next_page
+        if stage == MEMBERS:
+            members = self.api.clans(region=region).get_members(clan_id=key, priority=self.priority)
+            return members, [(PROFILES, region, member.name) for member in members], None
+        profile = self.api.characters(region=region).get_profile(character_name=key, priority=self.priority)
+        return profile, [], None
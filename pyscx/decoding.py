@@ -0,0 +1,90 @@
+import json
+from functools import lru_cache
+from typing import Any, NotRequired, TypedDict
+
+from pydantic import TypeAdapter
+
+from .objects import APIObject
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the fast JSON parser is optional
+    orjson = None
+
+
+def loads(content: bytes | str) -> Any:
+    """Decodes a JSON document, using `orjson` if it is installed.
+
+    Args:
+        content (bytes | str): The raw JSON document.
+
+    Returns:
+        Any: The decoded document.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=None)
+def adapter(
+    model: type[APIObject], many: bool, key: str | None = None, total_key: str | None = None
+) -> TypeAdapter:
+    """Returns a cached type adapter validating a whole response body into the model in one call.
+
+    Args:
+        model (type[APIObject]): The model class of the payload.
+        many (bool): Whether the payload is a list of objects rather than a single object.
+        key (str | None): The key of the response envelope under which the payload is stored.
+        total_key (str | None): The key of the response envelope holding the total number of items.
+
+    Returns:
+        TypeAdapter: The adapter for the payload, or for the envelope if `key` is given.
+    """
+    payload = list[model] if many else model
+    if key is None:
+        return TypeAdapter(payload)
+
+    fields = {key: payload}
+    if total_key is not None:
+        fields[total_key] = NotRequired[int]
+    # Other keys of the envelope are ignored by the validation.
+    return TypeAdapter(TypedDict(f"{model.__name__}Envelope", fields))
+
+
+def decode(
+    content: bytes, model: type[APIObject] | None, key: str | None = None, total_key: str | None = None
+) -> Any:
+    """Decodes a raw response body straight into model instances.
+
+    The body is validated by pydantic in a single pass over the raw bytes, without building an
+    intermediate dictionary for every object first. The models are equal to those built from the
+    decoded JSON, including the parsed dates and nested objects.
+
+    Args:
+        content (bytes): The raw body of the response.
+        model (type[APIObject] | None): The model class of the payload. If None, the body is only decoded.
+            A container class with a `from_records` class method receives the whole list of records.
+        key (str | None): The key of the response envelope under which the payload is stored.
+        total_key (str | None): The key of the response envelope holding the total number of items.
+            If given, the whole envelope is returned rather than the payload.
+
+    Returns:
+        Any: The model instance(s), the envelope holding them, or the decoded payload.
+    """
+    if model is None or not issubclass(model, APIObject):
+        data = loads(content)
+        if key is None:
+            return data if model is None else model.from_records(data)
+        payload = data[key] if model is None else model.from_records(data[key])
+        if total_key is None:
+            return payload
+        data[key] = payload
+        return data
+
+    if key is not None:
+        envelope = adapter(model, True, key, total_key).validate_json(content)
+        return envelope if total_key is not None else envelope[key]
+
+    many = content.lstrip()[:1] == b"["
+    return adapter(model, many).validate_json(content)
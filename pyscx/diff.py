@@ -0,0 +1,263 @@
+import threading
+from typing import Any, Iterable
+
+from cachetools import LRUCache
+
+from .objects import Clan, ClanMember, ClanMemberRank
+
+
+class ChangeEvent:
+    """A base class for the changes detected between two snapshots of clans or clan rosters.
+
+    Attributes:
+        clan_id (str): The unique identifier of the changed clan.
+    """
+
+    __slots__ = ("clan_id",)
+
+    def __init__(self, clan_id: str) -> None:
+        self.clan_id = clan_id
+
+    def _fields(self) -> dict[str, Any]:
+        names = (name for cls in reversed(type(self).__mro__) for name in getattr(cls, "__slots__", ()))
+        return {name: getattr(self, name) for name in names}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._fields().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class MemberJoined(ChangeEvent):
+    """A character joined the clan.
+
+    Attributes:
+        member (ClanMember): The new member.
+    """
+
+    __slots__ = ("member",)
+
+    def __init__(self, clan_id: str, member: ClanMember) -> None:
+        super().__init__(clan_id)
+        self.member = member
+
+
+class MemberLeft(ChangeEvent):
+    """A character left (or was expelled from) the clan.
+
+    Attributes:
+        name (str): The name of the former member.
+        rank (ClanMemberRank): The last known rank of the former member.
+    """
+
+    __slots__ = ("name", "rank")
+
+    def __init__(self, clan_id: str, name: str, rank: ClanMemberRank) -> None:
+        super().__init__(clan_id)
+        self.name = name
+        self.rank = rank
+
+
+class RankChanged(ChangeEvent):
+    """A member of the clan was promoted or demoted.
+
+    Attributes:
+        member (ClanMember): The member, with the new rank.
+        previous_rank (ClanMemberRank): The rank the member had before.
+    """
+
+    __slots__ = ("member", "previous_rank")
+
+    def __init__(self, clan_id: str, member: ClanMember, previous_rank: ClanMemberRank) -> None:
+        super().__init__(clan_id)
+        self.member = member
+        self.previous_rank = previous_rank
+
+
+class ClanAppeared(ChangeEvent):
+    """A clan appeared in the list of clans.
+
+    Attributes:
+        clan (Clan): The new clan.
+    """
+
+    __slots__ = ("clan",)
+
+    def __init__(self, clan: Clan) -> None:
+        super().__init__(clan.id)
+        self.clan = clan
+
+
+class ClanDisappeared(ChangeEvent):
+    """A clan disappeared from the list of clans."""
+
+    __slots__ = ()
+
+
+class LevelChanged(ChangeEvent):
+    """The level of a clan changed.
+
+    Attributes:
+        clan (Clan): The clan, with the new level.
+        previous_level (int): The level the clan had before.
+    """
+
+    __slots__ = ("clan", "previous_level")
+
+    def __init__(self, clan: Clan, previous_level: int) -> None:
+        super().__init__(clan.id)
+        self.clan = clan
+        self.previous_level = previous_level
+
+
+class RosterDiffer:
+    """Detects joins, leaves and rank changes between consecutive rosters of many clans.
+
+    Only a compact state is kept per clan (a content hash and the rank of every member), never the
+    fetched models, and at most `max_clans` clans are remembered; the least recently observed ones
+    are forgotten. An unchanged roster is recognized by its hash, without diffing the members.
+
+    .. code-block:: python
+
+        differ = RosterDiffer()
+        while True:
+            for clan_id in clan_ids:
+                for event in differ.observe(clan_id, api.clans(region="EU").get_members(clan_id=clan_id)):
+                    handle(event)
+
+    Attributes:
+        max_clans (int): The maximum number of remembered clans.
+    """
+
+    def __init__(self, max_clans: int = 10_000) -> None:
+        self.max_clans = max_clans
+
+        self._states: LRUCache = LRUCache(maxsize=max_clans)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(members: Iterable[ClanMember]) -> int:
+        """Returns the content hash of a roster, independent of the order of the members.
+
+        Args:
+            members (Iterable[ClanMember]): The members of the clan.
+
+        Returns:
+            int: The hash of the names and ranks of the members.
+        """
+        return hash(frozenset((member.name, member.rank) for member in members))
+
+    def observe(self, clan_id: str, members: list[ClanMember], initial: bool = False) -> list[ChangeEvent]:
+        """Compares the roster of the clan with the previously observed one.
+
+        Args:
+            clan_id (str): The unique identifier of the clan.
+            members (list[ClanMember]): The current members of the clan.
+            initial (bool): Whether to report every member as joined when the clan is observed
+                for the first time. By default the first roster is only remembered.
+
+        Returns:
+            list[ChangeEvent]: `MemberJoined`, `MemberLeft` and `RankChanged` events, in this order.
+        """
+        digest = self.digest(members)
+        with self._lock:
+            previous = self._states.get(clan_id)
+            if previous is not None and previous[0] == digest:
+                return []
+            self._states[clan_id] = (digest, {member.name: member.rank for member in members})
+
+        if previous is None:
+            return [MemberJoined(clan_id, member) for member in members] if initial else []
+
+        ranks = previous[1]
+        joined, changed = [], []
+        for member in members:
+            rank = ranks.pop(member.name, None)
+            if rank is None:
+                joined.append(MemberJoined(clan_id, member))
+            elif rank != member.rank:
+                changed.append(RankChanged(clan_id, member, rank))
+        left = [MemberLeft(clan_id, name, rank) for name, rank in ranks.items()]
+        return [*joined, *left, *changed]
+
+    def forget(self, clan_id: str) -> None:
+        """Forgets the roster of the clan, e.g. once it is no longer polled."""
+        with self._lock:
+            self._states.pop(clan_id, None)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class ClanListDiffer:
+    """Detects clans appearing, disappearing and changing their level between consecutive clan lists.
+
+    Only the level of every clan is kept between observations, together with a content hash of the
+    whole list, so an unchanged list is recognized without comparing the clans.
+
+    .. code-block:: python
+
+        differ = ClanListDiffer()
+        events = differ.observe(list(api.clans(region="EU").iter_all()))
+    """
+
+    def __init__(self) -> None:
+        self._digest: int | None = None
+        self._levels: dict[str, int] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(clans: Iterable[Clan]) -> int:
+        """Returns the content hash of a clan list, independent of the order of the clans.
+
+        Args:
+            clans (Iterable[Clan]): The clans.
+
+        Returns:
+            int: The hash of the identifiers and levels of the clans.
+        """
+        return hash(frozenset((clan.id, clan.level) for clan in clans))
+
+    def observe(self, clans: list[Clan], complete: bool = True, initial: bool = False) -> list[ChangeEvent]:
+        """Compares the clans with the previously observed ones.
+
+        Args:
+            clans (list[Clan]): The current clans.
+            complete (bool): Whether the clans are the complete list. A partial list, such as a single
+                page of `get_all`, never reports clans as disappeared and does not forget them.
+            initial (bool): Whether to report every clan as appeared on the first observation.
+                By default the first list is only remembered.
+
+        Returns:
+            list[ChangeEvent]: `ClanAppeared`, `ClanDisappeared` and `LevelChanged` events, in this order.
+        """
+        digest = self.digest(clans)
+        with self._lock:
+            previous = self._levels
+            if previous is not None and complete and self._digest == digest:
+                return []
+
+            levels = {clan.id: clan.level for clan in clans}
+            if complete or previous is None:
+                self._levels, self._digest = levels, digest if complete else None
+            else:
+                self._levels, self._digest = {**previous, **levels}, None
+
+        if previous is None:
+            return [ClanAppeared(clan) for clan in clans] if initial else []
+
+        appeared, changed = [], []
+        for clan in clans:
+            level = previous.get(clan.id)
+            if level is None:
+                appeared.append(ClanAppeared(clan))
+            elif level != clan.level:
+                changed.append(LevelChanged(clan, level))
+        disappeared = []
+        if complete:
+            disappeared = [ClanDisappeared(clan_id) for clan_id in previous if clan_id not in levels]
+        return [*appeared, *disappeared, *changed]
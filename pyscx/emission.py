@@ -0,0 +1,372 @@
+import asyncio
+import inspect
+import statistics
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable
+
+from .objects import Emission
+
+
+def is_active(emission: Emission) -> bool:
+    """Returns whether an emission is in progress.
+
+    Args:
+        emission (Emission): The emission data returned by the API.
+
+    Returns:
+        bool: True if the current emission began after the previous one ended.
+    """
+    return emission.current_start is not None and emission.current_start > emission.previous_end
+
+
+class EmissionEventType(Enum):
+    """Transitions reported by the emission watchers."""
+
+    STARTED = "started"
+    ENDED = "ended"
+
+
+class EmissionEvent:
+    """An emission transition, passed to the subscribers of a watcher.
+
+    Attributes:
+        type (EmissionEventType): Whether the emission started or ended.
+        region (str): The region the emission happened in.
+        emission (Emission): The emission data the transition was detected from.
+    """
+
+    __slots__ = ("type", "region", "emission")
+
+    def __init__(self, type: EmissionEventType, region: str, emission: Emission) -> None:
+        self.type = type
+        self.region = region
+        self.emission = emission
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class EmissionSchedule:
+    """Adaptive polling schedule derived from the cadence of past emissions.
+
+    The period between emissions is estimated as the median interval between the emission starts
+    seen so far (`default_period` until two starts are known). Far from the expected start the
+    emission is polled rarely, within `window` of it (or once it is overdue) every `min_interval`
+    seconds, and during an emission every `active_interval` seconds to catch its end.
+
+    Attributes:
+        min_interval (float): The polling interval near the expected start, in seconds.
+        max_interval (float): The longest polling interval, in seconds.
+        active_interval (float): The polling interval during an emission, in seconds.
+        window (float): How long before the expected start fast polling begins, in seconds.
+        default_period (float): The assumed period between emissions, in seconds.
+    """
+
+    __slots__ = (
+        "min_interval",
+        "max_interval",
+        "active_interval",
+        "window",
+        "default_period",
+        "active",
+        "_starts",
+    )
+
+    def __init__(
+        self,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        active_interval: float = 10,
+        window: float = 15 * 60,
+        default_period: float = 2 * 60 * 60,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.active_interval = active_interval
+        self.window = window
+        self.default_period = default_period
+        self.active: bool | None = None
+
+        self._starts: deque[datetime] = deque(maxlen=16)
+
+    def _record(self, start: datetime | None) -> None:
+        if start is not None and start not in self._starts:
+            self._starts.append(start)
+            self._starts = deque(sorted(self._starts), maxlen=self._starts.maxlen)
+
+    @property
+    def period(self) -> float:
+        """Returns the estimated period between emissions, in seconds."""
+        starts = list(self._starts)
+        if len(starts) < 2:
+            return self.default_period
+        return statistics.median(
+            (later - earlier).total_seconds() for earlier, later in zip(starts, starts[1:])
+        )
+
+    @property
+    def expected_start(self) -> datetime | None:
+        """Returns the expected start of the next emission, or None if no emission has been seen yet."""
+        if not self._starts:
+            return None
+        return self._starts[-1] + timedelta(seconds=self.period)
+
+    def update(self, emission: Emission) -> EmissionEventType | None:
+        """Takes a polled emission state into account.
+
+        Args:
+            emission (Emission): The emission data returned by the API.
+
+        Returns:
+            EmissionEventType | None: The transition since the previous state, if any. An emission in
+                progress on the first update is reported as started.
+        """
+        self._record(emission.previous_start)
+        self._record(emission.current_start)
+
+        active, was_active = is_active(emission), self.active
+        self.active = active
+        if active and not was_active:
+            return EmissionEventType.STARTED
+        if was_active and not active:
+            return EmissionEventType.ENDED
+        return None
+
+    def next_delay(self, now: datetime) -> float:
+        """Returns how long to wait before the next poll.
+
+        Args:
+            now (datetime): The current moment, timezone-aware.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.active:
+            return self.active_interval
+        expected = self.expected_start
+        if expected is None:
+            return self.min_interval
+        until_window = (expected - now).total_seconds() - self.window
+        return min(self.max_interval, max(self.min_interval, until_window))
+
+
+class _EmissionWatcherBase:
+    def __init__(
+        self,
+        api: Any,
+        region: str,
+        schedule: EmissionSchedule | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.api = api
+        self.region = region
+        self.schedule = schedule or EmissionSchedule()
+        self.on_error = on_error
+
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._subscribers: list[Callable[[EmissionEvent], Any]] = []
+
+    def subscribe(self, callback: Callable[[EmissionEvent], Any]) -> Callable[[EmissionEvent], Any]:
+        """Registers a callback called with every emission transition.
+
+        Can be used as a decorator.
+
+        Args:
+            callback (Callable[[EmissionEvent], Any]): The callback.
+
+        Returns:
+            Callable[[EmissionEvent], Any]: The same callback.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[EmissionEvent], Any]) -> None:
+        """Removes a previously registered callback."""
+        self._subscribers.remove(callback)
+
+    def _report(self, error: Exception) -> None:
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _transition(self, emission: Emission) -> EmissionEvent | None:
+        event_type = self.schedule.update(emission)
+        return EmissionEvent(event_type, self.region, emission) if event_type else None
+
+
+class EmissionWatcher(_EmissionWatcherBase):
+    """Polls the emission state of a region in a background thread and notifies subscribers.
+
+    One watcher serves any number of subscribers, so a whole process needs a single poller per
+    region. The polling interval adapts to the cadence of the emissions (see `EmissionSchedule`).
+    Errors raised while polling or by the subscribers are passed to `on_error` and do not stop
+    the watcher.
+
+    .. code-block:: python
+
+        watcher = EmissionWatcher(api, region="EU")
+
+        @watcher.subscribe
+        def notify(event):
+            print(f"Emission {event.type.value} in {event.region}")
+
+        watcher.start()
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        region: str,
+        schedule: EmissionSchedule | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initializes the watcher.
+
+        Args:
+            api (API): The API client to poll the emissions with.
+            region (str): The region to watch.
+            schedule (EmissionSchedule | None): The polling schedule. Defaults to `EmissionSchedule()`.
+            on_error (Callable[[Exception], Any] | None): A hook called with the errors raised by
+                the polls and the subscribers.
+            clock (Callable[[], datetime] | None): Returns the current timezone-aware moment.
+        """
+        super().__init__(api, region, schedule, on_error, clock)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll(self) -> EmissionEvent | None:
+        """Polls the emission state once and notifies the subscribers of a transition.
+
+        Returns:
+            EmissionEvent | None: The detected transition, if any.
+        """
+        emission = self.api.emissions(region=self.region).get_info()
+        event = self._transition(emission)
+        if event is not None:
+            for callback in list(self._subscribers):
+                try:
+                    callback(event)
+                except Exception as error:
+                    self._report(error)
+        return event
+
+    def run(self) -> None:
+        """Polls the emission state until `stop` is called."""
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+                delay = self.schedule.next_delay(self._clock())
+            except Exception as error:
+                self._report(error)
+                delay = self.schedule.min_interval
+            self._stopped.wait(delay)
+
+    def start(self) -> None:
+        """Starts polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.run, name=f"pyscx-emission-{self.region}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops polling and waits for the thread to finish.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait for the thread.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+class AsyncEmissionWatcher(_EmissionWatcherBase):
+    """Polls the emission state of a region in an asyncio task and notifies subscribers.
+
+    The asynchronous counterpart of `EmissionWatcher`, polling through an `AsyncAPI` client.
+    Subscribers may be plain functions or coroutine functions.
+
+    .. code-block:: python
+
+        watcher = AsyncEmissionWatcher(api, region="EU")
+        watcher.subscribe(on_emission)
+        watcher.start()
+        ...
+        await watcher.stop()
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        region: str,
+        schedule: EmissionSchedule | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initializes the watcher.
+
+        Args:
+            api (AsyncAPI): The asynchronous API client to poll the emissions with.
+            region (str): The region to watch.
+            schedule (EmissionSchedule | None): The polling schedule. Defaults to `EmissionSchedule()`.
+            on_error (Callable[[Exception], Any] | None): A hook called with the errors raised by
+                the polls and the subscribers.
+            clock (Callable[[], datetime] | None): Returns the current timezone-aware moment.
+        """
+        super().__init__(api, region, schedule, on_error, clock)
+        self._task: asyncio.Task | None = None
+
+    async def poll(self) -> EmissionEvent | None:
+        """Polls the emission state once and notifies the subscribers of a transition.
+
+        Returns:
+            EmissionEvent | None: The detected transition, if any.
+        """
+        emission = await self.api.emissions(region=self.region).get_info()
+        event = self._transition(emission)
+        if event is not None:
+            for callback in list(self._subscribers):
+                try:
+                    result = callback(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as error:
+                    self._report(error)
+        return event
+
+    async def run(self) -> None:
+        """Polls the emission state until the task is cancelled."""
+        while True:
+            try:
+                await self.poll()
+                delay = self.schedule.next_delay(self._clock())
+            except Exception as error:
+                self._report(error)
+                delay = self.schedule.min_interval
+            await asyncio.sleep(delay)
+
+    def start(self) -> asyncio.Task:
+        """Starts polling in a task of the running event loop.
+
+        Returns:
+            asyncio.Task: The polling task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancels the polling task and waits for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -57,3 +57,42 @@ class InvalidMethodGroup(BaseAPIException):
             self.default_message = f"Не возможно получить группу методов API с именем '{group}'."
         else:
             self.default_message = "Не возможно получить группу методов API."
+
+
+class DeadlineExceeded(BaseAPIException, TimeoutError):
+    """Exception raised when an API call does not finish before its deadline.
+
+    The deadline covers all attempts of a retried request and all pages of a paginated method.
+
+    Args:
+        message (str | None): A custom error message. If None, the default message is used.
+        **kwargs: Additional keyword arguments to specify the URL of the unfinished request.
+    """
+
+    def __init__(self, message: str | None = None, **kwargs) -> None:
+        super().__init__(message)
+        url = kwargs.get("url")
+        if url:
+            self.default_message = f"The deadline of the API call expired before the request to '{url}' finished."
+        else:
+            self.default_message = "The deadline of the API call expired."
+
+
+class RequestShed(BaseAPIException):
+    """Exception raised when the request scheduler drops a request to keep the others on time.
+
+    A request is shed when the queue of its priority class is full, when it cannot be sent before
+    its deadline, or when it has waited longer than its priority class allows.
+
+    Args:
+        message (str | None): A custom error message. If None, the default message is used.
+        **kwargs: Additional keyword arguments to specify the priority class of the request.
+    """
+
+    def __init__(self, message: str | None = None, **kwargs) -> None:
+        super().__init__(message)
+        priority = kwargs.get("priority")
+        if priority:
+            self.default_message = f"The request of priority '{priority}' was shed by the scheduler."
+        else:
+            self.default_message = "The request was shed by the scheduler."
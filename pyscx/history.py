@@ -0,0 +1,231 @@
+from datetime import timezone
+from typing import Any, Iterable, Iterator
+
+from .columnar import naive_utc, np, require_numpy
+from .objects import AuctionRedeemedLot
+
+
+class PriceHistory:
+    """Columnar representation of the price history of an auction item.
+
+    Instead of one `AuctionRedeemedLot` object per sale, the history is stored in contiguous NumPy
+    arrays, which take a fraction of the memory and allow vectorized aggregates. Rows are only
+    materialized into `AuctionRedeemedLot` objects when they are accessed by index or iterated over.
+
+    Slicing, boolean masks and index arrays return a new `PriceHistory`; basic slices share memory
+    with the original arrays.
+
+    .. code-block:: python
+
+        history = api.auction(region="EU").get_history_columns(item_id="1kv2", limit=200)
+        last_day = history.between(start=np.datetime64("now") - np.timedelta64(1, "D"))
+        print(last_day.vwap(), last_day.percentile([5, 50, 95]))
+
+    Attributes:
+        price (numpy.ndarray): The final sale prices of the lots, as int64.
+        amount (numpy.ndarray): The numbers of items in the lots, as int64.
+        time (numpy.ndarray): The moments the lots were sold, as naive UTC datetime64[ms].
+        additional (numpy.ndarray): The additional data of the lots, as objects. Empty data is stored as None.
+    """
+
+    __slots__ = ("price", "amount", "time", "additional")
+
+    def __init__(self, price: Any, amount: Any, time: Any, additional: Any = None) -> None:
+        """Initializes the history from its columns.
+
+        Args:
+            price (Any): The sale prices of the lots.
+            amount (Any): The numbers of items in the lots.
+            time (Any): The moments the lots were sold, in UTC.
+            additional (Any): The additional data of the lots. Defaults to no additional data.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the columns have different lengths.
+        """
+        require_numpy("Columnar price history")
+        self.price = np.asarray(price, dtype=np.int64)
+        self.amount = np.asarray(amount, dtype=np.int64)
+        self.time = np.asarray(time, dtype="datetime64[ms]")
+        if additional is None:
+            additional = np.full(len(self.price), None, dtype=object)
+        self.additional = np.asarray(additional, dtype=object)
+
+        if not len(self.price) == len(self.amount) == len(self.time) == len(self.additional):
+            raise ValueError("All columns of the price history must have the same length.")
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> "PriceHistory":
+        """Builds the history from the raw lots returned by the API.
+
+        Args:
+            records (list[dict[str, Any]]): The decoded lots, as found under the `prices` key of the response.
+
+        Returns:
+            PriceHistory: The columnar history.
+        """
+        require_numpy("Columnar price history")
+        count = len(records)
+        additional = np.empty(count, dtype=object)
+        additional[:] = [record.get("additional") or None for record in records]
+        return cls(
+            price=np.fromiter((record["price"] for record in records), dtype=np.int64, count=count),
+            amount=np.fromiter((record["amount"] for record in records), dtype=np.int64, count=count),
+            time=np.array([naive_utc(record["time"]) for record in records], dtype="datetime64[ms]"),
+            additional=additional,
+        )
+
+    @classmethod
+    def from_lots(cls, lots: Iterable[AuctionRedeemedLot]) -> "PriceHistory":
+        """Builds the history from redeemed lot objects, e.g. those yielded by `iter_history`.
+
+        Args:
+            lots (Iterable[AuctionRedeemedLot]): The redeemed lots.
+
+        Returns:
+            PriceHistory: The columnar history.
+        """
+        return cls.from_records([lot.raw() for lot in lots])
+
+    @classmethod
+    def concat(cls, histories: Iterable["PriceHistory"]) -> "PriceHistory":
+        """Joins several histories, e.g. consecutive pages, into one.
+
+        Args:
+            histories (Iterable[PriceHistory]): The histories to join, in order.
+
+        Returns:
+            PriceHistory: The joined history.
+        """
+        histories = list(histories)
+        if not histories:
+            return cls([], [], [])
+        return cls(
+            price=np.concatenate([history.price for history in histories]),
+            amount=np.concatenate([history.amount for history in histories]),
+            time=np.concatenate([history.time for history in histories]),
+            additional=np.concatenate([history.additional for history in histories]),
+        )
+
+    @property
+    def unit_price(self) -> "np.ndarray":
+        """Returns the price of a single item of every lot.
+
+        Returns:
+            numpy.ndarray: The unit prices, as float64.
+        """
+        return self.price / np.maximum(self.amount, 1)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the memory taken by the columns, not counting the additional data objects.
+
+        Returns:
+            int: The size of the columns in bytes.
+        """
+        return self.price.nbytes + self.amount.nbytes + self.time.nbytes + self.additional.nbytes
+
+    def sort_by_time(self) -> "PriceHistory":
+        """Returns the history ordered from the oldest sale to the newest one.
+
+        Returns:
+            PriceHistory: The sorted history.
+        """
+        return self[np.argsort(self.time, kind="stable")]
+
+    def between(self, start: Any = None, end: Any = None) -> "PriceHistory":
+        """Returns the sales made within the time range.
+
+        Args:
+            start (Any): The inclusive start of the range, as a naive UTC datetime or datetime64.
+                Unbounded if None.
+            end (Any): The exclusive end of the range, as a naive UTC datetime or datetime64.
+                Unbounded if None.
+
+        Returns:
+            PriceHistory: The sales within the range.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.time >= np.datetime64(start, "ms")
+        if end is not None:
+            mask &= self.time < np.datetime64(end, "ms")
+        return self[mask]
+
+    def vwap(self) -> float:
+        """Calculates the volume-weighted average price of a single item.
+
+        Returns:
+            float: The total price of all lots divided by the total number of items,
+                or NaN if the history is empty.
+        """
+        volume = self.amount.sum()
+        if not volume:
+            return float("nan")
+        return float(self.price.sum() / volume)
+
+    def percentile(self, q: Any, per_unit: bool = True) -> Any:
+        """Calculates percentiles of the sale prices.
+
+        Args:
+            q (Any): The percentile or sequence of percentiles to calculate, between 0 and 100.
+            per_unit (bool): Whether to use the prices of single items rather than of whole lots.
+
+        Returns:
+            Any: The percentile(s), as float64.
+        """
+        return np.percentile(self.unit_price if per_unit else self.price, q)
+
+    def rolling_median(self, window: int, per_unit: bool = True) -> "np.ndarray":
+        """Calculates the median price over a sliding window of consecutive sales.
+
+        The sales are taken in their current order, so the history is usually sorted with `sort_by_time` first.
+
+        Args:
+            window (int): The number of sales in the window.
+            per_unit (bool): Whether to use the prices of single items rather than of whole lots.
+
+        Returns:
+            numpy.ndarray: The median of every full window, `len(history) - window + 1` values in total.
+
+        Raises:
+            ValueError: If the window is not positive.
+        """
+        if window < 1:
+            raise ValueError("The window must contain at least one sale.")
+        prices = self.unit_price if per_unit else self.price.astype(np.float64)
+        if len(prices) < window:
+            return np.empty(0, dtype=np.float64)
+        return np.median(np.lib.stride_tricks.sliding_window_view(prices, window), axis=1)
+
+    def row(self, index: int) -> AuctionRedeemedLot:
+        """Materializes a single sale into a redeemed lot object.
+
+        Args:
+            index (int): The position of the sale.
+
+        Returns:
+            AuctionRedeemedLot: The redeemed lot.
+        """
+        moment = self.time[index].astype("datetime64[us]").item().replace(tzinfo=timezone.utc)
+        return AuctionRedeemedLot(
+            amount=int(self.amount[index]),
+            price=int(self.price[index]),
+            time=moment,
+            additional=self.additional[index] or {},
+        )
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def __iter__(self) -> Iterator[AuctionRedeemedLot]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __getitem__(self, index: Any) -> "AuctionRedeemedLot | PriceHistory":
+        if isinstance(index, (int, np.integer)):
+            return self.row(index)
+        return type(self)(self.price[index], self.amount[index], self.time[index], self.additional[index])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(lots={len(self)})"
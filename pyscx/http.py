@@ -1,9 +1,73 @@
+import asyncio
+import json
+import re
+import time
 from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+from urllib.parse import urlsplit
 
 import requests
 
+from .exceptions import DeadlineExceeded
+from .metrics import CACHE_HITS, CACHE_MISSES, ERRORS, LATENCY, REQUESTS, RETRIES, SIZE
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .token import Token, TokenPool, TokenType
+from .transport import Deadline, Transport
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+if TYPE_CHECKING:
+    from .cache import CacheBackend
+    from .metrics import MetricsExporter
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .scheduler import RequestScheduler
+
 DEFAULT_AGENT = "pyscx/1.1.3 (+https://github.com/Oidaho/pyscx)"
 
+ENDPOINT_TEMPLATES = (
+    "regions",
+    "{region}/emission",
+    "{region}/friends/{character}",
+    "{region}/auction/{item}/history",
+    "{region}/auction/{item}/lots",
+    "{region}/characters",
+    "{region}/character/by-name/{character}/profile",
+    "{region}/clan/{clan-id}/info",
+    "{region}/clan/{clan-id}/members",
+    "{region}/clans",
+)
+"""Templates of all STALCRAFT: X API endpoints known to pyscx."""
+
+_ENDPOINT_PATTERNS = tuple(
+    (re.compile("^" + re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(template)) + "$"), template)
+    for template in ENDPOINT_TEMPLATES
+)
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(url: str) -> str:
+    """Resolves the endpoint template of the API resource.
+
+    The methods of pyscx pass the template of their endpoint along with the URL, so the patterns
+    are only matched for requests made without one. The results are memoized.
+
+    Args:
+        url (str): The path of the API resource, relative to the server URL, or the full URL of a request.
+
+    Returns:
+        str: The matching template from `ENDPOINT_TEMPLATES`, or the path itself if none matches.
+    """
+    path = urlsplit(url).path.strip("/")
+    for pattern, template in _ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return template
+    return path
+
 
 class Server(Enum):
     """Enumeration representing the available STALCRAFT: X API servers.
@@ -17,22 +81,303 @@ class Server(Enum):
     PRODUCTION = "eapi"
 
 
-class APISession(requests.Session):
+class _CachedSessionMixin:
+    """Authorization, cache handling and instrumentation shared by the synchronous and asynchronous sessions."""
+
+    cache: "CacheBackend | None"
+    metrics: "MetricsExporter | None"
+    tokens: TokenPool | None
+    transport: Transport
+    response_hooks: list[Callable[[Mapping[str, str] | None, Any], Any]]
+
+    def _pin_token(self, token: Token | TokenType | str | None, endpoint: str) -> Token | TokenType | str | None:
+        """Picks the token of the pool up front for endpoints whose responses are cached per token.
+
+        Otherwise a token type is resolved only when the request is actually sent, so cache hits
+        do not take turns of the pool.
+        """
+        if isinstance(token, TokenType) and self.cache is not None and self.cache.is_per_token(endpoint):
+            return Token(self.tokens.acquire(token), token)
+        return token
+
+    def _authorize(
+        self, token: Token | TokenType | str | None, headers: Mapping[str, str] | None
+    ) -> Mapping[str, str] | None:
+        """Adds the authorization header of the token to the request headers.
+
+        Args:
+            token (Token | TokenType | str | None): The token to authorize the request with, or the type
+                of the token to pick from the pool of the session.
+            headers (Mapping[str, str] | None): Headers of the request.
+
+        Returns:
+            Mapping[str, str] | None: The headers, with the authorization header if a token is given.
+        """
+        if token is None:
+            return headers
+        if isinstance(token, TokenType):
+            token = self.tokens.acquire(token)
+        elif isinstance(token, Token):
+            token = token.value
+        return {**(headers or {}), "Authorization": f"Bearer {token}"}
+
+    @staticmethod
+    def _rejected_by_quota(token: Token | TokenType | str | None, response: Any) -> bool:
+        """Returns whether a retry has to pick another token of the pool, as the previous one hit its quota.
+
+        The pool puts a token answered with `429 Too Many Requests` on cooldown, so picking the token
+        again hands out another one, unless the caller pinned the token.
+        """
+        return isinstance(token, TokenType) and response is not None and response.status_code == 429
+
+    def _cache_lookup(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        endpoint: str,
+        token: Token | TokenType | str | None = None,
+    ) -> tuple[tuple | None, Any, Mapping[str, str] | None]:
+        """Looks the request up in the cache.
+
+        Returns:
+            tuple: The cache key (None if caching is disabled), the fresh cached response (if any)
+                and the request headers extended with conditional validators of a stale entry.
+        """
+        if self.metrics is not None:
+            self.metrics.increment(endpoint, REQUESTS)
+        if self.cache is None:
+            return None, None, headers
+
+        key = self.cache.make_key(self.server_url, url, params, headers, endpoint, token)
+        cached = self.cache.get(key)
+        if self.metrics is not None:
+            self.metrics.increment(endpoint, CACHE_HITS if cached is not None else CACHE_MISSES)
+        if cached is not None:
+            return key, cached, headers
+
+        validators = self.cache.validators(key)
+        if validators:
+            headers = {**(headers or {}), **validators}
+        return key, None, headers
+
+    def _cache_store(self, key: tuple | None, response: Any) -> Any:
+        """Stores a successful response in the cache, or resolves a `304 Not Modified` answer.
+
+        Returns:
+            Any: The response to return to the caller, or None if a `304` answer could not be
+                resolved because the stale entry is gone and the request has to be repeated.
+        """
+        if key is None:
+            return response
+        if response.status_code == 304:
+            return self.cache.revalidate(key, response)
+        if 200 <= response.status_code < 300:
+            self.cache.set(key, response)
+        return response
+
+    def _record_response(self, endpoint: str, started: float, response: Any = None) -> None:
+        """Reports the latency, the status code and the size of a response to the metrics exporter.
+
+        Args:
+            endpoint (str): The endpoint template of the request.
+            started (float): The `time.perf_counter()` value taken when the request was sent.
+            response (Any): The response, or None if the request failed without one.
+        """
+        self.metrics.observe(endpoint, LATENCY, time.perf_counter() - started)
+        if response is None:
+            self.metrics.increment(endpoint, ERRORS)
+            return
+        self.metrics.increment(endpoint, f"status.{response.status_code}")
+        self.metrics.observe(endpoint, SIZE, len(response.content))
+
+    def _record_retry(
+        self,
+        full_url: str,
+        endpoint: str,
+        attempt: int,
+        delay: float,
+        response: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Reports a retry accepted by the policy and by the deadline, right before waiting for it."""
+        self.retry.notify(full_url, attempt, delay, response, error)
+        if self.metrics is not None:
+            self.metrics.increment(endpoint, RETRIES)
+
+    def make_deadline(self, seconds: float | None = None) -> Deadline | None:
+        """Starts the deadline of an API call.
+
+        Args:
+            seconds (float | None): The time limit of the call, in seconds. Defaults to the `deadline`
+                of the transport settings.
+
+        Returns:
+            Deadline | None: The deadline, or None if the call is not limited.
+        """
+        return Deadline.after(seconds if seconds is not None else self.transport.deadline)
+
+    @staticmethod
+    def _check_retry(full_url: str, delay: float, deadline: Deadline | None) -> None:
+        if deadline is not None and delay >= deadline.remaining():
+            raise DeadlineExceeded(url=full_url)
+
+
+class APISession(_CachedSessionMixin, requests.Session):
     """Custom wrapper around the Session class from the `requests` module.
 
     Attributes:
         server (Server): The server environment to be used for API requests.
+        cache (CacheBackend | None): The cache successful responses are stored in, if any.
+        rate_limiter (RateLimiter | None): The limiter outgoing requests are paced by, if any.
+        retry (RetryPolicy | None): The policy failed requests are retried by, if any.
+        single_flight (SingleFlight | None): Deduplicates identical concurrent API calls, if enabled.
+        fast_parsing (bool): Whether response bodies are validated into models straight from the raw bytes.
+        metrics (MetricsExporter | None): The exporter measurements of requests are reported to, if any.
+        base_url (str | None): The URL requests are sent to instead of the one of `server`, if any.
+        transport (Transport): The pooling, timeout, keep-alive and compression settings.
+        scheduler (RequestScheduler | None): The scheduler ordering outgoing requests by priority, if any.
+            It paces the requests instead of `rate_limiter`.
+        response_hooks (list[Callable]): Callables invoked with the request headers and the response
+            after every response received from the server, including retried ones.
     """
 
-    def __init__(self, server: Server):
+    def __init__(
+        self,
+        server: Server,
+        cache: "CacheBackend | None" = None,
+        rate_limiter: "RateLimiter | None" = None,
+        retry: "RetryPolicy | None" = None,
+        coalesce: bool = False,
+        fast_parsing: bool = False,
+        metrics: "MetricsExporter | None" = None,
+        base_url: str | None = None,
+        transport: Transport | None = None,
+        scheduler: "RequestScheduler | None" = None,
+        tokens: TokenPool | None = None,
+    ):
         super().__init__()
         self.server = server
+        self.tokens = tokens
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.single_flight = SingleFlight() if coalesce else None
+        self.fast_parsing = fast_parsing
+        self.metrics = metrics
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.transport = transport or Transport()
+        self.scheduler = scheduler
+        self.response_hooks = []
 
         self.headers["User-Agent"] = DEFAULT_AGENT
+        self.headers["Accept-Encoding"] = self.transport.accept_encoding
+        if self.transport.keep_alive is None:
+            self.headers["Connection"] = "close"
+        adapter = self.transport.adapter()
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def _transmit(
+        self,
+        full_url: str,
+        endpoint: str,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        key, limiter = None, self.scheduler or self.rate_limiter
+        if self.scheduler is not None:
+            key = self.scheduler.rate_limiter.make_key(self.server_url, kwargs.get("headers"))
+            self.scheduler.acquire(key, priority, deadline, full_url)
+        elif self.rate_limiter is not None:
+            key = self.rate_limiter.make_key(self.server_url, kwargs.get("headers"))
+            self.rate_limiter.acquire(key, deadline, full_url)
+        if key is not None and deadline is not None:
+            # The time spent waiting for the limiter is taken from the timeouts.
+            kwargs["timeout"] = deadline.clamp(self.transport.timeout)
+
+        started = time.perf_counter()
+        try:
+            response = super().get(full_url, **kwargs)
+        except Exception:
+            if self.metrics is not None:
+                self._record_response(endpoint, started)
+            raise
+        if self.metrics is not None:
+            self._record_response(endpoint, started, response)
+
+        if key is not None:
+            limiter.observe(key, response.status_code, response.headers)
+        for hook in self.response_hooks:
+            hook(kwargs.get("headers"), response)
+        return response
+
+    def _send(
+        self,
+        full_url: str,
+        endpoint: str,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        token: Token | TokenType | str | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        headers = kwargs.get("headers")
+        kwargs["headers"] = self._authorize(token, headers)
+        attempt = 0
+        while True:
+            attempt += 1
+            if deadline is None:
+                kwargs["timeout"] = self.transport.timeout
+            else:
+                deadline.check(full_url)
+                kwargs["timeout"] = deadline.clamp(self.transport.timeout)
+
+            try:
+                response = self._transmit(full_url, endpoint, deadline, priority, **kwargs)
+            except Exception as error:
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceeded(url=full_url) from error
+                delay = self.retry.next_delay(full_url, attempt, error=error) if self.retry else None
+                if delay is None:
+                    raise
+                response, failure = None, error
+            else:
+                delay = self.retry.next_delay(full_url, attempt, response=response) if self.retry else None
+                if delay is None:
+                    return response
+                failure = None
+            self._check_retry(full_url, delay, deadline)
+            self._record_retry(full_url, endpoint, attempt, delay, response, failure)
+            time.sleep(delay)
+            if self._rejected_by_quota(token, response):
+                kwargs["headers"] = self._authorize(token, headers)
+
+    def get(
+        self,
+        url,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        endpoint: str | None = None,
+        token: Token | TokenType | str | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        endpoint = endpoint or endpoint_template(url)
+        token = self._pin_token(token, endpoint)
+        original_headers = kwargs.get("headers")
+        key, cached, kwargs["headers"] = self._cache_lookup(
+            url, kwargs.get("params"), original_headers, endpoint, token
+        )
+        if cached is not None:
+            return cached
 
-    def get(self, url, **kwargs) -> requests.Response:
         full_url = f"{self.server_url}/{url.lstrip('/')}"
-        response = super().get(full_url, **kwargs)
+        response = self._cache_store(key, self._send(full_url, endpoint, deadline, priority, token, **kwargs))
+        if response is None:
+            kwargs["headers"] = original_headers
+            response = self._send(full_url, endpoint, deadline, priority, token, **kwargs)
+            self._cache_store(key, response)
+
         response.raise_for_status()
         return response
 
@@ -41,6 +386,284 @@ class APISession(requests.Session):
         """Returns the base URL of the current STALCRAFT: X API server.
 
         Returns:
-            str: The full URL of the current API server.
+            str: The full URL of the current API server, or `base_url` if it is set.
+        """
+        if self.base_url is not None:
+            return self.base_url
+        return f"https://{self.server.value}.stalcraft.net"
+
+
+class BufferedResponse:
+    """A fully read response, detached from its connection.
+
+    The object mimics the part of the `requests.Response` interface used by pyscx, so the same
+    response handling code works for the asynchronous client and for responses restored from
+    a persistent cache.
+
+    Attributes:
+        url (str): The URL the request was sent to.
+        status_code (int): The HTTP status code of the response.
+        headers (Mapping[str, str]): The headers of the response.
+        content (bytes): The raw body of the response.
+        parsed (dict | None): Models already built from the body, if the response may be reused.
+    """
+
+    __slots__ = ("url", "status_code", "headers", "content", "reason", "parsed")
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        reason: str = "",
+        reusable: bool = False,
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.reason = reason
+        self.parsed = {} if reusable else None
+
+    def json(self) -> Any:
+        """Decodes the body of the response as JSON.
+
+        Returns:
+            Any: The decoded JSON document.
+        """
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raises `requests.HTTPError` if the response has a 4xx or 5xx status code.
+
+        The exception type is the same as in the synchronous client, so error handling
+        does not depend on the client being used.
+
+        Raises:
+            requests.HTTPError: If the status code of the response indicates an error.
+        """
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}", response=self
+            )
+
+
+class AsyncAPISession(_CachedSessionMixin):
+    """Asynchronous counterpart of `APISession` built on top of `aiohttp`.
+
+    The underlying `aiohttp.ClientSession` is created lazily on the first request, so the session
+    can be instantiated outside of a running event loop. All requests share one connection pool.
+
+    Attributes:
+        server (Server): The server environment to be used for API requests.
+        cache (CacheBackend | None): The cache successful responses are stored in, if any.
+        rate_limiter (RateLimiter | None): The limiter outgoing requests are paced by, if any.
+        retry (RetryPolicy | None): The policy failed requests are retried by, if any.
+        single_flight (AsyncSingleFlight | None): Deduplicates identical concurrent API calls, if enabled.
+        fast_parsing (bool): Whether response bodies are validated into models straight from the raw bytes.
+        metrics (MetricsExporter | None): The exporter measurements of requests are reported to, if any.
+        base_url (str | None): The URL requests are sent to instead of the one of `server`, if any.
+        transport (Transport): The pooling, timeout, keep-alive and compression settings.
+        scheduler (RequestScheduler | None): The scheduler ordering outgoing requests by priority, if any.
+            It paces the requests instead of `rate_limiter`.
+        response_hooks (list[Callable]): Callables invoked with the request headers and the response
+            after every response received from the server, including retried ones.
+        headers (dict[str, str]): Default headers sent with every request.
+    """
+
+    def __init__(
+        self,
+        server: Server,
+        cache: "CacheBackend | None" = None,
+        rate_limiter: "RateLimiter | None" = None,
+        retry: "RetryPolicy | None" = None,
+        coalesce: bool = False,
+        fast_parsing: bool = False,
+        metrics: "MetricsExporter | None" = None,
+        base_url: str | None = None,
+        transport: Transport | None = None,
+        scheduler: "RequestScheduler | None" = None,
+        pool_size: int | None = None,
+        tokens: TokenPool | None = None,
+    ):
+        """Initializes the asynchronous session.
+
+        Args:
+            server (Server): The server environment to be used for API requests.
+            cache (CacheBackend | None): The cache to store successful responses in.
+            rate_limiter (RateLimiter | None): The limiter to pace outgoing requests with.
+            retry (RetryPolicy | None): The policy to retry failed requests with.
+            coalesce (bool): Whether identical concurrent API calls share one request.
+            fast_parsing (bool): Whether response bodies are validated into models straight from the raw bytes.
+            metrics (MetricsExporter | None): The exporter to report the measurements of requests to.
+            base_url (str | None): The URL to send requests to instead of the one of `server`.
+            transport (Transport | None): The pooling, timeout, keep-alive and compression settings.
+            scheduler (RequestScheduler | None): The scheduler to order outgoing requests by priority with.
+            pool_size (int | None): The maximum number of simultaneously open connections. Defaults to
+                the `pool_maxsize` of the transport settings.
+            tokens (TokenPool | None): The pool to pick the tokens of requests authorized by a token type from.
+
+        Raises:
+            ImportError: If `aiohttp` is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "The asynchronous client requires 'aiohttp'. Install it with `pip install pyscx[async]`."
+            )
+
+        self.server = server
+        self.tokens = tokens
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.fast_parsing = fast_parsing
+        self.metrics = metrics
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.transport = transport or Transport()
+        self.scheduler = scheduler
+        self.response_hooks = []
+        self.headers = {"User-Agent": DEFAULT_AGENT, "Accept-Encoding": self.transport.accept_encoding}
+        self.pool_size = pool_size if pool_size is not None else self.transport.pool_maxsize
+        self._session = None
+
+    @staticmethod
+    def _prepare_params(params: Mapping[str, Any] | None) -> dict[str, str] | None:
+        # Mirror `requests`: drop empty values and stringify the rest.
+        if not params:
+            return None
+        return {key: str(value) for key, value in params.items() if value is not None}
+
+    def _client(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = self.transport.connector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self._session
+
+    async def _send(
+        self,
+        full_url: str,
+        endpoint: str,
+        headers: Mapping[str, str] | None,
+        params,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        token: Token | TokenType | str | None = None,
+    ) -> BufferedResponse:
+        request_headers = self._authorize(token, headers)
+        attempt = 0
+        while True:
+            attempt += 1
+            if deadline is not None:
+                deadline.check(full_url)
+
+            try:
+                response = await self._transmit(full_url, endpoint, request_headers, params, deadline, priority)
+            except Exception as error:
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceeded(url=full_url) from error
+                delay = self.retry.next_delay(full_url, attempt, error=error) if self.retry else None
+                if delay is None:
+                    raise
+                response, failure = None, error
+            else:
+                delay = self.retry.next_delay(full_url, attempt, response=response) if self.retry else None
+                if delay is None:
+                    return response
+                failure = None
+            self._check_retry(full_url, delay, deadline)
+            self._record_retry(full_url, endpoint, attempt, delay, response, failure)
+            await asyncio.sleep(delay)
+            if self._rejected_by_quota(token, response):
+                request_headers = self._authorize(token, headers)
+
+    async def _transmit(
+        self,
+        full_url: str,
+        endpoint: str,
+        headers: Mapping[str, str] | None,
+        params,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+    ) -> BufferedResponse:
+        key, limiter = None, self.scheduler or self.rate_limiter
+        if self.scheduler is not None:
+            key = self.scheduler.rate_limiter.make_key(self.server_url, headers)
+            await self.scheduler.acquire_async(key, priority, deadline, full_url)
+        elif self.rate_limiter is not None:
+            key = self.rate_limiter.make_key(self.server_url, headers)
+            wait = self.rate_limiter.reserve(key, deadline, full_url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        timeout = self.transport.client_timeout(deadline)
+        started = time.perf_counter()
+        try:
+            request = self._client().get(
+                full_url, headers=headers, params=self._prepare_params(params), timeout=timeout
+            )
+            async with request as raw:
+                response = BufferedResponse(
+                    url=str(raw.url),
+                    status_code=raw.status,
+                    headers=raw.headers,
+                    content=await raw.read(),
+                    reason=raw.reason or "",
+                )
+        except Exception:
+            if self.metrics is not None:
+                self._record_response(endpoint, started)
+            raise
+        if self.metrics is not None:
+            self._record_response(endpoint, started, response)
+
+        if key is not None:
+            limiter.observe(key, response.status_code, response.headers)
+        for hook in self.response_hooks:
+            hook(headers, response)
+        return response
+
+    async def get(
+        self,
+        url,
+        headers: Mapping[str, str] | None = None,
+        params=None,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        endpoint: str | None = None,
+        token: Token | TokenType | str | None = None,
+    ) -> BufferedResponse:
+        endpoint = endpoint or endpoint_template(url)
+        token = self._pin_token(token, endpoint)
+        key, cached, conditional_headers = self._cache_lookup(url, params, headers, endpoint, token)
+        if cached is not None:
+            return cached
+
+        full_url = f"{self.server_url}/{url.lstrip('/')}"
+        response = await self._send(full_url, endpoint, conditional_headers, params, deadline, priority, token)
+        response = self._cache_store(key, response)
+        if response is None:
+            response = await self._send(full_url, endpoint, headers, params, deadline, priority, token)
+            self._cache_store(key, response)
+
+        response.raise_for_status()
+        return response
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def server_url(self) -> str:
+        """Returns the base URL of the current STALCRAFT: X API server.
+
+        Returns:
+            str: The full URL of the current API server, or `base_url` if it is set.
         """
+        if self.base_url is not None:
+            return self.base_url
         return f"https://{self.server.value}.stalcraft.net"
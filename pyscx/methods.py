@@ -1,7 +1,20 @@
-from functools import wraps
-
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import partial, wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator
+
+from cachetools import TTLCache
+
+from .analytics import LotBook
+from .batch import DEFAULT_MAX_WORKERS, BatchResult, run_batch, run_batch_async
+from .decoding import decode
 from .exceptions import MissingTokenError, InvalidMethodGroup
-from .http import APISession
+from .history import PriceHistory
+from .http import APISession, AsyncAPISession, endpoint_template
+from .metrics import DECODE_TIME, VALIDATE_TIME
 from .objects import (
     APIObject,
     AuctionLot,
@@ -13,7 +26,20 @@ from .objects import (
     FullCharacterInfo,
     Region,
 )
-from .token import TokenType
+from .sync import HistoryDelta, HistoryWatermarks
+from .token import Token, TokenPool, TokenType
+from .transport import Deadline
+from .views import view_class
+
+
+MAX_PAGE_LIMIT = 200
+"""The largest page size accepted by the paginated API endpoints."""
+
+REGION_LIST_TTL = 24 * 60 * 60
+"""How long the list of regions used by `all_regions` is cached for (in seconds)."""
+
+_region_ids = TTLCache(maxsize=16, ttl=REGION_LIST_TTL)
+_region_ids_lock = threading.Lock()
 
 
 class MethodsGroup:
@@ -22,14 +48,30 @@ class MethodsGroup:
     The `MethodsGroup` class is responsible for providing common functionality
     to interact with various API method groups (such as regions, emissions, etc.).
     It provides utilities to wrap data into model instances and manage tokens for API requests.
+
+    With a response cache that reuses responses (`DiskCache`) or with coalescing enabled, calls
+    answered by the same response return the same model instances. The returned lists are the
+    caller's own and may be sorted or changed, but the models in them should not be mutated.
+
+    Attributes:
+        group_name (str): The name of the group, derived from the class name once, when the class is created.
     """
 
-    __slots__ = ("region", "_http", "_tokens")
+    __slots__ = ("region", "_http", "_tokens", "_path", "_item_path")
+
+    group_name: str = ""
 
-    def __init__(self, region: str | None, session: APISession, tokens: dict[TokenType, str]):
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.group_name = cls.__name__.removeprefix("Async").replace("Methods", "").lower()
+
+    def __init__(self, region: str | None, session: APISession, tokens: TokenPool):
         self._http = session
         self._tokens = tokens
         self.region = region
+        # Resource paths are prefixed once per bound region rather than on every call.
+        self._path = f"{region}/{self.group_name}"
+        self._item_path = f"{region}/{self.group_name[:-1]}"
 
     @staticmethod
     def wrap_data(data: dict | list[dict], model: APIObject) -> APIObject:
@@ -48,6 +90,349 @@ class MethodsGroup:
             return [model(**item) for item in data]
         return model(**data)
 
+    @classmethod
+    def _unwrap(cls, data: Any, model: APIObject | None = None, key: str | None = None) -> Any:
+        """Extracts the payload from the decoded response body and wraps it into the model.
+
+        Args:
+            data (Any): The decoded JSON body of the response.
+            model (APIObject | None): The model class to wrap the data into. If None, the data is returned as is.
+                A container class with a `from_records` class method receives the whole list of records.
+            key (str | None): The key of the response envelope under which the payload is stored.
+
+        Returns:
+            Any: The wrapped model instance(s) or the raw payload.
+        """
+        if key is not None:
+            data = data[key]
+        if model is None:
+            return data
+        if hasattr(model, "from_records"):
+            # Columnar containers are built from all the records at once.
+            return model.from_records(data)
+        return cls.wrap_data(data, model)
+
+    def _decode(
+        self,
+        response: Any,
+        model: APIObject | None = None,
+        key: str | None = None,
+        total_key: str | None = None,
+        endpoint: str | None = None,
+    ) -> Any:
+        """Decodes the response body and wraps its payload into the model.
+
+        With fast parsing enabled on the session, the raw body is validated into the models in one
+        pass, skipping the intermediate decoded JSON. Otherwise every object is wrapped separately.
+        The time spent is reported to the metrics exporter of the session, if any.
+
+        Args:
+            response (Any): The response of the API server.
+            model (APIObject | None): The model class to wrap the payload into.
+            key (str | None): The key of the response envelope under which the payload is stored.
+            total_key (str | None): The key of the envelope holding the total number of items, for pages
+                of paginated resources. If given, the whole envelope is returned, with the wrapped payload
+                stored under `key`.
+            endpoint (str | None): The endpoint template of the resource, for the metrics.
+                Resolved from the URL of the response if not given.
+
+        Returns:
+            Any: The wrapped model instance(s), the raw payload, or the envelope holding them.
+        """
+        metrics = self._http.metrics
+        if metrics is not None and endpoint is None:
+            endpoint = endpoint_template(response.url)
+        started = time.perf_counter() if metrics is not None else 0.0
+        if self._http.fast_parsing:
+            result = decode(response.content, model, key, total_key)
+            if metrics is not None:
+                metric = DECODE_TIME if model is None else VALIDATE_TIME
+                metrics.observe(endpoint, metric, time.perf_counter() - started)
+            return result
+
+        data = response.json()
+        decoded = time.perf_counter() if metrics is not None else 0.0
+        if total_key is None:
+            result = self._unwrap(data, model, key)
+        else:
+            data[key] = self._unwrap(data, model, key)
+            result = data
+        if metrics is not None:
+            metrics.observe(endpoint, DECODE_TIME, decoded - started)
+            if model is not None:
+                metrics.observe(endpoint, VALIDATE_TIME, time.perf_counter() - decoded)
+        return result
+
+    def _parse(
+        self, response: Any, model: APIObject | None = None, key: str | None = None, endpoint: str | None = None
+    ) -> Any:
+        """Decodes the response body and wraps its payload into the model.
+
+        Responses restored from a persistent cache may be reused by several calls. Models built
+        from such responses are memoized on them, so an unchanged response is parsed only once.
+        Every call gets its own list or dict, while the model instances in it are shared.
+
+        Args:
+            response (Any): The response of the API server.
+            model (APIObject | None): The model class to wrap the payload into.
+            key (str | None): The key of the response envelope under which the payload is stored.
+            endpoint (str | None): The endpoint template of the resource, for the metrics.
+
+        Returns:
+            Any: The wrapped model instance(s) or the raw payload.
+        """
+        parsed = getattr(response, "parsed", None)
+        if parsed is None:
+            return self._decode(response, model, key, endpoint=endpoint)
+
+        memo_key = (model, key)
+        if memo_key not in parsed:
+            parsed[memo_key] = self._decode(response, model, key, endpoint=endpoint)
+        return self._own(parsed[memo_key])
+
+    @staticmethod
+    def _own(result: Any) -> Any:
+        """Returns a shallow copy of a shared list or dict result, so that every caller may change its own."""
+        return copy(result) if isinstance(result, (list, dict)) else result
+
+    def _request(
+        self,
+        resource: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        endpoint: str | None = None,
+    ) -> Any:
+        """Sends a GET request to the resource.
+
+        Args:
+            resource (str): The path of the API resource, relative to the server URL.
+            token (Token | TokenType | str | None): The access token to authorize the request with,
+                or the type of the token to pick from the pool.
+            params (dict[str, Any] | None): Query parameters of the request.
+            deadline (Deadline | None): The deadline of the API call the request belongs to.
+            priority (str | None): The priority class of the request, used by the request scheduler.
+            endpoint (str | None): The endpoint template of the resource, used by the cache and the metrics.
+
+        Returns:
+            Any: The response of the API server.
+        """
+        return self._http.get(
+            url=resource, params=params, deadline=deadline, priority=priority, endpoint=endpoint, token=token
+        )
+
+    def _start_deadline(self, params: dict[str, Any]) -> Deadline | None:
+        """Pops the `deadline` argument of an API call from its parameters and starts the deadline."""
+        return self._http.make_deadline(params.pop("deadline", None))
+
+    @staticmethod
+    def _result_model(model: APIObject | None, params: dict[str, Any]) -> Any:
+        """Pops the `lazy` argument of an API call from its parameters and resolves the class of the results.
+
+        Returns:
+            Any: The lazy view class of the model if `lazy` is true, otherwise the model itself.
+        """
+        lazy = params.pop("lazy", False)
+        if lazy and isinstance(model, type) and issubclass(model, APIObject):
+            return view_class(model)
+        return model
+
+    def _fetch(
+        self,
+        resource: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        model: APIObject | None = None,
+        key: str | None = None,
+        endpoint: str | None = None,
+    ) -> Any:
+        """Sends a GET request to the resource and wraps the response body into the model.
+
+        Args:
+            resource (str): The path of the API resource, relative to the server URL.
+            token (Token | TokenType | str | None): The access token to authorize the request with,
+                or the type of the token to pick from the pool.
+            params (dict[str, Any] | None): Query parameters of the request. A `deadline` parameter
+                limits the duration of the call, in seconds, a true `lazy` parameter returns lazy
+                views of the model (see `ModelView`) instead of model instances, and a `priority`
+                parameter sets the class of the request in the request scheduler. None of them is sent.
+            model (APIObject | None): The model class to wrap the response payload into.
+            key (str | None): The key of the response envelope under which the payload is stored.
+            endpoint (str | None): The endpoint template of the resource, used by the cache and the metrics.
+
+        Returns:
+            Any: The wrapped model instance(s) or the raw payload.
+        """
+        params = dict(params or {})
+        deadline = self._start_deadline(params)
+        priority = params.pop("priority", None)
+        model = self._result_model(model, params)
+
+        def fetch() -> Any:
+            response = self._request(resource, token, params, deadline, priority, endpoint)
+            return self._parse(response, model, key, endpoint)
+
+        single_flight = self._http.single_flight
+        if single_flight is None:
+            return fetch()
+
+        result = single_flight.do(self._flight_key(resource, token, params, model, key), fetch, deadline)
+        return self._own(result)
+
+    @staticmethod
+    def _flight_key(
+        resource: str,
+        token: Token | TokenType | str | None,
+        params: dict[str, Any] | None,
+        model: APIObject | None,
+        key: str | None,
+    ) -> tuple:
+        """Builds the key identifying identical API calls for request coalescing.
+
+        Calls authorized by the token pool are keyed by the token type rather than by the token picked
+        for them, so identical calls coalesce however many tokens the pool holds.
+        """
+        query = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return (resource.strip("/"), query, token, model, key)
+
+    @staticmethod
+    def _split_page(
+        data: dict[str, Any], key: str, total_key: str, offset: int, limit: int
+    ) -> tuple[list[APIObject], int | None]:
+        """Extracts the items of a page and calculates the offset of the next page.
+
+        Args:
+            data (dict[str, Any]): The decoded body of the page, with the items wrapped into the model.
+            key (str): The key under which the page items are stored.
+            total_key (str): The key under which the total number of items is stored.
+            offset (int): The offset of the current page.
+            limit (int): The requested page size.
+
+        Returns:
+            tuple[list[APIObject], int | None]: The items of the page and the offset of the next page,
+                or None if the current page is the last one.
+        """
+        items = data[key]
+        offset += len(items)
+        total = data.get(total_key)
+        if len(items) < limit or not items or (total is not None and offset >= total):
+            return items, None
+        return items, offset
+
+    def _paginate(
+        self,
+        resource: str,
+        model: APIObject,
+        key: str,
+        total_key: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+        endpoint: str | None = None,
+    ) -> Iterator[APIObject]:
+        """Lazily iterates over all items of a paginated resource.
+
+        Pages are requested with the largest allowed page size, unless `limit` is passed in `params`.
+        Only one page of raw data is kept in memory at a time. A `deadline` passed in `params` limits
+        the duration of the whole iteration, in seconds, a true `lazy` yields lazy views of the model,
+        and a `priority` sets the class of the requests in the request scheduler.
+
+        Args:
+            resource (str): The path of the API resource, relative to the server URL.
+            model (APIObject): The model class to wrap every item into.
+            key (str): The key under which the page items are stored.
+            total_key (str): The key under which the total number of items is stored.
+            token (Token | TokenType | str | None): The access token to authorize the requests with,
+                or the type of the token to pick from the pool.
+            params (dict[str, Any] | None): Query parameters of the requests.
+            prefetch (bool): Whether to request the next page in the background while
+                the current one is being consumed.
+            endpoint (str | None): The endpoint template of the resource, used by the cache and the metrics.
+
+        Yields:
+            APIObject: The wrapped items, one by one.
+        """
+        params = dict(params or {})
+        limit = int(params.pop("limit", MAX_PAGE_LIMIT))
+        offset = int(params.pop("offset", 0))
+        deadline = self._start_deadline(params)
+        priority = params.pop("priority", None)
+        model = self._result_model(model, params)
+
+        def page(offset: int) -> dict[str, Any]:
+            page_params = {**params, "offset": offset, "limit": limit}
+            response = self._request(resource, token, page_params, deadline, priority, endpoint)
+            return self._decode(response, model, key, total_key, endpoint)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            data = page(offset)
+            while True:
+                items, offset = self._split_page(data, key, total_key, offset, limit)
+                pending = executor.submit(page, offset) if executor and offset is not None else None
+                for item in items:
+                    yield item
+                if offset is None:
+                    return
+                data = pending.result() if pending else page(offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _batch(
+        self, func: Callable[[Hashable], Any], keys: Iterable[Hashable], max_workers: int, ordered: bool
+    ) -> BatchResult:
+        """Runs a single-item method for many keys concurrently, collecting per-item errors.
+
+        Args:
+            func (Callable[[Hashable], Any]): The function making the request for a single key.
+            keys (Iterable[Hashable]): The names or identifiers to make the requests for.
+            max_workers (int): The maximum number of requests running at the same time.
+            ordered (bool): Whether to return the items in the order of the keys.
+
+        Returns:
+            BatchResult: The outcomes of all requests.
+        """
+        return run_batch(func, keys, max_workers=max_workers, ordered=ordered)
+
+    def _take_new(
+        self, lots: Iterator[AuctionRedeemedLot], watermarks: HistoryWatermarks, key: tuple[str, str]
+    ) -> list[AuctionRedeemedLot]:
+        """Consumes a newest-first stream of sales until it reaches the watermark.
+
+        Args:
+            lots (Iterator[AuctionRedeemedLot]): The sales, newest first.
+            watermarks (HistoryWatermarks): The watermarks to check the sales against and to advance.
+            key (tuple[str, str]): The key of the watermark.
+
+        Returns:
+            list[AuctionRedeemedLot]: The sales made since the watermark, newest first.
+        """
+        delta = HistoryDelta(watermarks.get(*key))
+        try:
+            for lot in lots:
+                if not delta.add(lot):
+                    break
+        finally:
+            lots.close()
+        watermarks.advance(key, delta.lots)
+        return delta.lots
+
+    def _check_token(self, token_type: TokenType, kwargs: dict[str, Any]) -> None:
+        """Ensures a token of the type is available without picking one.
+
+        Batch methods check the token once up front, while every request of the batch
+        picks its own token, so requests are spread across all tokens of the pool.
+
+        Raises:
+            MissingTokenError: If no token is passed in `kwargs` and none of the type is stored.
+        """
+        if not kwargs.get("token") and token_type not in self._tokens:
+            raise MissingTokenError(
+                f"This method requires an access token of type '{token_type}' to complete the request."
+            )
+
     @classmethod
     def _required_token(cls, token_type: TokenType) -> callable:
         """A decorator to ensure that the required token is provided before executing the method.
@@ -64,12 +449,15 @@ class MethodsGroup:
             def wrapper(self, *args, **kwargs):
                 token = kwargs.pop("token", None)
                 if not token:
-                    try:
-                        token = self._tokens[token_type]
-                    except KeyError:
+                    if token_type not in self._tokens:
                         raise MissingTokenError(
                             f"This method requires an access token of type '{token_type}' to complete the request."
                         )
+                    # The token itself is picked from the pool when the request is sent.
+                    token = token_type
+                elif not isinstance(token, Token):
+                    # Explicit tokens carry their type, so their responses are cached per token type too.
+                    token = Token(token, token_type)
 
                 return func(self, token=token, *args, **kwargs)
 
@@ -77,16 +465,6 @@ class MethodsGroup:
 
         return decorator
 
-    @property
-    def group_name(self) -> str:
-        """Returns the name of the group, derived from the class name.
-
-        Returns:
-            str: The name of the method group.
-        """
-        print(type(self).__name__)
-        return type(self).__name__.replace("Methods", "").lower()
-
 
 class RegionsMethods(MethodsGroup):
     def get_all(self, **kwargs) -> list[Region]:
@@ -100,8 +478,7 @@ class RegionsMethods(MethodsGroup):
         """
         resource = f"/{self.group_name}"
         kwargs.pop("token", None)  # To avoid throwing the token into the request
-        response = self._http.get(url=resource, params=kwargs)
-        return response
+        return self._fetch(resource, endpoint="regions", params=kwargs, model=Region)
 
 
 class EmissionsMethods(MethodsGroup):
@@ -118,10 +495,14 @@ class EmissionsMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name[:-1]}"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json(), Emission)
+        resource = self._item_path
+        return self._fetch(
+            resource,
+            endpoint="{region}/emission",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=Emission,
+        )
 
 
 class FriendsMethods(MethodsGroup):
@@ -139,10 +520,13 @@ class FriendsMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name}/{character_name}"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return response.json()
+        resource = f"{self._path}/{character_name}"
+        return self._fetch(
+            resource,
+            endpoint="{region}/friends/{character}",
+            token=kwargs.pop("token"),
+            params=kwargs,
+        )
 
 
 class AuctionMethods(MethodsGroup):
@@ -160,10 +544,42 @@ class AuctionMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name}/{item_id}/history"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json()["prices"], AuctionRedeemedLot)
+        resource = f"{self._path}/{item_id}/history"
+        return self._fetch(
+            resource,
+            endpoint="{region}/auction/{item}/history",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=AuctionRedeemedLot,
+            key="prices",
+        )
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def get_history_columns(self, item_id: str, **kwargs) -> PriceHistory:
+        """Retrieves the history of a specific item in the auction as a columnar `PriceHistory`.
+
+        The same request as `get_item_history` is sent, but the lots are stored in NumPy arrays
+        instead of one object per lot. Requires `numpy` to be installed.
+
+        Args:
+            item_id (str): The unique identifier of the item for which to fetch the history.
+            **kwargs: Additional arguments that can be passed to modify the request.
+
+        Returns:
+            PriceHistory: The columnar price history of the item.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        resource = f"{self._path}/{item_id}/history"
+        return self._fetch(
+            resource,
+            endpoint="{region}/auction/{item}/history",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=PriceHistory,
+            key="prices",
+        )
 
     @MethodsGroup._required_token(TokenType.APPLICATION)
     def get_item_lots(self, item_id: str, **kwargs) -> list[AuctionLot]:
@@ -179,10 +595,148 @@ class AuctionMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name}/{item_id}/lots"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json()["lots"], AuctionLot)
+        resource = f"{self._path}/{item_id}/lots"
+        return self._fetch(
+            resource,
+            endpoint="{region}/auction/{item}/lots",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=AuctionLot,
+            key="lots",
+        )
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def get_lots_columns(self, item_id: str, **kwargs) -> LotBook:
+        """Retrieves the auction lots for a specific item as a columnar `LotBook`.
+
+        The same request as `get_item_lots` is sent, but the lots are stored in NumPy arrays
+        instead of one object per lot. Requires `numpy` to be installed.
+
+        Args:
+            item_id (str): The unique identifier of the item for which to fetch the auction lots.
+            **kwargs: Additional arguments that can be passed to modify the request.
+
+        Returns:
+            LotBook: The columnar auction lots of the item.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        resource = f"{self._path}/{item_id}/lots"
+        return self._fetch(
+            resource,
+            endpoint="{region}/auction/{item}/lots",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=LotBook,
+            key="lots",
+        )
+
+    def get_items_lots(
+        self,
+        item_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchResult:
+        """Retrieves the auction lots of many items concurrently, as columnar `LotBook` objects.
+
+        The books of the successful requests are joined with `LotBook.concat(result.values.values())`.
+
+        Args:
+            item_ids (Iterable[str]): The unique identifiers of the items for which to fetch the auction lots.
+            max_workers (int): The maximum number of requests running at the same time.
+            ordered (bool): Whether to return the results in the order of `item_ids`,
+                rather than in the order the requests completed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Returns:
+            BatchResult: `BatchItem` objects holding a `LotBook` object or the error of each request.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        self._check_token(TokenType.APPLICATION, kwargs)
+        return self._batch(partial(self.get_lots_columns, **kwargs), item_ids, max_workers, ordered)
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def iter_history(self, item_id: str, prefetch: bool = False, **kwargs) -> Iterator[AuctionRedeemedLot]:
+        """Lazily iterates over the whole price history of a specific item, page by page.
+
+        Args:
+            item_id (str): The unique identifier of the item for which to fetch the history.
+            prefetch (bool): Whether to request the next page while the current one is being consumed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Yields:
+            AuctionRedeemedLot: The redeemed lots of the item, one by one.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        resource = f"{self._path}/{item_id}/history"
+        return self._paginate(
+            resource,
+            endpoint="{region}/auction/{item}/history",
+            model=AuctionRedeemedLot,
+            key="prices",
+            total_key="total",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            prefetch=prefetch,
+        )
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def iter_lots(self, item_id: str, prefetch: bool = False, **kwargs) -> Iterator[AuctionLot]:
+        """Lazily iterates over all active auction lots of a specific item, page by page.
+
+        Args:
+            item_id (str): The unique identifier of the item for which to fetch the auction lots.
+            prefetch (bool): Whether to request the next page while the current one is being consumed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Yields:
+            AuctionLot: The active lots of the item, one by one.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        resource = f"{self._path}/{item_id}/lots"
+        return self._paginate(
+            resource,
+            endpoint="{region}/auction/{item}/lots",
+            model=AuctionLot,
+            key="lots",
+            total_key="total",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            prefetch=prefetch,
+        )
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def sync_history(
+        self, item_id: str, watermarks: HistoryWatermarks, **kwargs
+    ) -> list[AuctionRedeemedLot]:
+        """Retrieves only the sales of a specific item made since the previous sync.
+
+        The history is paged from the newest sale and the paging stops as soon as a sale older
+        than the watermark of the item is reached, so the cost of a sync is proportional to the
+        number of new trades. The first sync of an item fetches its whole history. Sales recorded
+        during the sync shift the pages, so the sales a page repeats are skipped (see `HistoryDelta`).
+
+        Args:
+            item_id (str): The unique identifier of the item for which to sync the history.
+            watermarks (HistoryWatermarks): The watermarks of the synced items, advanced by the call.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Returns:
+            list[AuctionRedeemedLot]: The new sales of the item, newest first.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        lots = self.iter_history(item_id, **kwargs)
+        return self._take_new(lots, watermarks, watermarks.make_key(self.region, item_id))
 
 
 class CharactersMethods(MethodsGroup):
@@ -199,10 +753,14 @@ class CharactersMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name}"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json(), CharacterInfo)
+        resource = self._path
+        return self._fetch(
+            resource,
+            endpoint="{region}/characters",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=CharacterInfo,
+        )
 
     @MethodsGroup._required_token(TokenType.APPLICATION)
     def get_profile(self, character_name: str, **kwargs) -> FullCharacterInfo:
@@ -218,10 +776,39 @@ class CharactersMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name[:-1]}/by-name/{character_name}/profile"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json(), FullCharacterInfo)
+        resource = f"{self._item_path}/by-name/{character_name}/profile"
+        return self._fetch(
+            resource,
+            endpoint="{region}/character/by-name/{character}/profile",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=FullCharacterInfo,
+        )
+
+    def get_profiles(
+        self,
+        character_names: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchResult:
+        """Retrieves the full profiles of many characters concurrently.
+
+        Args:
+            character_names (Iterable[str]): The names of the characters whose profiles are to be fetched.
+            max_workers (int): The maximum number of requests running at the same time.
+            ordered (bool): Whether to return the results in the order of `character_names`,
+                rather than in the order the requests completed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Returns:
+            BatchResult: `BatchItem` objects holding a `FullCharacterInfo` object or the error of each request.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        self._check_token(TokenType.APPLICATION, kwargs)
+        return self._batch(partial(self.get_profile, **kwargs), character_names, max_workers, ordered)
 
 
 class ClansMethods(MethodsGroup):
@@ -239,10 +826,14 @@ class ClansMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name[:-1]}/{clan_id}/info"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json(), Clan)
+        resource = f"{self._item_path}/{clan_id}/info"
+        return self._fetch(
+            resource,
+            endpoint="{region}/clan/{clan-id}/info",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=Clan,
+        )
 
     @MethodsGroup._required_token(TokenType.USER)
     def get_members(self, clan_id: str, **kwargs) -> list[ClanMember]:
@@ -258,10 +849,14 @@ class ClansMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name[:-1]}/{clan_id}/members"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json(), ClanMember)
+        resource = f"{self._item_path}/{clan_id}/members"
+        return self._fetch(
+            resource,
+            endpoint="{region}/clan/{clan-id}/members",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=ClanMember,
+        )
 
     @MethodsGroup._required_token(TokenType.APPLICATION)
     def get_all(self, **kwargs) -> list[Clan]:
@@ -276,15 +871,275 @@ class ClansMethods(MethodsGroup):
         Raises:
             MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
         """
-        resource = f"{self.region}/{self.group_name}"
-        headers = {"Authorization": f"Bearer {kwargs.pop('token')}"}
-        response = self._http.get(url=resource, headers=headers, params=kwargs)
-        return self.wrap_data(response.json()["data"], Clan)
+        resource = self._path
+        return self._fetch(
+            resource,
+            endpoint="{region}/clans",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            model=Clan,
+            key="data",
+        )
+
+    @MethodsGroup._required_token(TokenType.APPLICATION)
+    def iter_all(self, prefetch: bool = False, **kwargs) -> Iterator[Clan]:
+        """Lazily iterates over all clans in the current region, page by page.
+
+        Args:
+            prefetch (bool): Whether to request the next page while the current one is being consumed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Yields:
+            Clan: The clans of the region, one by one.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        resource = self._path
+        return self._paginate(
+            resource,
+            endpoint="{region}/clans",
+            model=Clan,
+            key="data",
+            total_key="totalClans",
+            token=kwargs.pop("token"),
+            params=kwargs,
+            prefetch=prefetch,
+        )
+
+    def get_infos(
+        self,
+        clan_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchResult:
+        """Retrieves information about many clans concurrently.
+
+        Args:
+            clan_ids (Iterable[str]): The unique identifiers of the clans whose information is to be fetched.
+            max_workers (int): The maximum number of requests running at the same time.
+            ordered (bool): Whether to return the results in the order of `clan_ids`,
+                rather than in the order the requests completed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Returns:
+            BatchResult: `BatchItem` objects holding a `Clan` object or the error of each request.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        self._check_token(TokenType.APPLICATION, kwargs)
+        return self._batch(partial(self.get_info, **kwargs), clan_ids, max_workers, ordered)
+
+    def get_members_for(
+        self,
+        clan_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchResult:
+        """Retrieves the members of many clans concurrently.
+
+        Args:
+            clan_ids (Iterable[str]): The unique identifiers of the clans whose members are to be fetched.
+            max_workers (int): The maximum number of requests running at the same time.
+            ordered (bool): Whether to return the results in the order of `clan_ids`,
+                rather than in the order the requests completed.
+            **kwargs: Additional arguments that can be passed to modify the requests.
+
+        Returns:
+            BatchResult: `BatchItem` objects holding a list of `ClanMember` objects or the error of each request.
+
+        Raises:
+            MissingTokenError: If the required `token` is not provided or is missing from the `_tokens` attribute.
+        """
+        self._check_token(TokenType.USER, kwargs)
+        return self._batch(partial(self.get_members, **kwargs), clan_ids, max_workers, ordered)
+
+
+class AsyncMethodsGroup(MethodsGroup):
+    """A mixin that turns the methods of a `MethodsGroup` subclass into coroutines.
+
+    The request building, token resolution and data wrapping are inherited from the synchronous
+    method group, only the transport is replaced. As a result, calling any method of an async
+    method group returns an awaitable that resolves to exactly the same objects as the synchronous one.
+    """
+
+    __slots__ = ()
+
+    async def _request(
+        self,
+        resource: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+        priority: str | None = None,
+        endpoint: str | None = None,
+    ) -> Any:
+        return await self._http.get(
+            url=resource, params=params, deadline=deadline, priority=priority, endpoint=endpoint, token=token
+        )
+
+    async def _fetch(
+        self,
+        resource: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        model: APIObject | None = None,
+        key: str | None = None,
+        endpoint: str | None = None,
+    ) -> Any:
+        params = dict(params or {})
+        deadline = self._start_deadline(params)
+        priority = params.pop("priority", None)
+        model = self._result_model(model, params)
+        single_flight = self._http.single_flight
+        if single_flight is None:
+            response = await self._request(resource, token, params, deadline, priority, endpoint)
+            return self._parse(response, model, key, endpoint)
+
+        async def fetch() -> Any:
+            response = await self._request(resource, token, params, deadline, priority, endpoint)
+            return self._parse(response, model, key, endpoint)
+
+        result = await single_flight.do(self._flight_key(resource, token, params, model, key), fetch, deadline)
+        return self._own(result)
+
+    async def _paginate(
+        self,
+        resource: str,
+        model: APIObject,
+        key: str,
+        total_key: str,
+        token: Token | TokenType | str | None = None,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+        endpoint: str | None = None,
+    ) -> AsyncIterator[APIObject]:
+        params = dict(params or {})
+        limit = int(params.pop("limit", MAX_PAGE_LIMIT))
+        offset = int(params.pop("offset", 0))
+        deadline = self._start_deadline(params)
+        priority = params.pop("priority", None)
+        model = self._result_model(model, params)
+
+        async def fetch(offset: int) -> dict[str, Any]:
+            page_params = {**params, "offset": offset, "limit": limit}
+            response = await self._request(resource, token, page_params, deadline, priority, endpoint)
+            return self._decode(response, model, key, total_key, endpoint)
+
+        def page(offset: int) -> asyncio.Future:
+            return asyncio.ensure_future(fetch(offset))
+
+        pending = page(offset)
+        try:
+            while True:
+                items, offset = self._split_page(await pending, key, total_key, offset, limit)
+                pending = page(offset) if prefetch and offset is not None else None
+                for item in items:
+                    yield item
+                if offset is None:
+                    return
+                pending = pending or page(offset)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def _batch(
+        self,
+        func: Callable[[Hashable], Awaitable[Any]],
+        keys: Iterable[Hashable],
+        max_workers: int,
+        ordered: bool,
+    ) -> BatchResult:
+        return await run_batch_async(func, keys, max_workers=max_workers, ordered=ordered)
+
+    async def _take_new(
+        self, lots: AsyncIterator[AuctionRedeemedLot], watermarks: HistoryWatermarks, key: tuple[str, str]
+    ) -> list[AuctionRedeemedLot]:
+        delta = HistoryDelta(watermarks.get(*key))
+        try:
+            async for lot in lots:
+                if not delta.add(lot):
+                    break
+        finally:
+            await lots.aclose()
+        watermarks.advance(key, delta.lots)
+        return delta.lots
+
+
+class RegionFanOut:
+    """Calls the methods of a method group in every region concurrently.
+
+    Returned by `MethodsGroupFabric.all_regions`. Calling a method runs it once per region and
+    returns a `BatchResult` keyed by region identifier, so a failure in one region does not affect
+    the others. Lazy iterators, such as those of `iter_*` methods, are consumed into lists.
+
+    .. code-block:: python
+
+        result = api.clans.all_regions().get_all(limit=10)
+        for region, clan in result.merged():
+            print(region, clan.name)
+        print(result.errors)
+    """
+
+    __slots__ = ("_fabric", "_regions", "max_workers")
+
+    def __init__(
+        self, fabric: "MethodsGroupFabric", regions: Iterable[str] | None, max_workers: int
+    ) -> None:
+        self._fabric = fabric
+        self._regions = list(regions) if regions is not None else None
+        self.max_workers = max_workers
+
+    def _call(self, name: str, args: tuple, kwargs: dict[str, Any]) -> BatchResult:
+        def call(region: str) -> Any:
+            value = getattr(self._fabric(region), name)(*args, **kwargs)
+            return list(value) if isinstance(value, Iterator) else value
+
+        regions = self._regions if self._regions is not None else self._fabric.region_ids()
+        return run_batch(call, regions, max_workers=self.max_workers, ordered=True)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(self._fabric._group_class, name, None)):
+            raise AttributeError(f"'{self._fabric._group_class.__name__}' has no method '{name}'")
+
+        @wraps(getattr(self._fabric._group_class, name))
+        def method(*args, **kwargs) -> Any:
+            return self._call(name, args, kwargs)
+
+        return method
+
+
+class AsyncRegionFanOut(RegionFanOut):
+    """The asynchronous counterpart of `RegionFanOut`, whose methods return coroutines."""
+
+    __slots__ = ()
+
+    async def _call(self, name: str, args: tuple, kwargs: dict[str, Any]) -> BatchResult:
+        async def call(region: str) -> Any:
+            value = getattr(self._fabric(region), name)(*args, **kwargs)
+            if isinstance(value, AsyncIterator):
+                return [item async for item in value]
+            return await value
+
+        regions = self._regions if self._regions is not None else await self._fabric.region_ids()
+        return await run_batch_async(call, regions, max_workers=self.max_workers, ordered=True)
 
 
 class MethodsGroupFabric:
-    __slots__ = ("_group_class", "_tokens", "_http")
+    """Creates the method groups of one name, bound to a region.
+
+    Groups are stateless apart from their region, so the group of every region is created once and
+    reused by the following calls, up to `MAX_BOUND_REGIONS` regions.
+    """
+
+    __slots__ = ("_group_class", "_tokens", "_http", "_groups")
 
+    MAX_BOUND_REGIONS = 64
+
+    _fan_out_class = RegionFanOut
     _method_groups = {
         "regions": RegionsMethods,
         "emissions": EmissionsMethods,
@@ -294,13 +1149,78 @@ class MethodsGroupFabric:
         "clans": ClansMethods,
     }
 
-    def __init__(self, group: str, http: APISession, tokens: dict[TokenType, str]) -> None:
+    def __init__(self, group: str, http: APISession, tokens: TokenPool) -> None:
         try:
             self._group_class = self._method_groups[group]
             self._tokens = tokens
             self._http = http
         except KeyError:
             raise InvalidMethodGroup(group=group)
+        self._groups: dict[str | None, MethodsGroup] = {}
 
     def __call__(self, region: str | None = None) -> MethodsGroup:
-        return self._group_class(region, self._http, self._tokens)
+        try:
+            return self._groups[region]
+        except KeyError:
+            group = self._group_class(region, self._http, self._tokens)
+            if len(self._groups) < self.MAX_BOUND_REGIONS:
+                self._groups[region] = group
+            return group
+
+    def region_ids(self) -> list[str]:
+        """Returns the identifiers of all regions of the server, requested once and then cached.
+
+        Returns:
+            list[str]: The region identifiers.
+        """
+        key = self._http.server_url
+        with _region_ids_lock:
+            region_ids = _region_ids.get(key)
+        if region_ids is None:
+            regions = self._method_groups["regions"](None, self._http, self._tokens).get_all()
+            region_ids = self._cache_region_ids(key, regions)
+        return region_ids
+
+    @staticmethod
+    def _cache_region_ids(key: str, regions: list[Region]) -> list[str]:
+        region_ids = [region.id for region in regions]
+        with _region_ids_lock:
+            _region_ids[key] = region_ids
+        return region_ids
+
+    def all_regions(
+        self, regions: Iterable[str] | None = None, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> RegionFanOut:
+        """Returns an object calling the methods of the group in every region concurrently.
+
+        Args:
+            regions (Iterable[str] | None): The regions to call the methods in.
+                Defaults to all regions of the server.
+            max_workers (int): The maximum number of requests running at the same time.
+
+        Returns:
+            RegionFanOut: The fan-out object, with the same methods as the group.
+        """
+        return self._fan_out_class(self, regions, max_workers)
+
+
+class AsyncMethodsGroupFabric(MethodsGroupFabric):
+    __slots__ = ()
+
+    _fan_out_class = AsyncRegionFanOut
+    _method_groups = {
+        name: type(f"Async{group.__name__}", (AsyncMethodsGroup, group), {"__slots__": ()})
+        for name, group in MethodsGroupFabric._method_groups.items()
+    }
+
+    def __init__(self, group: str, http: AsyncAPISession, tokens: TokenPool) -> None:
+        super().__init__(group, http, tokens)
+
+    async def region_ids(self) -> list[str]:
+        key = self._http.server_url
+        with _region_ids_lock:
+            region_ids = _region_ids.get(key)
+        if region_ids is None:
+            regions = await self._method_groups["regions"](None, self._http, self._tokens).get_all()
+            region_ids = self._cache_region_ids(key, regions)
+        return region_ids
@@ -0,0 +1,183 @@
+import math
+import threading
+from collections import defaultdict
+from typing import Any
+
+
+LATENCY = "latency"
+"""Time spent waiting for a response of the server, per attempt (in seconds)."""
+SIZE = "size"
+"""Size of the response body (in bytes)."""
+DECODE_TIME = "decode_time"
+"""Time spent decoding the JSON body of a response (in seconds)."""
+VALIDATE_TIME = "validate_time"
+"""Time spent building the models from a response (in seconds). With fast parsing, it includes decoding."""
+
+REQUESTS = "requests"
+"""Counter of API calls, including those answered from the cache."""
+RETRIES = "retries"
+"""Counter of retried requests."""
+ERRORS = "errors"
+"""Counter of requests failed without a response, e.g. because of a connection error."""
+CACHE_HITS = "cache_hits"
+"""Counter of API calls answered from the cache."""
+CACHE_MISSES = "cache_misses"
+"""Counter of API calls that were looked up in the cache, but had to be sent to the server."""
+
+
+class MetricsExporter:
+    """A base class for receivers of the measurements of API calls.
+
+    Measurements are reported per endpoint template (e.g. `{region}/auction/{item}/lots`), so the
+    number of distinct series stays small. Subclasses forward them to a monitoring system; both
+    methods are called from the threads (or the event loop) making the requests and should be fast.
+
+    Status codes are counted as `status.<code>` counters, e.g. `status.200` or `status.429`.
+    """
+
+    def observe(self, endpoint: str, metric: str, value: float) -> None:
+        """Records a measured value, such as a latency or a size.
+
+        Args:
+            endpoint (str): The endpoint template of the request.
+            metric (str): The name of the metric, e.g. `LATENCY`.
+            value (float): The measured value.
+        """
+        raise NotImplementedError
+
+    def increment(self, endpoint: str, metric: str, value: int = 1) -> None:
+        """Increments a counter, such as the number of retries.
+
+        Args:
+            endpoint (str): The endpoint template of the request.
+            metric (str): The name of the counter, e.g. `RETRIES`.
+            value (int): The amount to increment the counter by.
+        """
+        raise NotImplementedError
+
+
+class Histogram:
+    """A histogram with logarithmic buckets, suitable for values of any scale.
+
+    Every bucket spans a quarter of an octave, so quantiles are accurate within about 20%.
+
+    Attributes:
+        count (int): The number of recorded values.
+        total (float): The sum of the recorded values.
+        min (float): The smallest recorded value.
+        max (float): The largest recorded value.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_buckets")
+
+    _RESOLUTION = 4
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._buckets: dict[int, int] = defaultdict(int)
+
+    def add(self, value: float) -> None:
+        """Records a value."""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        index = math.ceil(math.log2(value) * self._RESOLUTION) if value > 0 else -math.inf
+        self._buckets[index] += 1
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the recorded values, or NaN if there are none."""
+        return self.total / self.count if self.count else math.nan
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the recorded values.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The upper bound of the bucket holding the quantile, or NaN if there are no values.
+        """
+        if not self.count:
+            return math.nan
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                bound = 2 ** (index / self._RESOLUTION) if index != -math.inf else 0.0
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Returns the count, the mean, the maximum and the 50th, 95th and 99th percentiles."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else math.nan,
+        }
+
+
+class InMemoryExporter(MetricsExporter):
+    """Keeps histograms and counters of all measurements in memory.
+
+    .. code-block:: python
+
+        metrics = InMemoryExporter()
+        api = API(tokens=app_token, server=Server.PRODUCTION, metrics=metrics)
+        ...
+        for endpoint, stats in metrics.summary().items():
+            print(endpoint, stats["latency"]["p95"], stats["counters"])
+    """
+
+    def __init__(self) -> None:
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._counters: dict[tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, metric: str, value: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get((endpoint, metric))
+            if histogram is None:
+                histogram = self._histograms[(endpoint, metric)] = Histogram()
+            histogram.add(value)
+
+    def increment(self, endpoint: str, metric: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[(endpoint, metric)] += value
+
+    def histogram(self, endpoint: str, metric: str) -> Histogram | None:
+        """Returns the histogram of a metric of an endpoint, or None if nothing has been recorded."""
+        return self._histograms.get((endpoint, metric))
+
+    def counter(self, endpoint: str, metric: str) -> int:
+        """Returns the value of a counter of an endpoint."""
+        return self._counters.get((endpoint, metric), 0)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Returns the statistics of all endpoints.
+
+        Returns:
+            dict[str, dict[str, Any]]: The summaries of the histograms (see `Histogram.summary`) and the
+                `counters` of every endpoint template.
+        """
+        with self._lock:
+            endpoints: dict[str, dict[str, Any]] = defaultdict(lambda: {"counters": {}})
+            for (endpoint, metric), histogram in self._histograms.items():
+                endpoints[endpoint][metric] = histogram.summary()
+            for (endpoint, metric), value in self._counters.items():
+                endpoints[endpoint]["counters"][metric] = value
+        return dict(endpoints)
+
+    def reset(self) -> None:
+        """Discards all recorded measurements."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
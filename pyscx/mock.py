@@ -0,0 +1,436 @@
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qsl, urlsplit
+
+
+DEFAULT_REGIONS = ("RU", "EU", "NA", "SEA")
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 200
+
+_EPOCH = datetime(2025, 2, 11, 12, 0, tzinfo=timezone.utc)
+_RANKS = ("RECRUIT", "COMMONER", "SOLIDER", "SERGANT", "OFFICER", "COLONEL")
+_ALLIANCES = ("duty", "freedom", "bandits", "covenant", "merc", "stalkers")
+_STAT_TYPES = ("INTEGER", "DECIMAL", "DATE", "DURATION")
+
+Route = Callable[[dict[str, str], dict[str, str]], tuple[int, Any] | tuple[int, Any, dict[str, str]]]
+"""A custom endpoint, receiving the query parameters and the request headers and returning
+`(status, payload[, headers])`."""
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class PayloadFactory:
+    """Generates realistic payloads of every STALCRAFT: X API endpoint.
+
+    Payloads follow the shapes returned by the API and are deterministic for a given seed,
+    so the same request always gets the same response.
+
+    Attributes:
+        seed (int): The seed of the generated values.
+    """
+
+    __slots__ = ("seed",)
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+
+    def _random(self, *salt: Any) -> random.Random:
+        return random.Random(f"{self.seed}:{':'.join(map(str, salt))}")
+
+    def region(self, region_id: str) -> dict[str, Any]:
+        return {"id": region_id, "name": f"REGION {region_id}"}
+
+    def emission(self, region: str) -> dict[str, Any]:
+        rnd = self._random("emission", region)
+        previous_start = _EPOCH - timedelta(minutes=rnd.randint(60, 180))
+        return {
+            "previousStart": _timestamp(previous_start),
+            "previousEnd": _timestamp(previous_start + timedelta(minutes=5)),
+        }
+
+    def redeemed_lot(self, item_id: str, index: int) -> dict[str, Any]:
+        """Returns a lot of the price history, lots with greater indexes being older."""
+        rnd = self._random("history", item_id, index)
+        return {
+            "amount": rnd.choice((1, 1, 1, 5, 10, 100)),
+            "price": rnd.randint(1_000, 2_000_000),
+            "time": _timestamp(_EPOCH - timedelta(seconds=index * 37 + rnd.random())),
+            "additional": {"qlt": rnd.randint(0, 5)} if rnd.random() < 0.3 else {},
+        }
+
+    def active_lot(self, item_id: str, index: int) -> dict[str, Any]:
+        rnd = self._random("lots", item_id, index)
+        start_price = rnd.randint(1_000, 1_000_000)
+        start_time = _EPOCH - timedelta(seconds=rnd.randint(0, 12 * 60 * 60))
+        lot = {
+            "itemId": item_id,
+            "amount": rnd.choice((1, 1, 5, 10)),
+            "startPrice": start_price,
+            "buyoutPrice": start_price * rnd.randint(2, 10),
+            "startTime": _timestamp(start_time),
+            "endTime": _timestamp(start_time + timedelta(hours=12)),
+            "additional": {},
+        }
+        if rnd.random() < 0.5:
+            lot["currentPrice"] = start_price + rnd.randint(0, start_price)
+        return lot
+
+    def clan(self, index: int) -> dict[str, Any]:
+        rnd = self._random("clan", index)
+        return {
+            "id": f"{index:08x}-b3d7-4d30-8d08-de874eb1d845",
+            "name": f"Clan #{index}",
+            "tag": f"T{index % 1000:03d}",
+            "level": rnd.randint(1, 10),
+            "levelPoints": rnd.randint(0, 1_000_000),
+            "registrationTime": _timestamp(_EPOCH - timedelta(days=rnd.randint(1, 1000))),
+            "alliance": rnd.choice(_ALLIANCES),
+            "description": "Sample description " * rnd.randint(1, 5),
+            "leader": f"Leader-{index}",
+            "memberCount": rnd.randint(1, 100),
+        }
+
+    def clan_member(self, clan_id: str, index: int) -> dict[str, Any]:
+        rnd = self._random("member", clan_id, index)
+        return {
+            "name": f"Member-{index}" if index else "Leader",
+            "rank": rnd.choice(_RANKS) if index else "LEADER",
+            "joinTime": _timestamp(_EPOCH - timedelta(days=rnd.randint(1, 500))),
+        }
+
+    def character_clan(self, name: str) -> dict[str, Any]:
+        return {"info": self.clan(0), "member": {**self.clan_member("0", 1), "name": name}}
+
+    def user_character(self, index: int) -> dict[str, Any]:
+        name = f"Character-{index}"
+        return {
+            "information": {
+                "id": f"5c7e0994-bc22-4190-9774-{index:012x}",
+                "name": name,
+                "creationTime": _timestamp(_EPOCH - timedelta(days=365 + index)),
+            },
+            "clan": self.character_clan(name),
+        }
+
+    def character_profile(self, name: str, stats: int) -> dict[str, Any]:
+        rnd = self._random("profile", name)
+        return {
+            "username": name,
+            "uuid": "5c7e0994-bc22-4190-9774-5f197b1500e6",
+            "status": rnd.choice(("online", "offline")),
+            "alliance": rnd.choice(_ALLIANCES),
+            "lastLogin": _timestamp(_EPOCH - timedelta(minutes=rnd.randint(0, 10_000))),
+            "displayedAchievements": ["playtime", "kills"],
+            "clan": self.character_clan(name),
+            "stats": [self.character_stat(rnd, index) for index in range(stats)],
+        }
+
+    @staticmethod
+    def character_stat(rnd: random.Random, index: int) -> dict[str, Any]:
+        type = _STAT_TYPES[index % 4]
+        if type == "INTEGER":
+            value = rnd.randint(0, 10**6)
+        elif type == "DECIMAL":
+            value = round(rnd.uniform(0, 100), 2)
+        elif type == "DATE":
+            value = _timestamp(_EPOCH - timedelta(minutes=rnd.randint(0, 10**6)))
+        else:
+            value = rnd.randint(0, 10**9)  # Milliseconds.
+        return {"id": f"stat-{index}", "type": type, "value": {"value": value}}
+
+
+class MockAPIServer:
+    """A local HTTP server imitating the STALCRAFT: X API, for offline tests and benchmarks.
+
+    Every endpoint used by the method groups is served with generated payloads of configurable
+    size (see `PayloadFactory`). Paginated endpoints honour `limit` and `offset` like the real API,
+    requests without an `Authorization` header are rejected, and an optional per-token quota
+    answers with 429 and the `X-RateLimit-*` headers once exhausted. Latency is added to every
+    response, either fixed or uniformly drawn from a `(min, max)` range.
+
+    Encoded responses are cached, so the server itself stays cheap compared to the client.
+
+    Any path can be given a custom response in `routes`, either a fixed JSON payload served with 200
+    or a `Route` callable, e.g. to answer with errors or `304 Not Modified`. Custom routes take
+    precedence over the generated endpoints and skip their authorization, quota and region checks.
+
+    .. code-block:: python
+
+        with MockAPIServer(history_size=10_000, latency=0.005) as server:
+            api = API(tokens=app_token, server=Server.DEMO, base_url=server.url)
+            history = list(api.auction(region="EU").iter_history(item_id="1kv2"))
+
+    Attributes:
+        url (str): The base URL of the server, to be passed as `base_url` to the API client.
+        routes (dict[str, Any | Route]): Custom responses, keyed by request path.
+        calls (list[tuple[str, dict[str, str], dict[str, str]]]): The path, the query parameters and
+            the headers of every received request, if `record` is enabled.
+        requests (int): The number of requests received.
+        rejected (int): The number of requests answered with 429.
+    """
+
+    def __init__(
+        self,
+        history_size: int = 1000,
+        lots_size: int = 200,
+        clans_size: int = 500,
+        members_size: int = 50,
+        friends_size: int = 20,
+        characters_size: int = 3,
+        stats_size: int = 50,
+        regions: tuple[str, ...] = DEFAULT_REGIONS,
+        latency: float | tuple[float, float] = 0.0,
+        quota: int | None = None,
+        quota_window: float = 60.0,
+        seed: int = 0,
+        routes: Mapping[str, Any | Route] | None = None,
+        generate: bool = True,
+        record: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initializes the server, without starting it.
+
+        Args:
+            history_size (int): The number of lots in the price history of every item.
+            lots_size (int): The number of active lots of every item.
+            clans_size (int): The number of clans in every region.
+            members_size (int): The number of members of every clan.
+            friends_size (int): The number of friends of every character.
+            characters_size (int): The number of characters of the user.
+            stats_size (int): The number of statistics in every character profile.
+            regions (tuple[str, ...]): The identifiers of the served regions.
+            latency (float | tuple[float, float]): The delay added to every response, in seconds,
+                or the bounds of a uniformly distributed delay.
+            quota (int | None): The number of requests allowed per token within `quota_window`.
+                Unlimited by default.
+            quota_window (float): The duration of a quota window, in seconds.
+            seed (int): The seed of the generated payloads.
+            routes (Mapping[str, Any | Route] | None): Custom responses, keyed by request path.
+            generate (bool): Whether paths without a custom route are served with generated payloads.
+                Otherwise they are answered with 404.
+            record (bool): Whether every received request is recorded in `calls`.
+            host (str): The address to listen on.
+            port (int): The port to listen on. A free port is chosen by default.
+        """
+        self.history_size = history_size
+        self.lots_size = lots_size
+        self.clans_size = clans_size
+        self.members_size = members_size
+        self.friends_size = friends_size
+        self.characters_size = characters_size
+        self.stats_size = stats_size
+        self.regions = tuple(region.upper() for region in regions)
+        self.latency = latency
+        self.quota = quota
+        self.quota_window = quota_window
+        self.payloads = PayloadFactory(seed)
+        self.routes: dict[str, Any | Route] = dict(routes or {})
+        self.generate = generate
+        self.record = record
+        self.calls: list[tuple[str, dict[str, str], dict[str, str]]] = []
+        self.requests = 0
+        self.rejected = 0
+
+        self._lock = threading.Lock()
+        self._bodies: dict[tuple[str, int, int], bytes] = {}
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._routes: list[tuple[re.Pattern, Callable[..., tuple[int, Any]]]] = [
+            (re.compile(r"/regions"), self._regions),
+            (re.compile(r"/(?P<region>\w+)/emission"), self._emission),
+            (re.compile(r"/(?P<region>\w+)/friends/(?P<name>[^/]+)"), self._friends),
+            (re.compile(r"/(?P<region>\w+)/auction/(?P<item>[^/]+)/history"), self._history),
+            (re.compile(r"/(?P<region>\w+)/auction/(?P<item>[^/]+)/lots"), self._lots),
+            (re.compile(r"/(?P<region>\w+)/characters"), self._characters),
+            (re.compile(r"/(?P<region>\w+)/character/by-name/(?P<name>[^/]+)/profile"), self._profile),
+            (re.compile(r"/(?P<region>\w+)/clan/(?P<clan>[^/]+)/info"), self._clan),
+            (re.compile(r"/(?P<region>\w+)/clan/(?P<clan>[^/]+)/members"), self._members),
+            (re.compile(r"/(?P<region>\w+)/clans"), self._clans),
+        ]
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self.url = f"http://{host}:{self._httpd.server_address[1]}"
+        self._thread: threading.Thread | None = None
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                status, body, headers = server.respond(self.path, dict(self.headers))
+                self.send_response(status)
+                if body:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+    def respond(self, path: str, request_headers: Mapping[str, str]) -> tuple[int, bytes, dict[str, str]]:
+        """Builds the response to a request, waiting for the configured latency.
+
+        Args:
+            path (str): The requested path, including the query string.
+            request_headers (Mapping[str, str]): The headers of the request.
+
+        Returns:
+            tuple[int, bytes, dict[str, str]]: The status code, the body and the extra headers.
+        """
+        latency = self.latency
+        delay = random.uniform(*latency) if isinstance(latency, tuple) else latency
+        if delay > 0:
+            time.sleep(delay)
+
+        url = urlsplit(path)
+        params = dict(parse_qsl(url.query))
+        with self._lock:
+            self.requests += 1
+            if self.record:
+                self.calls.append((url.path, params, dict(request_headers)))
+
+        custom = self.routes.get(url.path)
+        if custom is not None:
+            return self._respond_custom(custom, params, request_headers)
+
+        route = next(
+            ((handler, match) for pattern, handler in self._routes if (match := pattern.fullmatch(url.path))),
+            None,
+        )
+        if route is None or not self.generate:
+            return 404, b'{"title": "Not Found"}', {}
+        handler, match = route
+
+        authorization = request_headers.get("Authorization")
+        headers: dict[str, str] = {}
+        if handler != self._regions:
+            if authorization is None:
+                return 401, b'{"title": "Unauthorized"}', {}
+            if self.quota is not None:
+                allowed, headers = self._consume(authorization)
+                if not allowed:
+                    with self._lock:
+                        self.rejected += 1
+                    return 429, b'{"title": "Too Many Requests"}', headers
+            if match["region"].upper() not in self.regions:
+                return 404, b'{"title": "Region Not Found"}', headers
+
+        try:
+            limit = min(int(params.get("limit", DEFAULT_PAGE_LIMIT)), MAX_PAGE_LIMIT)
+            offset = int(params.get("offset", 0))
+        except ValueError:
+            return 400, b'{"title": "Bad Request"}', headers
+
+        key = (url.path, offset, limit)
+        body = self._bodies.get(key)
+        if body is None:
+            body = json.dumps(handler(offset=offset, limit=limit, **match.groupdict())).encode()
+            with self._lock:
+                self._bodies[key] = body
+        return 200, body, headers
+
+    @staticmethod
+    def _respond_custom(
+        route: Any | Route, params: dict[str, str], request_headers: Mapping[str, str]
+    ) -> tuple[int, bytes, dict[str, str]]:
+        if not callable(route):
+            return 200, json.dumps(route).encode(), {}
+        status, payload, *rest = route(params, dict(request_headers))
+        body = json.dumps(payload).encode() if status != 304 else b""
+        return status, body, rest[0] if rest else {}
+
+    def _consume(self, token: str) -> tuple[bool, dict[str, str]]:
+        now = time.time()
+        with self._lock:
+            started, used = self._windows.get(token, (now, 0))
+            if now - started >= self.quota_window:
+                started, used = now, 0
+            allowed = used < self.quota
+            used += allowed
+            self._windows[token] = (started, used)
+
+        reset = started + self.quota_window
+        headers = {
+            "X-RateLimit-Limit": str(self.quota),
+            "X-RateLimit-Remaining": str(self.quota - used),
+            "X-RateLimit-Reset": str(int(reset * 1000)),
+        }
+        if not allowed:
+            headers["Retry-After"] = f"{reset - now:.3f}"
+        return allowed, headers
+
+    @staticmethod
+    def _page(total: int, offset: int, limit: int, make: Callable[[int], Any]) -> list[Any]:
+        return [make(index) for index in range(offset, min(offset + limit, total))]
+
+    def _regions(self, **_) -> list[dict[str, Any]]:
+        return [self.payloads.region(region) for region in self.regions]
+
+    def _emission(self, region: str, **_) -> dict[str, Any]:
+        return self.payloads.emission(region.upper())
+
+    def _friends(self, name: str, **_) -> list[str]:
+        return [f"{name}-friend-{index}" for index in range(self.friends_size)]
+
+    def _history(self, item: str, offset: int, limit: int, **_) -> dict[str, Any]:
+        make = partial(self.payloads.redeemed_lot, item)
+        return {"total": self.history_size, "prices": self._page(self.history_size, offset, limit, make)}
+
+    def _lots(self, item: str, offset: int, limit: int, **_) -> dict[str, Any]:
+        make = partial(self.payloads.active_lot, item)
+        return {"total": self.lots_size, "lots": self._page(self.lots_size, offset, limit, make)}
+
+    def _characters(self, **_) -> list[dict[str, Any]]:
+        return [self.payloads.user_character(index) for index in range(self.characters_size)]
+
+    def _profile(self, name: str, **_) -> dict[str, Any]:
+        return self.payloads.character_profile(name, self.stats_size)
+
+    def _clan(self, clan: str, **_) -> dict[str, Any]:
+        return {**self.payloads.clan(0), "id": clan}
+
+    def _members(self, clan: str, **_) -> list[dict[str, Any]]:
+        return [self.payloads.clan_member(clan, index) for index in range(self.members_size)]
+
+    def _clans(self, offset: int, limit: int, **_) -> dict[str, Any]:
+        data = self._page(self.clans_size, offset, limit, self.payloads.clan)
+        return {"totalClans": self.clans_size, "data": data}
+
+    def start(self) -> None:
+        """Starts serving requests in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the server and closes its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
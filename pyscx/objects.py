@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from enum import Enum
 from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class APIObject(BaseModel):
@@ -41,12 +42,13 @@ class Emission(APIObject):
     """Representation of emissions data in the game.
 
     Attributes:
-        current_start (datetime): The moment when the current emission iteration began.
+        current_start (datetime | None): The moment when the current emission iteration began.
+            Missing if no emission is in progress.
         previous_start (datetime): The moment when the previous emission iteration began.
         previous_end (datetime): The moment when the previous emission iteration ended.
     """
 
-    current_start: Annotated[datetime, Field(alias="currentStart")]
+    current_start: Annotated[datetime | None, Field(alias="currentStart", default=None)]
     previous_start: Annotated[datetime, Field(alias="previousStart")]
     previous_end: Annotated[datetime, Field(alias="previousEnd")]
 
@@ -156,6 +158,38 @@ class CharacterStatType(Enum):
     DURATION = "DURATION"
 
 
+def _parse_stat_date(raw: Any) -> datetime:
+    if isinstance(raw, (int, float)):
+        return datetime.fromtimestamp(raw / 1000, tz=timezone.utc)
+    parsed = datetime.fromisoformat(raw)
+    # Dates sent without an offset are in UTC, like the millisecond timestamps.
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+_STAT_DECODERS = {
+    CharacterStatType.INTEGER: int,
+    CharacterStatType.DECIMAL: lambda raw: Decimal(str(raw)),
+    CharacterStatType.DATE: _parse_stat_date,
+    CharacterStatType.DURATION: lambda raw: timedelta(milliseconds=raw),
+}
+
+
+def decode_stat_value(type: CharacterStatType, raw: Any) -> int | Decimal | datetime | timedelta:
+    """Decodes the raw value of a character statistic according to its type.
+
+    Integers are returned as `int`, decimals as `Decimal`, dates as timezone-aware `datetime`
+    (in UTC if sent without an offset) and durations, sent in milliseconds, as `timedelta`.
+
+    Args:
+        type (CharacterStatType): The type of the statistic.
+        raw (Any): The raw value, as sent by the API.
+
+    Returns:
+        int | Decimal | datetime | timedelta: The decoded value.
+    """
+    return _STAT_DECODERS[type](raw)
+
+
 class CharacterStat(APIObject):
     """Representation of data for a specific player statistic.
 
@@ -169,6 +203,20 @@ class CharacterStat(APIObject):
     type: Annotated[CharacterStatType, Field(alias="type")]
     value: Annotated[dict[str, Any], Field(alias="value")]
 
+    @property
+    def decoded(self) -> int | Decimal | datetime | timedelta | None:
+        """Returns the value of the statistic decoded according to its type.
+
+        The raw value is read from the `value` key of `value` and decoded with `decode_stat_value`.
+
+        Returns:
+            int | Decimal | datetime | timedelta | None: The decoded value, or None if the statistic has no value.
+        """
+        raw = self.value.get("value")
+        if raw is None:
+            return None
+        return decode_stat_value(self.type, raw)
+
 
 class CharacterMeta(APIObject):
     """Representation of the primary data about a character.
@@ -237,3 +285,83 @@ class FullCharacterInfo(APIObject):
 
     clan: Annotated[CharacterClan, Field(alias="clan")]
     stats: Annotated[list[CharacterStat], Field(alias="stats")]
+
+    _stats_index: dict[str, CharacterStat] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:
+        self._stats_index = {stat.id: stat for stat in self.stats}
+
+    def stat(self, stat_id: str) -> CharacterStat | None:
+        """Returns a statistic of the character by its identifier, without scanning the list of statistics.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            CharacterStat | None: The statistic, or None if the character does not have it.
+        """
+        return self._stats_index.get(stat_id)
+
+    def _typed_stat(self, stat_id: str, type: CharacterStatType) -> Any:
+        stat = self._stats_index.get(stat_id)
+        if stat is None:
+            return None
+        if stat.type is not type:
+            raise TypeError(f"The statistic '{stat_id}' is of type '{stat.type.value}', not '{type.value}'.")
+        return stat.decoded
+
+    def get_int(self, stat_id: str) -> int | None:
+        """Returns the value of an `INTEGER` statistic.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            int | None: The value, or None if the character does not have the statistic.
+
+        Raises:
+            TypeError: If the statistic is of another type.
+        """
+        return self._typed_stat(stat_id, CharacterStatType.INTEGER)
+
+    def get_decimal(self, stat_id: str) -> Decimal | None:
+        """Returns the value of a `DECIMAL` statistic.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            Decimal | None: The value, or None if the character does not have the statistic.
+
+        Raises:
+            TypeError: If the statistic is of another type.
+        """
+        return self._typed_stat(stat_id, CharacterStatType.DECIMAL)
+
+    def get_datetime(self, stat_id: str) -> datetime | None:
+        """Returns the value of a `DATE` statistic.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            datetime | None: The value, or None if the character does not have the statistic.
+
+        Raises:
+            TypeError: If the statistic is of another type.
+        """
+        return self._typed_stat(stat_id, CharacterStatType.DATE)
+
+    def get_timedelta(self, stat_id: str) -> timedelta | None:
+        """Returns the value of a `DURATION` statistic.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            timedelta | None: The value, or None if the character does not have the statistic.
+
+        Raises:
+            TypeError: If the statistic is of another type.
+        """
+        return self._typed_stat(stat_id, CharacterStatType.DURATION)
@@ -0,0 +1,277 @@
+import hashlib
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Hashable, Mapping
+
+from .exceptions import DeadlineExceeded
+from .transport import Deadline
+
+
+class TokenBucket:
+    """Pacing state of a single access token on a single server.
+
+    The bucket is implemented with the virtual scheduling algorithm: every request reserves the
+    next free slot, slots are `interval` seconds apart, and up to `burst` requests may be sent
+    back to back. Reservations are made under a lock, while the waiting happens outside of it,
+    so one bucket can be shared by any number of threads.
+
+    Attributes:
+        interval (float): The current distance between two requests, in seconds.
+        burst (int): The number of requests that may be sent without pacing.
+        limit (int | None): The quota reported by the server, if known.
+        remaining (int | None): The remaining quota reported by the server, if known.
+    """
+
+    __slots__ = ("interval", "burst", "limit", "remaining", "_tat", "_lock", "_clock")
+
+    def __init__(self, interval: float, burst: int = 1, clock=time.monotonic) -> None:
+        self.interval = interval
+        self.burst = burst
+        self.limit = None
+        self.remaining = None
+        self._clock = clock
+        self._tat = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, within: float | None = None) -> float:
+        """Reserves a slot for the next request.
+
+        Args:
+            within (float | None): The longest acceptable wait, in seconds. If the next free slot
+                is further away, it is not reserved.
+
+        Returns:
+            float: The number of seconds to wait before the request may be sent.
+        """
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            wait = max(0.0, tat - now - (self.burst - 1) * self.interval)
+            if within is None or wait <= within:
+                self._tat = tat + self.interval
+            return wait
+
+    def delay(self) -> float:
+        """Returns the number of seconds until a slot is free, without reserving it."""
+        with self._lock:
+            now = self._clock()
+            return max(0.0, max(self._tat, now) - now - (self.burst - 1) * self.interval)
+
+    def try_reserve(self) -> float:
+        """Reserves a slot for the next request only if the request may be sent right away.
+
+        Returns:
+            float: Zero if the slot was reserved, otherwise the number of seconds until a slot is free.
+        """
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            wait = max(0.0, tat - now - (self.burst - 1) * self.interval)
+            if not wait:
+                self._tat = tat + self.interval
+            return wait
+
+    def update(self, limit: int | None, remaining: int, reset_in: float, margin: int = 0) -> None:
+        """Adjusts the pacing to the quota reported by the server.
+
+        The remaining quota (minus the safety margin) is spread evenly over the time left until
+        the quota window resets. If the quota is exhausted, requests are held until the reset.
+
+        Args:
+            limit (int | None): The total quota of the window.
+            remaining (int): The number of requests left in the current window.
+            reset_in (float): The number of seconds until the window resets.
+            margin (int): The number of requests kept in reserve.
+        """
+        with self._lock:
+            now = self._clock()
+            self.limit, self.remaining = limit, remaining
+            available = remaining - margin
+            if available <= 0:
+                self._tat = max(self._tat, now + max(reset_in, 0.0))
+            elif reset_in > 0:
+                self.interval = reset_in / available
+
+    def hold(self, seconds: float) -> None:
+        """Postpones all requests that are not yet reserved by the given number of seconds.
+
+        Args:
+            seconds (float): The time to hold requests for.
+        """
+        with self._lock:
+            self._tat = max(self._tat, self._clock() + seconds)
+
+
+class RateLimiter:
+    """Client-side rate limiter aware of the API quota headers.
+
+    Requests are paced per access token and per server. Until the server reports its quota,
+    requests are paced at `requests` per `period` seconds. After every response the pacing is
+    retuned from the `X-RateLimit-Limit`, `X-RateLimit-Remaining` and `X-RateLimit-Reset` headers,
+    keeping `margin` requests in reserve, so the client stays just under the quota instead of
+    bursting into `429 Too Many Requests`.
+
+    The limiter is thread-safe. Share one instance between all API objects of a process to make
+    them respect a common quota.
+
+    .. code-block:: python
+
+        limiter = RateLimiter()
+        api = API(tokens=app_token, server=Server.PRODUCTION, rate_limiter=limiter)
+    """
+
+    limit_header = "X-RateLimit-Limit"
+    remaining_header = "X-RateLimit-Remaining"
+    reset_header = "X-RateLimit-Reset"
+
+    def __init__(
+        self, requests: int = 400, period: float = 60, burst: int = 10, margin: int = 5
+    ) -> None:
+        """Initializes the rate limiter.
+
+        Args:
+            requests (int): The number of requests allowed per `period` before the quota is known.
+            period (float): The length of the quota window, in seconds.
+            burst (int): The number of requests that may be sent back to back.
+            margin (int): The number of requests of the reported quota kept in reserve.
+        """
+        self.interval = period / requests
+        self.burst = burst
+        self.margin = margin
+
+        self._buckets: dict[Hashable, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(server: str, headers: Mapping[str, str] | None = None) -> tuple[str, str | None]:
+        """Builds the key of the bucket a request is paced by.
+
+        Args:
+            server (str): The base URL of the API server.
+            headers (Mapping[str, str] | None): Headers of the request.
+
+        Returns:
+            tuple[str, str | None]: The server and a digest of the access token.
+        """
+        authorization = (headers or {}).get("Authorization")
+        credential = hashlib.sha256(authorization.encode()).hexdigest() if authorization else None
+        return (server, credential)
+
+    def bucket(self, key: Hashable) -> TokenBucket:
+        """Returns the bucket of the key, creating it on first use.
+
+        Args:
+            key (Hashable): The key built by `make_key`.
+
+        Returns:
+            TokenBucket: The pacing state of the key.
+        """
+        try:
+            return self._buckets[key]
+        except KeyError:
+            with self._lock:
+                return self._buckets.setdefault(key, TokenBucket(self.interval, self.burst))
+
+    def reserve(self, key: Hashable, deadline: Deadline | None = None, url: str | None = None) -> float:
+        """Reserves a slot for a request.
+
+        Args:
+            key (Hashable): The key built by `make_key`.
+            deadline (Deadline | None): The deadline of the API call the request belongs to.
+            url (str | None): The URL of the request, for error messages.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+
+        Raises:
+            DeadlineExceeded: If the deadline expires before a slot is free. No slot is reserved then.
+        """
+        if deadline is None:
+            return self.bucket(key).reserve()
+        remaining = deadline.remaining()
+        wait = self.bucket(key).reserve(within=remaining)
+        if wait > remaining:
+            raise DeadlineExceeded(url=url)
+        return wait
+
+    def acquire(self, key: Hashable, deadline: Deadline | None = None, url: str | None = None) -> None:
+        """Blocks the current thread until a request may be sent.
+
+        Args:
+            key (Hashable): The key built by `make_key`.
+            deadline (Deadline | None): The deadline of the API call the request belongs to.
+            url (str | None): The URL of the request, for error messages.
+
+        Raises:
+            DeadlineExceeded: If the deadline expires before a slot is free.
+        """
+        wait = self.reserve(key, deadline, url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def observe(self, key: Hashable, status_code: int, headers: Mapping[str, str]) -> None:
+        """Retunes the pacing from the response of the server.
+
+        Args:
+            key (Hashable): The key built by `make_key`.
+            status_code (int): The status code of the response.
+            headers (Mapping[str, str]): The headers of the response.
+        """
+        bucket = self.bucket(key)
+        remaining = headers.get(self.remaining_header)
+        reset = headers.get(self.reset_header)
+
+        if remaining is not None and reset is not None:
+            limit = headers.get(self.limit_header)
+            bucket.update(
+                int(limit) if limit is not None else None,
+                0 if status_code == 429 else int(remaining),
+                self.seconds_until(reset),
+                self.margin,
+            )
+        elif status_code == 429:
+            bucket.hold(retry_after(headers) or self.interval * self.burst)
+
+    @staticmethod
+    def seconds_until(reset: str) -> float:
+        """Converts the value of the reset header into the number of seconds until the reset.
+
+        The header may hold a Unix timestamp in milliseconds (as sent by the STALCRAFT: X API),
+        a Unix timestamp in seconds, or a number of seconds.
+
+        Args:
+            reset (str): The value of the reset header.
+
+        Returns:
+            float: The number of seconds until the quota window resets.
+        """
+        value = float(reset)
+        if value > 1e11:
+            return value / 1000 - time.time()
+        if value > 1e9:
+            return value - time.time()
+        return value
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Parses the `Retry-After` header of a response.
+
+    Args:
+        headers (Mapping[str, str]): The headers of the response.
+
+    Returns:
+        float | None: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,179 @@
+import asyncio
+import random
+from typing import Any, Callable, Collection
+
+import requests
+
+from .ratelimit import retry_after
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Status codes of responses that are retried by default."""
+
+DEFAULT_RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    ConnectionError,
+    asyncio.TimeoutError,
+) + ((aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError) if aiohttp else ())
+"""Exceptions of the transport that are retried by default."""
+
+
+class RetryEvent:
+    """Information about a retried request, passed to the `on_retry` hook.
+
+    Attributes:
+        url (str): The URL of the retried request.
+        attempt (int): The number of the failed attempt, starting from 1.
+        delay (float): The number of seconds the client waits before the next attempt.
+        status_code (int | None): The status code of the failed response, if a response was received.
+        error (BaseException | None): The exception raised by the transport, if any.
+    """
+
+    __slots__ = ("url", "attempt", "delay", "status_code", "error")
+
+    def __init__(
+        self,
+        url: str,
+        attempt: int,
+        delay: float,
+        status_code: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self.url = url
+        self.attempt = attempt
+        self.delay = delay
+        self.status_code = status_code
+        self.error = error
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class RetryPolicy:
+    """Retry policy for idempotent API requests.
+
+    Failed requests are retried with exponential backoff and jitter: the n-th retry waits a random
+    time between half and the whole of `backoff_factor * 2 ** (n - 1)` seconds, capped at
+    `max_backoff`. If the server answers with a `Retry-After` header, its value is used instead.
+
+    .. code-block:: python
+
+        policy = RetryPolicy(max_attempts=5, on_retry=lambda event: log.warning("%s", event))
+        api = API(tokens=app_token, server=Server.PRODUCTION, retry=policy)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        exceptions: tuple[type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+        on_retry: Callable[[RetryEvent], Any] | None = None,
+    ) -> None:
+        """Initializes the retry policy.
+
+        Args:
+            max_attempts (int): The maximum number of attempts, including the first one.
+            statuses (Collection[int]): Status codes of responses that are retried.
+            exceptions (tuple[type[BaseException], ...]): Transport exceptions that are retried.
+            backoff_factor (float): The base of the exponential backoff, in seconds.
+            max_backoff (float): The upper bound of a single backoff delay, in seconds.
+            jitter (bool): Whether to randomize backoff delays.
+            respect_retry_after (bool): Whether to wait as long as the `Retry-After` header says.
+            max_retry_after (float): The longest `Retry-After` delay to wait for. Responses asking
+                for a longer delay are not retried.
+            on_retry (Callable[[RetryEvent], Any] | None): A hook called before every retry.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.exceptions = tuple(exceptions)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.on_retry = on_retry
+
+    def backoff(self, attempt: int) -> float:
+        """Calculates the backoff delay after a failed attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting from 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay) if self.jitter else delay
+
+    def next_delay(
+        self, url: str, attempt: int, response: Any = None, error: BaseException | None = None
+    ) -> float | None:
+        """Decides whether a failed attempt should be retried.
+
+        The retry is not reported to the hook here, since the caller may still give it up,
+        e.g. when the delay does not fit in its deadline. The caller reports it with `notify`.
+
+        Args:
+            url (str): The URL of the request.
+            attempt (int): The number of the finished attempt, starting from 1.
+            response (Any): The response of the attempt, if one was received.
+            error (BaseException | None): The exception raised by the attempt, if any.
+
+        Returns:
+            float | None: The number of seconds to wait before the next attempt,
+                or None if the request should not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if error is not None:
+            if not isinstance(error, self.exceptions):
+                return None
+            return self.backoff(attempt)
+        if response.status_code not in self.statuses:
+            return None
+        return self.retry_delay(response, attempt)
+
+    def notify(
+        self, url: str, attempt: int, delay: float, response: Any = None, error: BaseException | None = None
+    ) -> None:
+        """Reports a retry that is about to happen to the `on_retry` hook.
+
+        Args:
+            url (str): The URL of the request.
+            attempt (int): The number of the failed attempt, starting from 1.
+            delay (float): The number of seconds waited before the next attempt.
+            response (Any): The response of the failed attempt, if one was received.
+            error (BaseException | None): The exception raised by the failed attempt, if any.
+        """
+        if self.on_retry is not None:
+            status_code = response.status_code if response is not None else None
+            self.on_retry(RetryEvent(url, attempt, delay, status_code, error))
+
+    def retry_delay(self, response: Any, attempt: int) -> float | None:
+        """Calculates the delay before retrying a failed response.
+
+        Args:
+            response (Any): The failed response.
+            attempt (int): The number of the failed attempt, starting from 1.
+
+        Returns:
+            float | None: The delay in seconds, or None if the server asks to wait too long.
+        """
+        if self.respect_retry_after:
+            requested = retry_after(response.headers)
+            if requested is not None:
+                return requested if requested <= self.max_retry_after else None
+        return self.backoff(attempt)
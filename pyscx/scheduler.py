@@ -0,0 +1,341 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Hashable, Iterable, Mapping
+
+from .exceptions import DeadlineExceeded, RequestShed
+from .ratelimit import RateLimiter, TokenBucket
+from .transport import Deadline
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+class PriorityClass:
+    """Settings of a class of requests sharing the quota of a `RequestScheduler`.
+
+    Attributes:
+        name (str): The name of the class, passed as the `priority` argument of API methods.
+        weight (float): The share of the quota the class gets while other classes are waiting too.
+        max_queue (int): The maximum number of requests of the class waiting for a slot. Requests
+            beyond it are shed.
+        max_wait (float | None): The longest time a request of the class may wait for a slot, in seconds.
+            Requests that cannot be sent in time are shed. Unlimited if None.
+    """
+
+    __slots__ = ("name", "weight", "max_queue", "max_wait")
+
+    def __init__(
+        self, name: str, weight: float = 1.0, max_queue: int = 1000, max_wait: float | None = None
+    ) -> None:
+        """Initializes the priority class.
+
+        Args:
+            name (str): The name of the class.
+            weight (float): The share of the quota of the class.
+            max_queue (int): The maximum number of waiting requests of the class.
+            max_wait (float | None): The longest wait for a slot, in seconds.
+
+        Raises:
+            ValueError: If the weight or the queue size is not positive.
+        """
+        if weight <= 0 or max_queue < 1:
+            raise ValueError("The weight and the queue size of a priority class must be positive.")
+        self.name = name
+        self.weight = weight
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, weight={self.weight}, max_queue={self.max_queue})"
+
+
+DEFAULT_CLASSES = (
+    PriorityClass(INTERACTIVE, weight=8, max_queue=100, max_wait=10.0),
+    PriorityClass(BATCH, weight=1, max_queue=10_000),
+)
+
+
+class _Ticket:
+    __slots__ = ("lane", "priority", "expires", "bounded_by_deadline", "state", "waker")
+
+    def __init__(self, lane: "_Lane", priority: PriorityClass, expires: float, bounded_by_deadline: bool) -> None:
+        self.lane = lane
+        self.priority = priority
+        self.expires = expires
+        self.bounded_by_deadline = bounded_by_deadline
+        self.state = "queued"
+        self.waker: Callable[[], None] | None = None
+
+
+class _Lane:
+    """The queues of the requests paced by one bucket, i.e. sent with one token to one server."""
+
+    __slots__ = ("bucket", "queues", "finish", "clock")
+
+    def __init__(self, bucket: TokenBucket, classes: Iterable[PriorityClass]) -> None:
+        self.bucket = bucket
+        self.queues: dict[str, deque[_Ticket]] = {priority.name: deque() for priority in classes}
+        self.finish = dict.fromkeys(self.queues, 0.0)
+        self.clock = 0.0
+
+    def select(self, now: float) -> _Ticket | None:
+        """Drops the expired requests at the heads of the queues and returns the request to send next."""
+        best, best_finish = None, math.inf
+        for name, queue in self.queues.items():
+            while queue and queue[0].expires <= now:
+                queue.popleft().state = "expired"
+            if queue and self.finish[name] < best_finish:
+                best, best_finish = queue[0], self.finish[name]
+        return best
+
+    def backlog(self, priority: PriorityClass, weights: Mapping[str, float]) -> float:
+        """Estimates the number of slots that pass before a new request of the class is sent."""
+        active = sum(weights[name] for name, queue in self.queues.items() if queue or name == priority.name)
+        return (len(self.queues[priority.name]) + 1) * active / priority.weight
+
+
+class RequestScheduler:
+    """Orders the requests of a session by priority, sharing the rate quota fairly between classes.
+
+    The scheduler takes over the pacing of a `RateLimiter`: a request waits in the queue of its priority
+    class until a slot of the quota is free, and every free slot is given to the class with the lowest
+    weighted share of the slots used so far (weighted fair queuing). A saturating crawl therefore only
+    fills the batch queue, while interactive requests jump ahead of it and wait at most a few slots.
+    Classes that are idle do not save up slots for later.
+
+    Requests are shed with `RequestShed` when the queue of their class is full, when the expected wait
+    exceeds their deadline or the `max_wait` of the class, or when they are still waiting at that time.
+
+    .. code-block:: python
+
+        scheduler = RequestScheduler()
+        api = API(tokens=app_token, server=Server.PRODUCTION, scheduler=scheduler)
+
+        profile = api.characters(region="EU").get_profile(character_name="Test-1", priority="interactive")
+        members = api.clans(region="EU").get_members_for(clan_ids=clan_ids, priority="batch")
+
+    Attributes:
+        rate_limiter (RateLimiter): The limiter holding the pacing state, tuned from the quota headers.
+        classes (dict[str, PriorityClass]): The priority classes, by name.
+        default_priority (str): The class of the requests without a `priority` argument.
+        shed (dict[str, int]): The number of requests of every class shed so far.
+    """
+
+    def __init__(
+        self,
+        classes: Iterable[PriorityClass] = DEFAULT_CLASSES,
+        default_priority: str = BATCH,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            classes (Iterable[PriorityClass]): The priority classes. Defaults to an `interactive` class
+                with 8 times the weight of a `batch` class.
+            default_priority (str): The class of the requests without a `priority` argument.
+            rate_limiter (RateLimiter | None): The limiter providing the initial pacing. Defaults to
+                a `RateLimiter` with its default settings.
+
+        Raises:
+            ValueError: If the default class is not one of the classes.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.classes = {priority.name: priority for priority in classes}
+        if default_priority not in self.classes:
+            raise ValueError(f"The default priority '{default_priority}' is not one of the priority classes.")
+        self.default_priority = default_priority
+        self.shed = dict.fromkeys(self.classes, 0)
+
+        self._weights = {name: priority.weight for name, priority in self.classes.items()}
+        self._lanes: dict[Hashable, _Lane] = {}
+        self._condition = threading.Condition()
+
+    def _lane(self, key: Hashable) -> _Lane:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(self.rate_limiter.bucket(key), self.classes.values())
+        return lane
+
+    def _shed(self, priority: PriorityClass, reason: str) -> RequestShed:
+        self.shed[priority.name] += 1
+        message = f"The request of priority '{priority.name}' was shed: {reason}."
+        return RequestShed(message, priority=priority.name)
+
+    def _submit(self, key: Hashable, priority: str | None, deadline: Deadline | None) -> _Ticket:
+        """Queues a request, or sheds it right away if it cannot be sent in time. Called under the lock."""
+        try:
+            priority = self.classes[priority or self.default_priority]
+        except KeyError:
+            raise ValueError(f"Unknown request priority '{priority}'.") from None
+
+        lane = self._lane(key)
+        queue = lane.queues[priority.name]
+        if len(queue) >= priority.max_queue:
+            raise self._shed(priority, "its queue is full")
+
+        now = time.monotonic()
+        expires = now + priority.max_wait if priority.max_wait is not None else math.inf
+        bounded_by_deadline = deadline is not None and deadline.expires < expires
+        if bounded_by_deadline:
+            expires = deadline.expires
+        expected = lane.bucket.delay() + (lane.backlog(priority, self._weights) - 1) * lane.bucket.interval
+        if now + expected > expires:
+            raise self._shed(priority, "it cannot be sent in time")
+
+        if not queue:
+            # A class becoming active starts from the current virtual time, without credit for its idle time.
+            lane.finish[priority.name] = max(lane.finish[priority.name], lane.clock)
+        ticket = _Ticket(lane, priority, expires, bounded_by_deadline)
+        queue.append(ticket)
+        return ticket
+
+    def _poll(self, ticket: _Ticket) -> float | None:
+        """Sends the request if it is its turn and a slot is free. Called under the lock.
+
+        Returns:
+            float | None: Zero if the request may be sent, the time until the next free slot if it is
+                the next request to send, or None if it has to wait for its turn.
+        """
+        if ticket.state != "queued":
+            return None
+        lane = ticket.lane
+        if lane.select(time.monotonic()) is not ticket:
+            return None
+        wait = lane.bucket.try_reserve()
+        if wait:
+            return wait
+
+        name = ticket.priority.name
+        lane.queues[name].popleft()
+        lane.clock = lane.finish[name]
+        lane.finish[name] += 1 / ticket.priority.weight
+        ticket.state = "sent"
+        self._wake(lane)
+        return 0.0
+
+    def _wake(self, lane: _Lane) -> None:
+        """Wakes the requests that may be next in turn. Called under the lock."""
+        self._condition.notify_all()
+        for queue in lane.queues.values():
+            if queue and queue[0].waker is not None:
+                queue[0].waker()
+
+    def _cancel(self, ticket: _Ticket) -> None:
+        """Removes a request that stopped waiting from its queue. Called under the lock."""
+        if ticket.state == "queued":
+            ticket.lane.queues[ticket.priority.name].remove(ticket)
+        ticket.state = "cancelled"
+        self._wake(ticket.lane)
+
+    def _expire(self, ticket: _Ticket, url: str | None) -> Exception:
+        if ticket.bounded_by_deadline:
+            return DeadlineExceeded(url=url)
+        return self._shed(ticket.priority, "it waited longer than its priority class allows")
+
+    def acquire(
+        self, key: Hashable, priority: str | None = None, deadline: Deadline | None = None, url: str | None = None
+    ) -> None:
+        """Blocks the current thread until the request may be sent.
+
+        Args:
+            key (Hashable): The key of the pacing bucket, built by `RateLimiter.make_key`.
+            priority (str | None): The name of the priority class. Defaults to `default_priority`.
+            deadline (Deadline | None): The deadline of the API call the request belongs to.
+            url (str | None): The URL of the request, for error messages.
+
+        Raises:
+            RequestShed: If the request is shed.
+            DeadlineExceeded: If the deadline expires while the request is waiting.
+            ValueError: If the priority class does not exist.
+        """
+        with self._condition:
+            ticket = self._submit(key, priority, deadline)
+            try:
+                while True:
+                    wait = self._poll(ticket)
+                    if wait == 0.0:
+                        return
+                    remaining = ticket.expires - time.monotonic()
+                    if ticket.state == "expired" or remaining <= 0:
+                        raise self._expire(ticket, url)
+                    self._condition.wait(min(wait, remaining) if wait is not None else min(remaining, 60.0))
+            except BaseException:
+                self._cancel(ticket)
+                raise
+
+    async def acquire_async(
+        self, key: Hashable, priority: str | None = None, deadline: Deadline | None = None, url: str | None = None
+    ) -> None:
+        """Waits without blocking the event loop until the request may be sent.
+
+        Args:
+            key (Hashable): The key of the pacing bucket, built by `RateLimiter.make_key`.
+            priority (str | None): The name of the priority class. Defaults to `default_priority`.
+            deadline (Deadline | None): The deadline of the API call the request belongs to.
+            url (str | None): The URL of the request, for error messages.
+
+        Raises:
+            RequestShed: If the request is shed.
+            DeadlineExceeded: If the deadline expires while the request is waiting.
+            ValueError: If the priority class does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._condition:
+            ticket = self._submit(key, priority, deadline)
+            ticket.waker = lambda: loop.call_soon_threadsafe(event.set)
+        try:
+            while True:
+                with self._condition:
+                    wait = self._poll(ticket)
+                if wait == 0.0:
+                    return
+                remaining = ticket.expires - time.monotonic()
+                if ticket.state == "expired" or remaining <= 0:
+                    with self._condition:
+                        raise self._expire(ticket, url)
+                event.clear()
+                try:
+                    timeout = min(wait, remaining) if wait is not None else min(remaining, 60.0)
+                    await asyncio.wait_for(event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            with self._condition:
+                self._cancel(ticket)
+            raise
+
+    def observe(self, key: Hashable, status_code: int, headers: Mapping[str, str]) -> None:
+        """Retunes the pacing from the response of the server, see `RateLimiter.observe`.
+
+        Args:
+            key (Hashable): The key of the pacing bucket.
+            status_code (int): The status code of the response.
+            headers (Mapping[str, str]): The headers of the response.
+        """
+        self.rate_limiter.observe(key, status_code, headers)
+        with self._condition:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                self._wake(lane)
+
+    def queued(self, priority: str | None = None) -> int:
+        """Returns the number of requests waiting for a slot.
+
+        Args:
+            priority (str | None): The name of a priority class. Defaults to all classes.
+
+        Returns:
+            int: The number of waiting requests.
+        """
+        with self._condition:
+            return sum(
+                len(queue)
+                for lane in self._lanes.values()
+                for name, queue in lane.queues.items()
+                if priority is None or name == priority
+            )
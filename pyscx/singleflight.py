@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+from .exceptions import DeadlineExceeded
+from .transport import Deadline
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicates identical calls running at the same time in different threads.
+
+    The first caller of a key (the leader) runs the function, while callers arriving with the same
+    key before it finishes wait for it and receive its result (or exception). The result object is
+    shared between the callers, so mutable results should be copied by the caller before changing
+    them. Once the call finishes, the key is forgotten, so later calls run the function again.
+
+    Attributes:
+        calls (int): The number of calls that actually ran the function.
+        shared (int): The number of calls that received the result of another call.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._inflight: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any], deadline: Deadline | None = None) -> Any:
+        """Runs the function, unless a call with the same key is already running.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            func (Callable[[], Any]): The function to run.
+            deadline (Deadline | None): The deadline of the caller. A caller waiting for the call
+                of another one stops waiting once it expires.
+
+        Returns:
+            Any: The result of the function, possibly produced for another caller.
+
+        Raises:
+            DeadlineExceeded: If the deadline expires while waiting for the call of another caller.
+        """
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            if not call.done.wait(deadline.remaining() if deadline is not None else None):
+                raise DeadlineExceeded()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Deduplicates identical coroutine calls running at the same time on an event loop.
+
+    The asynchronous counterpart of `SingleFlight`. Cancelling one of the waiting callers does not
+    cancel the shared call.
+
+    Attributes:
+        calls (int): The number of calls that actually ran the coroutine function.
+        shared (int): The number of calls that received the result of another call.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]], deadline: Deadline | None = None
+    ) -> Any:
+        """Awaits the coroutine function, unless a call with the same key is already running.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            func (Callable[[], Awaitable[Any]]): The coroutine function to await.
+            deadline (Deadline | None): The deadline of the caller, which stops waiting once it expires.
+                The shared call keeps running for the other callers.
+
+        Returns:
+            Any: The result of the coroutine, possibly produced for another caller.
+
+        Raises:
+            DeadlineExceeded: If the deadline expires before the shared call finishes.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.calls += 1
+        else:
+            self.shared += 1
+        if deadline is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded() from None
@@ -0,0 +1,214 @@
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from .columnar import np, require_numpy
+from .objects import CharacterStatType, FullCharacterInfo, decode_stat_value
+
+
+def _stat_number(type: CharacterStatType, raw: Any) -> float:
+    # Values are decoded like `CharacterStat.decoded` and stored as float64:
+    # dates as seconds since the Unix epoch, durations as seconds.
+    value = decode_stat_value(type, raw)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class StatMatrix:
+    """The statistics of many characters as a dense matrix of players by statistics.
+
+    Values are stored as float64: integers and decimals as they are, dates as seconds since the
+    Unix epoch and durations as seconds. Statistics a character does not have are NaN. Leaderboards
+    over tens of thousands of profiles are then computed with a few vectorized operations.
+
+    .. code-block:: python
+
+        result = api.characters(region="EU").get_profiles(character_names=names)
+        matrix = StatMatrix.from_profiles(result.values.values())
+        for name, kills in matrix.top("kills", n=10):
+            print(name, kills)
+
+    Attributes:
+        names (list[str]): The names of the characters, one per row.
+        stat_ids (list[str]): The identifiers of the statistics, one per column.
+        types (list[CharacterStatType | None]): The types of the statistics,
+            None if no character has the statistic.
+        values (numpy.ndarray): The values, as a float64 array of shape `(len(names), len(stat_ids))`.
+    """
+
+    __slots__ = ("names", "stat_ids", "types", "values", "_columns")
+
+    def __init__(
+        self,
+        names: list[str],
+        stat_ids: list[str],
+        values: Any,
+        types: list[CharacterStatType | None] | None = None,
+    ) -> None:
+        """Initializes the matrix.
+
+        Args:
+            names (list[str]): The names of the characters.
+            stat_ids (list[str]): The identifiers of the statistics.
+            values (Any): The values, with one row per character and one column per statistic.
+            types (list[CharacterStatType | None] | None): The types of the statistics. Defaults to unknown types.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the shape of the values does not match the names and statistics.
+        """
+        require_numpy("Statistic matrices")
+        self.names = list(names)
+        self.stat_ids = list(stat_ids)
+        self.types = list(types) if types is not None else [None] * len(self.stat_ids)
+        self.values = np.asarray(values, dtype=np.float64).reshape(len(self.names), len(self.stat_ids))
+        self._columns = {stat_id: index for index, stat_id in enumerate(self.stat_ids)}
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict[str, Any]], stat_ids: Iterable[str] | None = None
+    ) -> "StatMatrix":
+        """Builds the matrix from raw character profiles, as returned by the API.
+
+        Args:
+            records (Iterable[dict[str, Any]]): The decoded profiles.
+            stat_ids (Iterable[str] | None): The statistics to keep, in order. Defaults to every statistic
+                found in the profiles, in the order they are first seen.
+
+        Returns:
+            StatMatrix: The matrix.
+        """
+        rows = (
+            (
+                record["username"],
+                [(stat["id"], CharacterStatType(stat["type"]), stat["value"]) for stat in record["stats"]],
+            )
+            for record in records
+        )
+        return cls._build(rows, stat_ids)
+
+    @classmethod
+    def from_profiles(
+        cls, profiles: Iterable[FullCharacterInfo], stat_ids: Iterable[str] | None = None
+    ) -> "StatMatrix":
+        """Builds the matrix from character profiles, e.g. the values of a `get_profiles` batch.
+
+        Args:
+            profiles (Iterable[FullCharacterInfo]): The profiles.
+            stat_ids (Iterable[str] | None): The statistics to keep, in order. Defaults to every statistic
+                found in the profiles, in the order they are first seen.
+
+        Returns:
+            StatMatrix: The matrix.
+        """
+        rows = (
+            (profile.name, [(stat.id, stat.type, stat.value) for stat in profile.stats])
+            for profile in profiles
+        )
+        return cls._build(rows, stat_ids)
+
+    @classmethod
+    def _build(cls, rows: Iterable[tuple[str, list[tuple]]], stat_ids: Iterable[str] | None) -> "StatMatrix":
+        """Builds the matrix from (name, [(stat id, type, value), ...]) rows in a single pass."""
+        require_numpy("Statistic matrices")
+        fixed = stat_ids is not None
+        columns = {stat_id: index for index, stat_id in enumerate(stat_ids or ())}
+        types: dict[int, CharacterStatType] = {}
+        names, row_index, column_index, numbers = [], [], [], []
+
+        for row, (name, stats) in enumerate(rows):
+            names.append(name)
+            for stat_id, type, value in stats:
+                column = columns.get(stat_id)
+                if column is None:
+                    if fixed:
+                        continue
+                    column = columns[stat_id] = len(columns)
+                raw = value.get("value")
+                if raw is None:
+                    continue
+                types.setdefault(column, type)
+                row_index.append(row)
+                column_index.append(column)
+                numbers.append(_stat_number(type, raw))
+
+        values = np.full((len(names), len(columns)), np.nan)
+        values[np.asarray(row_index, dtype=np.intp), np.asarray(column_index, dtype=np.intp)] = numbers
+        return cls(
+            names,
+            list(columns),
+            values,
+            [types.get(index) for index in range(len(columns))],
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Returns the number of characters and of statistics."""
+        return self.values.shape
+
+    def column(self, stat_id: str) -> "np.ndarray":
+        """Returns the values of a statistic for every character.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+
+        Returns:
+            numpy.ndarray: The values, NaN for the characters without the statistic.
+
+        Raises:
+            KeyError: If the statistic is not in the matrix.
+        """
+        return self.values[:, self._columns[stat_id]]
+
+    def top(self, stat_id: str, n: int = 10, ascending: bool = False) -> list[tuple[str, float]]:
+        """Returns the leaderboard of a statistic.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+            n (int): The number of places.
+            ascending (bool): Whether the lowest values rank first, e.g. for the fastest times.
+
+        Returns:
+            list[tuple[str, float]]: The names and values of the leading characters, best first.
+                Characters without the statistic are left out.
+
+        Raises:
+            KeyError: If the statistic is not in the matrix.
+        """
+        values = self.column(stat_id)
+        keys = values if ascending else -values
+        present = np.flatnonzero(~np.isnan(values))
+        if n < len(present):
+            present = present[np.argpartition(keys[present], n)[:n]]
+        leaders = present[np.argsort(keys[present], kind="stable")]
+        return [(self.names[index], float(values[index])) for index in leaders]
+
+    def rank(self, stat_id: str, ascending: bool = False) -> "np.ndarray":
+        """Returns the place of every character in the leaderboard of a statistic, starting from 1.
+
+        Args:
+            stat_id (str): The identifier of the statistic.
+            ascending (bool): Whether the lowest values rank first.
+
+        Returns:
+            numpy.ndarray: The places, as float64. Equal values share the best place,
+                characters without the statistic have a NaN.
+
+        Raises:
+            KeyError: If the statistic is not in the matrix.
+        """
+        values = self.column(stat_id)
+        keys = values if ascending else -values
+        present = ~np.isnan(values)
+        ordered = np.sort(keys[present])
+        ranks = np.full(len(values), np.nan)
+        ranks[present] = np.searchsorted(ordered, keys[present], side="left") + 1
+        return ranks
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(characters={len(self.names)}, stats={len(self.stat_ids)})"
@@ -0,0 +1,321 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from .objects import (
+    APIObject,
+    AuctionLot,
+    CharacterInfo,
+    Clan,
+    ClanMember,
+    FullCharacterInfo,
+    Region,
+)
+
+
+def lot_key(lot: AuctionLot) -> str:
+    """Builds the lookup key of an active auction lot.
+
+    The API sends no lot identifiers, so a lot is identified by its item and the moment it was listed,
+    e.g. `1kv2/2025-02-11T00:49:55.603680+00:00`.
+
+    Args:
+        lot (AuctionLot): The lot.
+
+    Returns:
+        str: The lookup key of the lot.
+    """
+    return f"{lot.item_id}/{lot.start_time.isoformat()}"
+
+
+DEFAULT_KEYS: dict[type[APIObject], Callable[[APIObject], str]] = {
+    Region: attrgetter("id"),
+    AuctionLot: lot_key,
+    Clan: attrgetter("id"),
+    ClanMember: attrgetter("name"),
+    CharacterInfo: attrgetter("information.name"),
+    FullCharacterInfo: attrgetter("name"),
+}
+"""Functions extracting the lookup key of the stored objects, per model."""
+
+
+def _timestamp(moment: datetime | float | None) -> float | None:
+    if moment is None or isinstance(moment, (int, float)):
+        return moment
+    return moment.timestamp()
+
+
+class Snapshot:
+    """An object stored in a `SnapshotStore`, together with where and when it was fetched.
+
+    Attributes:
+        region (str): The region the object was fetched for.
+        key (str): The lookup key of the object, such as a clan identifier or a character name.
+        fetched_at (float): The moment the object was fetched, as a UNIX timestamp.
+        object (APIObject): The stored object.
+    """
+
+    __slots__ = ("region", "key", "fetched_at", "object")
+
+    def __init__(self, region: str, key: str, fetched_at: float, object: APIObject) -> None:
+        self.region = region
+        self.key = key
+        self.fetched_at = fetched_at
+        self.object = object
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(region={self.region!r}, key={self.key!r}, "
+            f"fetched_at={self.fetched_at!r}, object={self.object!r})"
+        )
+
+
+class SnapshotStore:
+    """Persistent SQLite store of API objects with indexed lookups by region, key and fetch time.
+
+    Every call of `put` stores a snapshot of the objects taken at one moment, so the store keeps the
+    whole history of an object rather than only its latest state. Objects are stored in the same JSON
+    form the API returns them in and are read back either as models or as columns of raw values.
+    Objects with an item identifier, such as auction lots keyed by `lot_key`, are indexed by it too,
+    so all lots of an item can be queried at once.
+
+    .. code-block:: python
+
+        store = SnapshotStore("~/scx/snapshots.sqlite3")
+        store.put("EU", api.clans(region="EU").get_all(limit=100))
+        clan = store.latest(Clan, "EU", clan_id)
+        last_week = store.query(Clan, "EU", start=time.time() - 7 * 24 * 60 * 60)
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Initializes the store, creating the database file if needed.
+
+        Args:
+            path (str | os.PathLike): The path of the SQLite database file, or `":memory:"`.
+        """
+        self.path = path if path == ":memory:" else os.path.expanduser(os.fspath(path))
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS snapshots (
+                model TEXT NOT NULL,
+                region TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                data TEXT NOT NULL,
+                item_id TEXT
+            );
+            """
+        )
+        if "item_id" not in {row[1] for row in self._db.execute("PRAGMA table_info(snapshots)")}:
+            # Stores created before the item index get the column, empty for the objects stored so far.
+            self._db.execute("ALTER TABLE snapshots ADD COLUMN item_id TEXT")
+        self._db.executescript(
+            """
+            CREATE INDEX IF NOT EXISTS snapshots_key ON snapshots (model, region, key, fetched_at);
+            CREATE INDEX IF NOT EXISTS snapshots_time ON snapshots (model, region, fetched_at);
+            CREATE INDEX IF NOT EXISTS snapshots_item ON snapshots (model, region, item_id, fetched_at);
+            """
+        )
+
+    def put(
+        self,
+        region: str,
+        objects: APIObject | Iterable[APIObject],
+        key: str | Callable[[APIObject], str] | None = None,
+        fetched_at: datetime | float | None = None,
+    ) -> int:
+        """Stores a snapshot of the objects in one transaction.
+
+        Args:
+            region (str): The region the objects were fetched for.
+            objects (APIObject | Iterable[APIObject]): The object or objects to store.
+            key (str | Callable[[APIObject], str] | None): The lookup key of all the objects, or a function
+                extracting it from every object. Defaults to the key from `DEFAULT_KEYS`, which is required
+                for models without one, e.g. the item identifier for `AuctionRedeemedLot` objects.
+            fetched_at (datetime | float | None): The moment the objects were fetched. Defaults to now.
+
+        Returns:
+            int: The number of stored objects.
+
+        Raises:
+            ValueError: If no key is given for a model missing from `DEFAULT_KEYS`.
+        """
+        if isinstance(objects, APIObject):
+            objects = [objects]
+        fetched_at = _timestamp(fetched_at) if fetched_at is not None else time.time()
+        region = region.upper()
+
+        rows = []
+        for obj in objects:
+            get_key = key if key is not None else DEFAULT_KEYS.get(type(obj))
+            if get_key is None:
+                raise ValueError(f"A key is required to store '{type(obj).__name__}' objects.")
+            obj_key = get_key if isinstance(get_key, str) else get_key(obj)
+            item_id = getattr(obj, "item_id", None)
+            rows.append((type(obj).__name__, region, obj_key, fetched_at, json.dumps(obj.raw()), item_id))
+
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT INTO snapshots (model, region, key, fetched_at, data, item_id)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return len(rows)
+
+    def _select(
+        self,
+        columns: str,
+        model: type[APIObject],
+        region: str,
+        key: str | None,
+        start: datetime | float | None,
+        end: datetime | float | None,
+        order: str = "ASC",
+        limit: int | None = None,
+        inclusive: bool = False,
+        item_id: str | None = None,
+    ) -> list[tuple]:
+        conditions, params = ["model = ?", "region = ?"], [model.__name__, region.upper()]
+        if key is not None:
+            conditions.append("key = ?")
+            params.append(key)
+        if item_id is not None:
+            conditions.append("item_id = ?")
+            params.append(item_id)
+        if start is not None:
+            conditions.append("fetched_at >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            conditions.append("fetched_at <= ?" if inclusive else "fetched_at < ?")
+            params.append(_timestamp(end))
+        query = (
+            f"SELECT {columns} FROM snapshots WHERE {' AND '.join(conditions)}"
+            f" ORDER BY fetched_at {order}, rowid {order}"
+        )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        with self._lock:
+            return self._db.execute(query, params).fetchall()
+
+    def query(
+        self,
+        model: type[APIObject],
+        region: str,
+        key: str | None = None,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        limit: int | None = None,
+        item_id: str | None = None,
+    ) -> list[Snapshot]:
+        """Retrieves the stored snapshots of the model fetched within the time range, oldest first.
+
+        Args:
+            model (type[APIObject]): The model of the objects.
+            region (str): The region the objects were fetched for.
+            key (str | None): The lookup key of the object. If None, objects with any key are returned.
+            start (datetime | float | None): The inclusive start of the fetch time range. Unbounded if None.
+            end (datetime | float | None): The exclusive end of the fetch time range. Unbounded if None.
+            limit (int | None): The maximum number of returned snapshots.
+            item_id (str | None): The item identifier of the objects, e.g. to get all lots of an item.
+                If None, objects of any item are returned.
+
+        Returns:
+            list[Snapshot]: The matching snapshots.
+        """
+        rows = self._select(
+            "region, key, fetched_at, data", model, region, key, start, end, limit=limit, item_id=item_id
+        )
+        return [Snapshot(*row[:3], model(**json.loads(row[3]))) for row in rows]
+
+    def latest(
+        self, model: type[APIObject], region: str, key: str, at: datetime | float | None = None
+    ) -> APIObject | None:
+        """Retrieves the most recently fetched state of an object.
+
+        Args:
+            model (type[APIObject]): The model of the object.
+            region (str): The region the object was fetched for.
+            key (str): The lookup key of the object.
+            at (datetime | float | None): If given, the state as of this moment is returned instead.
+
+        Returns:
+            APIObject | None: The object, or None if it has never been stored.
+        """
+        rows = self._select("data", model, region, key, None, at, order="DESC", limit=1, inclusive=True)
+        return model(**json.loads(rows[0][0])) if rows else None
+
+    def columns(
+        self,
+        model: type[APIObject],
+        region: str,
+        key: str | None = None,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        item_id: str | None = None,
+    ) -> dict[str, list[Any]]:
+        """Retrieves the stored objects as columns of raw values, without building models.
+
+        Columns are named after the model fields and hold the values as returned by the API, e.g.
+        datetimes are ISO 8601 strings. The `key` and `fetched_at` columns are added as well. The
+        result can be passed straight to `pandas.DataFrame` or `numpy.asarray`.
+
+        Args:
+            model (type[APIObject]): The model of the objects.
+            region (str): The region the objects were fetched for.
+            key (str | None): The lookup key of the object. If None, objects with any key are returned.
+            start (datetime | float | None): The inclusive start of the fetch time range. Unbounded if None.
+            end (datetime | float | None): The exclusive end of the fetch time range. Unbounded if None.
+            item_id (str | None): The item identifier of the objects. If None, objects of any item are returned.
+
+        Returns:
+            dict[str, list[Any]]: The columns, all of the same length.
+        """
+        fields = {field.alias or name: name for name, field in model.model_fields.items()}
+        columns = {"key": [], "fetched_at": [], **{name: [] for name in fields.values()}}
+        rows = self._select("key, fetched_at, data", model, region, key, start, end, item_id=item_id)
+        for obj_key, fetched_at, data in rows:
+            columns["key"].append(obj_key)
+            columns["fetched_at"].append(fetched_at)
+            data = json.loads(data)
+            for alias, name in fields.items():
+                columns[name].append(data.get(alias))
+        return columns
+
+    def delete(self, model: type[APIObject], region: str, before: datetime | float) -> int:
+        """Deletes the snapshots of the model fetched before the moment.
+
+        Args:
+            model (type[APIObject]): The model of the objects.
+            region (str): The region the objects were fetched for.
+            before (datetime | float): The moment to delete the older snapshots before.
+
+        Returns:
+            int: The number of deleted snapshots.
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM snapshots WHERE model = ? AND region = ? AND fetched_at < ?",
+                (model.__name__, region.upper(), _timestamp(before)),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,208 @@
+import json
+import threading
+from datetime import datetime
+from typing import Any, Hashable, Iterable
+
+from .objects import AuctionRedeemedLot
+
+
+def fingerprint(lot: AuctionRedeemedLot) -> tuple[int, int, str]:
+    """Returns the fields identifying a redeemed lot among the lots sold at the same moment.
+
+    Args:
+        lot (AuctionRedeemedLot): The redeemed lot.
+
+    Returns:
+        tuple[int, int, str]: The amount, the price and the serialized additional data of the lot.
+    """
+    return (lot.amount, lot.price, json.dumps(lot.additional, sort_keys=True))
+
+
+class Watermark:
+    """The position up to which the price history of an item has been synced.
+
+    The history has no lot identifiers, so besides the time of the latest sale the watermark keeps
+    the fingerprints of the sales made at that very moment. This way a lot sold in the same
+    millisecond as an already seen one is still recognized as new.
+
+    Attributes:
+        time (datetime): The time of the latest seen sale.
+        seen (frozenset[tuple]): The fingerprints of the seen sales made at `time`.
+    """
+
+    __slots__ = ("time", "seen")
+
+    def __init__(self, time: datetime, seen: Iterable[tuple] = ()) -> None:
+        self.time = time
+        self.seen = frozenset(tuple(item) for item in seen)
+
+    def is_older(self, lot: AuctionRedeemedLot) -> bool:
+        """Returns whether the lot was sold before the watermark, i.e. the sync can stop."""
+        return lot.time < self.time
+
+    def covers(self, lot: AuctionRedeemedLot) -> bool:
+        """Returns whether the lot has already been seen."""
+        return lot.time < self.time or (lot.time == self.time and fingerprint(lot) in self.seen)
+
+    def advance(self, lots: Iterable[AuctionRedeemedLot]) -> "Watermark":
+        """Returns the watermark moved past the new lots.
+
+        Args:
+            lots (Iterable[AuctionRedeemedLot]): The lots sold after the watermark.
+
+        Returns:
+            Watermark: The new watermark, or this one if there are no new lots.
+        """
+        lots = list(lots)
+        if not lots:
+            return self
+        latest = max(lot.time for lot in lots)
+        seen = {fingerprint(lot) for lot in lots if lot.time == latest}
+        if latest == self.time:
+            seen |= self.seen
+        return Watermark(latest, seen)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Watermark):
+            return NotImplemented
+        return (self.time, self.seen) == (other.time, other.seen)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(time={self.time.isoformat()!r}, seen={len(self.seen)})"
+
+
+class HistoryDelta:
+    """Collects the sales made since the watermark from a newest-first stream of sales.
+
+    The history is paged by offset, and every sale recorded during a sync shifts the offsets, so
+    a page may repeat sales of the previous one. The delta therefore advances by time rather than
+    by position: a sale newer than the last taken one, or already taken at the same moment, is a
+    repeat and is skipped. The stream ends once a sale older than the watermark is reached.
+
+    Attributes:
+        mark (Watermark | None): The watermark of the previous sync, None for the first one.
+        lots (list[AuctionRedeemedLot]): The new sales taken so far, newest first.
+    """
+
+    __slots__ = ("mark", "lots", "_time", "_taken")
+
+    def __init__(self, mark: Watermark | None) -> None:
+        self.mark = mark
+        self.lots: list[AuctionRedeemedLot] = []
+        self._time = None
+        self._taken: set[tuple] = set()
+
+    def add(self, lot: AuctionRedeemedLot) -> bool:
+        """Takes the sale if it is new.
+
+        Args:
+            lot (AuctionRedeemedLot): The next sale of the stream.
+
+        Returns:
+            bool: False if the sale is older than the watermark and the sync can stop, otherwise True.
+        """
+        if self.mark is not None and self.mark.is_older(lot):
+            return False
+        if self._time is not None and (
+            lot.time > self._time or (lot.time == self._time and fingerprint(lot) in self._taken)
+        ):
+            return True
+        if self.mark is not None and self.mark.covers(lot):
+            return True
+        if lot.time != self._time:
+            self._time, self._taken = lot.time, set()
+        self._taken.add(fingerprint(lot))
+        self.lots.append(lot)
+        return True
+
+
+class HistoryWatermarks:
+    """Per-region, per-item watermarks of incrementally synced auction price histories.
+
+    Pass the same instance to every `AuctionMethods.sync_history` call: the first call for an item
+    fetches its whole history, later ones only the sales made since the previous call. The
+    watermarks can be saved with `dump` and restored with `load` to resume syncing after a restart.
+
+    .. code-block:: python
+
+        watermarks = HistoryWatermarks()
+        new_lots = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks)
+    """
+
+    __slots__ = ("_marks", "_lock")
+
+    def __init__(self) -> None:
+        self._marks: dict[tuple[str, str], Watermark] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(region: str, item_id: str) -> tuple[str, str]:
+        return (region.upper(), item_id)
+
+    def get(self, region: str, item_id: str) -> Watermark | None:
+        """Returns the watermark of the item in the region, or None if it has never been synced."""
+        return self._marks.get(self.make_key(region, item_id))
+
+    def set(self, region: str, item_id: str, time: datetime) -> None:
+        """Sets the watermark of the item, e.g. to sync only the sales made after the given moment.
+
+        Args:
+            region (str): The region of the auction.
+            item_id (str): The unique identifier of the item.
+            time (datetime): The moment the next sync starts from, with a timezone. Sales made exactly
+                at this moment are considered new.
+
+        Raises:
+            ValueError: If the moment is a naive datetime, which cannot be compared with the sale times.
+        """
+        if time.tzinfo is None:
+            raise ValueError("The watermark time must be timezone-aware, e.g. in UTC.")
+        with self._lock:
+            self._marks[self.make_key(region, item_id)] = Watermark(time)
+
+    def advance(self, key: Hashable, lots: list[AuctionRedeemedLot]) -> None:
+        """Moves the watermark of the key past the new lots.
+
+        Args:
+            key (Hashable): The key of the watermark, as returned by `make_key`.
+            lots (list[AuctionRedeemedLot]): The lots returned by the sync.
+        """
+        if not lots:
+            return
+        with self._lock:
+            current = self._marks.get(key) or Watermark(min(lot.time for lot in lots))
+            self._marks[key] = current.advance(lots)
+
+    def dump(self) -> dict[str, Any]:
+        """Serializes the watermarks into a JSON-compatible dictionary.
+
+        Returns:
+            dict[str, Any]: The watermarks, keyed by `"{region}/{item_id}"`.
+        """
+        with self._lock:
+            marks = list(self._marks.items())
+        return {
+            f"{region}/{item_id}": {"time": mark.time.isoformat(), "seen": sorted(mark.seen)}
+            for (region, item_id), mark in marks
+        }
+
+    @classmethod
+    def load(cls, data: dict[str, Any]) -> "HistoryWatermarks":
+        """Restores watermarks serialized by `dump`.
+
+        Args:
+            data (dict[str, Any]): The serialized watermarks.
+
+        Returns:
+            HistoryWatermarks: The restored watermarks.
+        """
+        watermarks = cls()
+        for name, mark in data.items():
+            region, item_id = name.split("/", 1)
+            watermarks._marks[cls.make_key(region, item_id)] = Watermark(
+                datetime.fromisoformat(mark["time"]), mark["seen"]
+            )
+        return watermarks
+
+    def __len__(self) -> int:
+        return len(self._marks)
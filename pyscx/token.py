@@ -1,4 +1,9 @@
+import threading
+import time
 from enum import Enum
+from typing import Any, Collection, Mapping
+
+from .ratelimit import retry_after
 
 
 class TokenType(Enum):
@@ -26,3 +31,181 @@ class Token(object):
         """
         self.value = value
         self.type = type
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self.value == other.value and self.type == other.type
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.type))
+
+
+class TokenState:
+    """Usage state of a token within a `TokenPool`.
+
+    Attributes:
+        token (Token): The token itself.
+        remaining (int | None): The estimated remaining quota of the token, if known.
+        cooldown_until (float): The monotonic time until which the token is not used.
+        requests (int): The number of requests the token has been handed out for.
+        failures (int): The number of `401`/`429` responses received with the token.
+    """
+
+    __slots__ = ("token", "remaining", "cooldown_until", "requests", "failures")
+
+    def __init__(self, token: Token) -> None:
+        self.token = token
+        self.remaining = None
+        self.cooldown_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(type={self.token.type}, remaining={self.remaining}, "
+            f"requests={self.requests}, failures={self.failures})"
+        )
+
+
+class TokenPool:
+    """A pool of access tokens that spreads requests across several tokens of the same type.
+
+    Each token has its own rate quota, so the total throughput grows with the number of tokens.
+    Tokens are handed out either in turn (`"round_robin"`) or by the largest remaining quota
+    reported by the API (`"least_loaded"`). Tokens rejected with `401 Unauthorized` or
+    `429 Too Many Requests` are put on cooldown and skipped while other tokens are available.
+
+    The pool is thread-safe. Lookups by token type (`pool[TokenType.APPLICATION]`) return the value
+    of the next token to use and raise `KeyError` if the pool holds no tokens of that type.
+
+    .. code-block:: python
+
+        pool = TokenPool([Token(value, TokenType.APPLICATION) for value in values], strategy="least_loaded")
+        api = API(tokens=pool, server=Server.PRODUCTION)
+    """
+
+    STRATEGIES = ("round_robin", "least_loaded")
+
+    def __init__(
+        self, tokens: Token | Collection[Token] = (), strategy: str = "round_robin", cooldown: float = 60
+    ) -> None:
+        """Initializes the token pool.
+
+        Args:
+            tokens (Token | Collection[Token]): A single token or a collection of tokens.
+            strategy (str): How the next token is picked: `"round_robin"` or `"least_loaded"`.
+            cooldown (float): How long a rejected token is not used, in seconds, unless the response
+                says otherwise with a `Retry-After` header.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown token rotation strategy '{strategy}', expected one of {self.STRATEGIES}."
+            )
+
+        self.strategy = strategy
+        self.cooldown = cooldown
+
+        self._states: dict[TokenType, list[TokenState]] = {}
+        self._by_value: dict[str, TokenState] = {}
+        self._cursors: dict[TokenType, int] = {}
+        self._lock = threading.Lock()
+
+        for token in [tokens] if isinstance(tokens, Token) else tokens:
+            self.add(token)
+
+    def add(self, token: Token) -> None:
+        """Adds a token to the pool. Tokens already in the pool are ignored.
+
+        Args:
+            token (Token): The token to add.
+        """
+        with self._lock:
+            if token.value in self._by_value:
+                return
+            state = TokenState(token)
+            self._states.setdefault(token.type, []).append(state)
+            self._by_value[token.value] = state
+
+    def states(self, type: TokenType) -> list[TokenState]:
+        """Returns the usage states of the tokens of the given type.
+
+        Args:
+            type (TokenType): The type of the tokens.
+
+        Returns:
+            list[TokenState]: The states, in the order the tokens were added.
+        """
+        with self._lock:
+            return list(self._states.get(type, ()))
+
+    def __contains__(self, type: TokenType) -> bool:
+        return bool(self._states.get(type))
+
+    def __len__(self) -> int:
+        return len(self._by_value)
+
+    def __getitem__(self, type: TokenType) -> str:
+        return self.acquire(type)
+
+    def acquire(self, type: TokenType) -> str:
+        """Picks the token to send the next request with.
+
+        Args:
+            type (TokenType): The type of the required token.
+
+        Returns:
+            str: The value of the picked token.
+
+        Raises:
+            KeyError: If the pool holds no tokens of the given type.
+        """
+        with self._lock:
+            states = self._states.get(type)
+            if not states:
+                raise KeyError(type)
+
+            now = time.monotonic()
+            ready = [state for state in states if state.cooldown_until <= now]
+            if not ready:
+                state = min(states, key=lambda state: state.cooldown_until)
+            elif self.strategy == "least_loaded":
+                state = max(ready, key=lambda state: float("inf") if state.remaining is None else state.remaining)
+            else:
+                cursor = self._cursors.get(type, 0)
+                while states[cursor % len(states)].cooldown_until > now:
+                    cursor += 1
+                state = states[cursor % len(states)]
+                self._cursors[type] = cursor + 1
+
+            state.requests += 1
+            if state.remaining is not None:
+                state.remaining -= 1
+            return state.token.value
+
+    def observe(self, request_headers: Mapping[str, str] | None, response: Any) -> None:
+        """Updates the state of the token a request was sent with from its response.
+
+        This method is registered as a response hook of the HTTP session.
+
+        Args:
+            request_headers (Mapping[str, str] | None): Headers of the request.
+            response (Any): The response of the API server.
+        """
+        authorization = (request_headers or {}).get("Authorization", "")
+        state = self._by_value.get(authorization.removeprefix("Bearer "))
+        if state is None:
+            return
+
+        with self._lock:
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                state.remaining = int(remaining)
+
+            if response.status_code in (401, 429):
+                state.failures += 1
+                delay = retry_after(response.headers)
+                state.cooldown_until = time.monotonic() + (self.cooldown if delay is None else delay)
@@ -0,0 +1,230 @@
+import socket
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .exceptions import DeadlineExceeded
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+"""How long establishing a connection may take by default (in seconds)."""
+DEFAULT_READ_TIMEOUT = 30.0
+"""How long the server may stay silent while a response is read by default (in seconds)."""
+DEFAULT_POOL_MAXSIZE = 100
+"""The default number of connections kept open per host."""
+DEFAULT_KEEP_ALIVE = 60.0
+"""How long idle connections are kept for reuse by default (in seconds)."""
+
+
+def _brotli_available() -> bool:
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            pass
+    return False
+
+
+class Transport:
+    """Connection settings of the HTTP sessions: pooling, timeouts, keep-alive and compression.
+
+    The defaults suit a client shared by a pool of worker threads: enough pooled connections for
+    every worker to reuse its own, bounded connect and read timeouts, so a hung socket cannot
+    block a worker forever, and compressed responses.
+
+    .. code-block:: python
+
+        transport = Transport(pool_maxsize=32, read_timeout=10, deadline=60)
+        api = API(tokens=app_token, server=Server.PRODUCTION, transport=transport)
+
+    Attributes:
+        pool_connections (int): The number of hosts connection pools are kept for.
+        pool_maxsize (int): The number of connections kept open per host.
+        pool_block (bool): Whether requests wait for a free connection once `pool_maxsize` connections
+            are in use, instead of opening extra connections that are not kept.
+        connect_timeout (float | None): How long establishing a connection may take, in seconds.
+        read_timeout (float | None): How long the server may stay silent while a response is read, in seconds.
+        keep_alive (float | None): How long idle connections are kept for reuse, in seconds. The synchronous
+            client sends TCP keep-alive probes after this idle time, so dead connections are detected,
+            the asynchronous client closes connections idle for longer. If None, every request opens
+            a new connection.
+        compression (bool): Whether to ask for gzip/deflate compressed responses, and brotli if `brotli`
+            (or `brotlicffi`) is installed.
+        deadline (float | None): The default time limit of every API call, in seconds, including retries
+            and all pages of paginated methods.
+    """
+
+    __slots__ = (
+        "pool_connections",
+        "pool_maxsize",
+        "pool_block",
+        "connect_timeout",
+        "read_timeout",
+        "keep_alive",
+        "compression",
+        "deadline",
+    )
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+        keep_alive: float | None = DEFAULT_KEEP_ALIVE,
+        compression: bool = True,
+        deadline: float | None = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        self.compression = compression
+        self.deadline = deadline
+
+    @property
+    def timeout(self) -> tuple[float | None, float | None]:
+        """Returns the connect and read timeouts, as accepted by `requests`."""
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def accept_encoding(self) -> str:
+        """Returns the value of the `Accept-Encoding` header."""
+        if not self.compression:
+            return "identity"
+        return "gzip, deflate, br" if _brotli_available() else "gzip, deflate"
+
+    def adapter(self) -> HTTPAdapter:
+        """Builds a `requests` adapter with the pooling and keep-alive settings.
+
+        Returns:
+            HTTPAdapter: The adapter to mount on a `requests.Session`.
+        """
+        socket_options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive is not None:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                idle = max(1, int(self.keep_alive))
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+        return _SocketOptionsAdapter(
+            socket_options,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def connector(self, limit: int | None = None) -> "aiohttp.TCPConnector":
+        """Builds an `aiohttp` connector with the pooling and keep-alive settings.
+
+        Args:
+            limit (int | None): The maximum number of open connections. Defaults to `pool_maxsize`.
+
+        Returns:
+            aiohttp.TCPConnector: The connector of an `aiohttp.ClientSession`.
+        """
+        limit = limit if limit is not None else self.pool_maxsize
+        if self.keep_alive is None:
+            return aiohttp.TCPConnector(limit=limit, force_close=True)
+        return aiohttp.TCPConnector(limit=limit, keepalive_timeout=self.keep_alive)
+
+    def client_timeout(self, deadline: "Deadline | None" = None) -> "aiohttp.ClientTimeout":
+        """Builds the `aiohttp` timeout of a request.
+
+        Args:
+            deadline (Deadline | None): The deadline of the API call, bounding the whole request.
+
+        Returns:
+            aiohttp.ClientTimeout: The timeout of the request.
+        """
+        connect, read = self.timeout if deadline is None else deadline.clamp(self.timeout)
+        total = deadline.remaining() if deadline is not None else None
+        return aiohttp.ClientTimeout(total=total, connect=connect, sock_read=read)
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(self, socket_options: list[tuple], **kwargs) -> None:
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class Deadline:
+    """The moment by which an API call has to finish, including its retries and pages.
+
+    Every request of the call gets timeouts no longer than the remaining time, and a retry is
+    abandoned if its delay would outlast the deadline. The synchronous client bounds every read
+    from the connection separately, so a server trickling out a response may overrun the deadline.
+
+    Attributes:
+        expires (float): The `time.monotonic()` value at which the deadline expires.
+    """
+
+    __slots__ = ("expires",)
+
+    def __init__(self, seconds: float) -> None:
+        """Starts the deadline.
+
+        Args:
+            seconds (float): The time limit, in seconds from now.
+        """
+        self.expires = time.monotonic() + seconds
+
+    @classmethod
+    def after(cls, seconds: float | None) -> "Deadline | None":
+        """Starts a deadline, if a time limit is given.
+
+        Args:
+            seconds (float | None): The time limit, in seconds from now.
+
+        Returns:
+            Deadline | None: The deadline, or None if `seconds` is None.
+        """
+        return cls(seconds) if seconds is not None else None
+
+    def remaining(self) -> float:
+        """Returns the number of seconds left before the deadline, zero if it has expired."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Returns whether the deadline has expired."""
+        return time.monotonic() >= self.expires
+
+    def check(self, url: str) -> None:
+        """Raises `DeadlineExceeded` if the deadline has expired.
+
+        Args:
+            url (str): The URL of the request about to be sent.
+
+        Raises:
+            DeadlineExceeded: If the deadline has expired.
+        """
+        if self.expired:
+            raise DeadlineExceeded(url=url)
+
+    def clamp(self, timeout: tuple[float | None, float | None]) -> tuple[float, float]:
+        """Shortens the connect and read timeouts to the remaining time.
+
+        Args:
+            timeout (tuple[float | None, float | None]): The connect and read timeouts.
+
+        Returns:
+            tuple[float, float]: The timeouts, none of them longer than the remaining time.
+        """
+        remaining = self.remaining()
+        return tuple(remaining if value is None else min(value, remaining) for value in timeout)
@@ -0,0 +1,175 @@
+from functools import lru_cache
+from typing import Any, Callable, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+from .objects import APIObject
+
+
+_MISSING = object()
+_PLAIN_TYPES = frozenset({str, int, float, bool})
+
+
+class ModelView:
+    """A read-only view of a raw API object, converting its fields only when they are read.
+
+    A view keeps a reference to the decoded JSON object and exposes the same attributes as its
+    model. Every field is validated the first time it is accessed, and the result is kept for the
+    following accesses. Fields that already have the right type, such as identifiers, counters and
+    the `additional` dictionaries, are returned as they are, without copying. Nested objects are
+    views themselves.
+
+    Views are created with `view_class(model)`, or by passing `lazy=True` to an API method:
+
+    .. code-block:: python
+
+        clans = api.clans(region="EU").get_all(limit=100, lazy=True)
+        largest = max(clans, key=lambda clan: clan.member_count)
+        print(largest.name, largest.to_model())
+
+    Attributes:
+        model (type[APIObject]): The model class the view mirrors.
+    """
+
+    __slots__ = ("_data", "_values")
+
+    model: type[APIObject]
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initializes the view.
+
+        Args:
+            data (dict[str, Any]): The decoded JSON object, with the keys as returned by the API.
+        """
+        self._data = data
+        self._values: dict[str, Any] | None = None
+
+    @classmethod
+    def from_records(cls, data: dict[str, Any] | list[dict[str, Any]]) -> "ModelView | list[ModelView]":
+        """Wraps decoded JSON objects into views.
+
+        Args:
+            data (dict[str, Any] | list[dict[str, Any]]): A decoded object or a list of them.
+
+        Returns:
+            ModelView | list[ModelView]: A view, or a list of views.
+        """
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        return cls(data)
+
+    def raw(self) -> dict[str, Any]:
+        """Returns the decoded JSON object the view is built on. The dictionary must not be modified."""
+        return self._data
+
+    def to_model(self) -> APIObject:
+        """Validates the whole object into an instance of the model.
+
+        Returns:
+            APIObject: The model instance, equal to the one returned without `lazy=True`.
+
+        Raises:
+            pydantic.ValidationError: If the object does not match the model.
+        """
+        return self.model.model_validate(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModelView):
+            return self.model is other.model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class _LazyField:
+    __slots__ = ("name", "alias", "convert", "required", "default")
+
+    def __init__(
+        self, name: str, alias: str, convert: Callable[[Any], Any], required: bool, default: Any
+    ) -> None:
+        self.name = name
+        self.alias = alias
+        self.convert = convert
+        self.required = required
+        self.default = default
+
+    def __get__(self, view: ModelView | None, owner: type) -> Any:
+        if view is None:
+            return self
+        values = view._values
+        if values is None:
+            values = view._values = {}
+        value = values.get(self.name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        raw = view._data.get(self.alias, _MISSING)
+        if raw is _MISSING:
+            if self.required:
+                # Reports the missing field the same way as the model would.
+                view.to_model()
+            value = self.default
+        else:
+            value = self.convert(raw)
+        values[self.name] = value
+        return value
+
+    def __set__(self, view: ModelView, value: Any) -> None:
+        raise AttributeError(f"'{type(view).__name__}' is read-only")
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any]:
+    """Builds the function converting a raw JSON value into the type of a model field."""
+    if isinstance(annotation, type) and issubclass(annotation, APIObject):
+        return view_class(annotation)
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is list and len(args) == 1 and isinstance(args[0], type) and issubclass(args[0], APIObject):
+        nested = view_class(args[0])
+        return lambda raw: [nested(item) for item in raw]
+
+    validate = TypeAdapter(annotation).validate_python
+    if annotation in _PLAIN_TYPES:
+        return lambda raw: raw if type(raw) is annotation else validate(raw)
+    if origin is dict and args == (str, Any):
+        # Keys of decoded JSON objects are always strings.
+        return lambda raw: raw if type(raw) is dict else validate(raw)
+    if origin is list and len(args) == 1 and args[0] in _PLAIN_TYPES:
+        item_type = args[0]
+
+        def convert(raw: Any) -> Any:
+            if type(raw) is list and all(type(item) is item_type for item in raw):
+                return raw
+            return validate(raw)
+
+        return convert
+    return validate
+
+
+@lru_cache(maxsize=None)
+def view_class(model: type[APIObject]) -> type[ModelView]:
+    """Returns the lazy view class of a model.
+
+    The class has one attribute per field of the model, named like the field of the model
+    and read from the key given by its alias.
+
+    Args:
+        model (type[APIObject]): The model class.
+
+    Returns:
+        type[ModelView]: The view class, e.g. `ClanView` for `Clan`.
+    """
+    fields = {
+        name: _LazyField(
+            name,
+            field.alias or name,
+            _converter(field.annotation),
+            field.is_required(),
+            None if field.is_required() else field.get_default(call_default_factory=True),
+        )
+        for name, field in model.model_fields.items()
+    }
+    return type(f"{model.__name__}View", (ModelView,), {"__slots__": (), "model": model, **fields})
@@ -2,10 +2,25 @@ from typing import Any
 
 import pytest
 
+from pyscx.http import APISession, AsyncAPISession
+from pyscx.mock import MockAPIServer
+
 
 TestData = dict[str, Any]
 
 
+@pytest.fixture
+def api_server(monkeypatch) -> MockAPIServer:
+    """Mock API server serving only the routes set by the test and recording every request.
+
+    All sessions created within the test are pointed at it.
+    """
+    with MockAPIServer(generate=False, record=True) as server:
+        for session_class in (APISession, AsyncAPISession):
+            monkeypatch.setattr(session_class, "server_url", property(lambda self: server.url))
+        yield server
+
+
 @pytest.fixture
 def valid_region_data() -> TestData:
     """Sample data from the STALCRAFT:X API demo server.
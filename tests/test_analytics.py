@@ -0,0 +1,162 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.history import PriceHistory
+from pyscx.objects import AuctionLot
+from pyscx.token import Token, TokenType
+
+
+np = pytest.importorskip("numpy")
+
+from pyscx.analytics import CandleBuilder, Candles, LotBook, outlier_mask  # noqa: E402
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+def lot(item_id: str, amount: int, buyout: int, end: str = "2030-01-01T00:00:00Z", **extra) -> dict:
+    return {
+        "itemId": item_id,
+        "amount": amount,
+        "startPrice": 1,
+        "buyoutPrice": buyout,
+        "startTime": "2025-01-01T00:00:00Z",
+        "endTime": end,
+        "additional": {},
+        **extra,
+    }
+
+
+LOTS = [
+    lot("a", 1, 300),
+    lot("b", 2, 100),
+    lot("a", 2, 200),
+    lot("a", 1, 0, currentPrice=50),
+    lot("b", 1, 90, end="2020-01-01T00:00:00Z"),
+    lot("a", 4, 1200),
+]
+
+
+@pytest.fixture
+def book() -> LotBook:
+    return LotBook.from_records(LOTS)
+
+
+def sales(*rows: tuple[str, int, int]) -> PriceHistory:
+    return PriceHistory.from_records(
+        [{"amount": amount, "price": price, "time": time, "additional": {}} for time, amount, price in rows]
+    )
+
+
+def test_rows_match_models(book):
+    assert list(book) == [AuctionLot(**record) for record in LOTS]
+    assert book[3].current_price == 50 and book[0].current_price is None
+    assert list(book.items) == ["a", "b"]
+
+
+def test_cheapest(book):
+    cheapest = book.cheapest(2)
+
+    assert list(cheapest.item_id) == ["a", "a", "b", "b"]
+    assert list(cheapest.unit_buyout) == [100.0, 300.0, 50.0, 90.0]
+    assert list(book.active(at=datetime(2025, 6, 1)).cheapest(1).buyout_price) == [200, 100]
+    with pytest.raises(ValueError):
+        book.cheapest(0)
+
+
+def test_depth_curves(book):
+    curves = book.depth_curves()
+
+    assert set(curves) == {"a", "b"}
+    depth = curves["a"]
+    assert list(depth.price) == [100.0, 300.0, 300.0] and list(depth.volume) == [2, 3, 7]
+    assert depth.cost_of(1) == 200 and depth.cost_of(3) == 500 and np.isnan(depth.cost_of(8))
+    assert list(depth.cost_of([0, 2, 7])) == [0.0, 200.0, 1700.0]
+    assert depth.price_at(3) == 300.0
+    assert len(book.depth("missing")) == 0
+
+
+def test_update_replaces_items(book):
+    fresh = LotBook.from_records([lot("b", 5, 50)])
+
+    updated = book.update(fresh)
+
+    assert list(updated.for_item("b").amount) == [5]
+    assert len(updated.for_item("a")) == 4
+
+
+def test_outliers():
+    prices = np.array([100, 101, 99, 100, 5000, 10, 11, 10, np.nan, 200], dtype=float)
+    groups = np.array(["a", "a", "a", "a", "a", "b", "b", "b", "b", "b"])
+
+    assert list(np.flatnonzero(outlier_mask(prices, groups))) == [4, 9]
+    assert not outlier_mask([5.0, 5.0, 5.0]).any()
+    assert list(outlier_mask([5.0, 5.0, 5.0, 5.0, 50.0])) == [False] * 4 + [True]
+
+
+def test_book_outliers():
+    book = LotBook.from_records([lot("a", 1, price) for price in (100, 102, 98, 101, 99, 1)])
+
+    assert list(book.without_outliers().buyout_price) == [100, 102, 98, 101, 99]
+
+
+def test_candles():
+    history = sales(
+        ("2024-01-01T00:40:00Z", 1, 120),
+        ("2024-01-01T00:10:00Z", 2, 200),
+        ("2024-01-01T00:20:00Z", 1, 80),
+        ("2024-01-01T02:05:00Z", 1, 150),
+    )
+
+    candles = Candles.from_history(history, interval=timedelta(hours=1))
+
+    assert list(candles.start) == [np.datetime64("2024-01-01T00:00"), np.datetime64("2024-01-01T02:00")]
+    assert list(candles.open) == [100.0, 150.0] and list(candles.close) == [120.0, 150.0]
+    assert list(candles.high) == [120.0, 150.0] and list(candles.low) == [80.0, 150.0]
+    assert list(candles.volume) == [4, 1] and list(candles.count) == [3, 1]
+    assert list(candles.vwap) == [100.0, 150.0]
+    assert len(Candles.from_history(sales(), 60)) == 0
+
+
+def test_incremental_candles_match_batch():
+    rows = [(f"2024-01-01T00:{minute:02d}:00Z", 1 + minute % 3, 100 + minute * 7 % 50) for minute in range(60)]
+    builder = CandleBuilder(interval=600)
+
+    for chunk in (rows[40:], rows[:15], rows[15:40]):
+        builder.update("1kv2", sales(*chunk))
+    candles, expected = builder["1kv2"], Candles.from_history(sales(*rows), 600)
+
+    for column in Candles.__slots__[1:]:
+        assert np.array_equal(getattr(candles, column), getattr(expected, column))
+    assert builder.update("1kv2", []) is not None and len(builder) == 1
+    with pytest.raises(ValueError):
+        candles.merge(Candles.from_history(sales(*rows), 60))
+
+
+@pytest.fixture
+def lots(api_server):
+    api_server.routes["/EU/auction/a/lots"] = {"total": 2, "lots": LOTS[:1] + LOTS[2:3]}
+    api_server.routes["/EU/auction/b/lots"] = {"total": 1, "lots": LOTS[1:2]}
+    return api_server
+
+
+def test_items_lots(lots):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = api.auction(region="EU").get_items_lots(item_ids=["a", "b", "missing"], limit=200)
+    book = LotBook.concat(result.values.values())
+
+    assert set(result.errors) == {"missing"}
+    assert list(book.item_id) == ["a", "a", "b"]
+    assert all(params["limit"] == "200" for _, params, _ in lots.calls)
+
+
+def test_async_lots_columns(lots):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.auction(region="EU").get_lots_columns(item_id="b")
+
+    assert list(asyncio.run(fetch()).buyout_price) == [100]
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from requests.exceptions import HTTPError
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.exceptions import MissingTokenError
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+CLAN_ID = "647d6c53-b3d7-4d30-8d08-de874eb1d845"
+
+
+@pytest.fixture
+def routes(
+    api_server,
+    valid_region_data,
+    valid_emission_data,
+    valid_active_lot_data,
+    valid_redeemed_lot_data,
+    valid_clan_data,
+    valid_clan_member_data,
+    valid_user_character_data,
+    valid_character_profile_data,
+):
+    api_server.routes.update(
+        {
+            "/regions": [valid_region_data],
+            "/EU/emission": valid_emission_data,
+            "/EU/friends/Test-1": ["Test-2"],
+            "/EU/auction/1kv2/history": {"total": 1, "prices": [valid_redeemed_lot_data]},
+            "/EU/auction/1kv2/lots": {"total": 1, "lots": [valid_active_lot_data]},
+            "/EU/characters": [valid_user_character_data],
+            "/EU/character/by-name/Test-1/profile": valid_character_profile_data,
+            f"/EU/clan/{CLAN_ID}/info": valid_clan_data,
+            f"/EU/clan/{CLAN_ID}/members": [valid_clan_member_data],
+            "/EU/clans": {"totalClans": 1, "data": [valid_clan_data]},
+        }
+    )
+    return api_server
+
+
+API_METHODS_TEST_CASES = [
+    ("regions", "get_all", {}),
+    ("emissions", "get_info", {}),
+    ("friends", "get_all", {"character_name": "Test-1"}),
+    ("auction", "get_item_history", {"item_id": "1kv2"}),
+    ("auction", "get_item_lots", {"item_id": "1kv2"}),
+    ("characters", "get_all", {}),
+    ("characters", "get_profile", {"character_name": "Test-1"}),
+    ("clans", "get_info", {"clan_id": CLAN_ID}),
+    ("clans", "get_members", {"clan_id": CLAN_ID}),
+    ("clans", "get_all", {}),
+]
+
+
+@pytest.mark.parametrize(
+    "group, method, kwargs",
+    API_METHODS_TEST_CASES,
+    ids=[f"{g}.{m}()" for g, m, _ in API_METHODS_TEST_CASES],
+)
+def test_async_matches_sync(routes, group, method, kwargs):
+    """The asynchronous client returns exactly the same objects as the synchronous one."""
+    api = API(server=Server.DEMO, tokens=[USER_TOKEN, APP_TOKEN])
+    expected = getattr(getattr(api, group)(region="EU"), method)(**kwargs)
+
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=[USER_TOKEN, APP_TOKEN]) as async_api:
+            return await getattr(getattr(async_api, group)(region="EU"), method)(**kwargs)
+
+    assert asyncio.run(fetch()) == expected
+
+
+def test_async_sends_resolved_token(routes):
+    """Token resolution and redefinition work the same way as in the synchronous client."""
+
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            await api.clans(region="EU").get_all(limit=5)
+            await api.clans(region="EU").get_all(token="other-token")
+
+    asyncio.run(fetch())
+
+    (_, params, first), (_, _, second) = routes.calls
+    assert params == {"limit": "5"}
+    assert first["Authorization"] == "Bearer app-token"
+    assert second["Authorization"] == "Bearer other-token"
+
+
+def test_async_missing_token(routes):
+    api = AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN)
+
+    with pytest.raises(MissingTokenError):
+        api.friends(region="EU").get_all(character_name="Test-1")
+
+
+def test_async_http_error(routes):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            await api.clans(region="EU").get_info(clan_id="unknown")
+
+    with pytest.raises(HTTPError) as exc_info:
+        asyncio.run(fetch())
+
+    assert exc_info.value.response.status_code == 404
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+from requests.exceptions import HTTPError
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.batch import BatchResult, run_batch
+from pyscx.exceptions import MissingTokenError
+from pyscx.objects import ClanMember, FullCharacterInfo
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+NAMES = [f"Test-{i}" for i in range(20)]
+
+
+@pytest.fixture
+def profiles(api_server, valid_character_profile_data):
+    for name in NAMES:
+        if name != "Test-13":
+            api_server.routes[f"/EU/character/by-name/{name}/profile"] = {
+                **valid_character_profile_data,
+                "username": name,
+            }
+    return api_server
+
+
+@pytest.mark.parametrize("ordered", [True, False], ids=["ordered", "as_completed"])
+def test_get_profiles(profiles, ordered):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = api.characters(region="EU").get_profiles(NAMES, max_workers=4, ordered=ordered)
+
+    assert isinstance(result, BatchResult)
+    assert len(result) == len(NAMES)
+    if ordered:
+        assert [item.key for item in result] == NAMES
+    assert set(result.errors) == {"Test-13"}
+    assert isinstance(result.errors["Test-13"], HTTPError)
+    assert all(isinstance(profile, FullCharacterInfo) for profile in result.values.values())
+    assert result.values["Test-7"].name == "Test-7"
+
+
+def test_get_members_for(api_server, valid_clan_member_data):
+    for clan_id in "abc":
+        api_server.routes[f"/EU/clan/{clan_id}/members"] = [valid_clan_member_data]
+    api = API(server=Server.DEMO, tokens=USER_TOKEN)
+
+    result = api.clans(region="EU").get_members_for("abc")
+
+    assert [item.key for item in result] == ["a", "b", "c"]
+    assert all(isinstance(members[0], ClanMember) for members in result.values.values())
+
+
+def test_batch_checks_token_up_front():
+    api = API(server=Server.DEMO, tokens=USER_TOKEN)
+
+    with pytest.raises(MissingTokenError):
+        api.clans(region="EU").get_infos(["a", "b"])
+
+
+def test_batch_runs_concurrently():
+    def slow(key):
+        time.sleep(0.05)
+        return key * 2
+
+    started = time.perf_counter()
+    result = run_batch(slow, range(8), max_workers=8)
+
+    assert time.perf_counter() - started < 0.3
+    assert [item.value for item in result] == [i * 2 for i in range(8)]
+
+
+def test_async_get_profiles(profiles):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.characters(region="EU").get_profiles(NAMES, max_workers=5)
+
+    result = asyncio.run(fetch())
+
+    assert [item.key for item in result] == NAMES
+    assert set(result.errors) == {"Test-13"}
+    assert result.values["Test-0"].name == "Test-0"
@@ -0,0 +1,182 @@
+import json
+
+import pytest
+
+from pyscx import API, Server
+from pyscx.cache import DiskCache, ResponseCache
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+
+
+@pytest.fixture
+def routes(api_server, valid_region_data, valid_active_lot_data):
+    api_server.routes.update(
+        {
+            "/regions": [valid_region_data],
+            "/EU/auction/1kv2/lots": {"total": 1, "lots": [valid_active_lot_data]},
+            "/EU/friends/Test-1": ["Test-2"],
+        }
+    )
+    return api_server
+
+
+def test_cache_hit(routes):
+    cache = ResponseCache()
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+
+    first = api.regions().get_all()
+    second = api.regions().get_all()
+
+    assert first == second
+    assert len(routes.calls) == 1
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_ratio == 0.5
+
+
+def test_cache_key_includes_params_and_token_type(routes):
+    cache = ResponseCache()
+    api = API(server=Server.DEMO, tokens=[APP_TOKEN, USER_TOKEN], cache=cache)
+
+    api.auction(region="EU").get_item_lots(item_id="1kv2")
+    api.auction(region="EU").get_item_lots(item_id="1kv2", limit=5)
+    api.auction(region="EU").get_item_lots(item_id="1kv2", token="other-token")
+    api.friends(region="EU").get_all(character_name="Test-1")
+    api.friends(region="EU").get_all(character_name="Test-1", token="other-user-token")
+    api.friends(region="EU").get_all(character_name="Test-1", token="other-user-token")
+
+    assert len(routes.calls) == 4
+    assert cache.stats.hits == 2
+
+
+def test_pooled_tokens_share_the_cache(routes):
+    cache = ResponseCache()
+    tokens = [Token(value=f"app-token-{i}", type=TokenType.APPLICATION) for i in range(4)]
+    api = API(server=Server.DEMO, tokens=tokens, cache=cache)
+
+    for _ in range(4):
+        api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    assert len(routes.calls) == 1
+    assert cache.stats.hits == 3
+
+
+def test_per_token_endpoints(routes):
+    cache = ResponseCache(per_token=["{region}/auction/{item}/lots"])
+    tokens = [Token(value=f"app-token-{i}", type=TokenType.APPLICATION) for i in range(2)]
+    api = API(server=Server.DEMO, tokens=tokens, cache=cache)
+
+    for _ in range(4):
+        api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    assert [headers["Authorization"] for _, _, headers in routes.calls] == [
+        "Bearer app-token-0",
+        "Bearer app-token-1",
+    ]
+    assert cache.stats.hits == 2
+
+
+def test_cache_ttl_per_endpoint(routes):
+    cache = ResponseCache(ttl={"{region}/auction/{item}/lots": 0})
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+
+    api.auction(region="EU").get_item_lots(item_id="1kv2")
+    api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    assert len(routes.calls) == 2
+    assert cache.ttl_for("EU/auction/1kv2/lots") == 0
+    assert cache.ttl_for("/regions") == 24 * 60 * 60
+
+
+def test_cache_eviction(routes):
+    cache = ResponseCache(maxsize=2)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+
+    for limit in range(3):
+        api.auction(region="EU").get_item_lots(item_id="1kv2", limit=limit)
+
+    stats = cache.stats
+    assert (stats.evictions, stats.size) == (1, 2)
+
+
+def test_cache_expiration(routes):
+    cache = ResponseCache()
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+    api.regions().get_all()
+
+    expired = cache._entries.timer() + 24 * 60 * 60 + 1
+    cache._entries.expire(expired)
+
+    assert cache.stats.expirations == 1
+    assert cache.stats.size == 0
+
+
+@pytest.fixture
+def etag_routes(api_server, valid_clan_data):
+    def clan_info(params, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, valid_clan_data, {"ETag": '"v1"'}
+
+    api_server.routes["/EU/clan/1/info"] = clan_info
+    return api_server
+
+
+def test_disk_cache_survives_restart(etag_routes, tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    first = API(server=Server.DEMO, tokens=APP_TOKEN, cache=DiskCache(path))
+    clan = first.clans(region="EU").get_info(clan_id="1")
+
+    restarted = API(server=Server.DEMO, tokens=APP_TOKEN, cache=DiskCache(path))
+
+    assert restarted.clans(region="EU").get_info(clan_id="1") == clan
+    assert len(etag_routes.calls) == 1
+
+
+def test_disk_cache_revalidation(etag_routes, tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3", ttl={"{region}/clan/{clan-id}/info": 1e-9})
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+
+    first = api.clans(region="EU").get_info(clan_id="1")
+    second = api.clans(region="EU").get_info(clan_id="1")
+    third = api.clans(region="EU").get_info(clan_id="1")
+
+    assert "If-None-Match" not in etag_routes.calls[0][2]
+    assert etag_routes.calls[1][2]["If-None-Match"] == '"v1"'
+    assert cache.stats.revalidations == 2
+    # The unchanged body is not parsed again.
+    assert second == first
+    assert third is second
+
+
+def test_disk_cache_results_are_not_shared(routes, tmp_path):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=DiskCache(tmp_path / "cache.sqlite3"))
+
+    first = api.regions().get_all()
+    first.pop()
+    second = api.regions().get_all()
+
+    assert len(routes.calls) == 1
+    assert len(second) == 1 and first is not second
+
+
+def test_disk_cache_eviction(api_server, valid_clan_data, tmp_path):
+    for clan_id in range(3):
+        api_server.routes[f"/EU/clan/{clan_id}/info"] = valid_clan_data
+    body_size = len(json.dumps(valid_clan_data))
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=2 * body_size)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, cache=cache)
+
+    for clan_id in range(3):
+        api.clans(region="EU").get_info(clan_id=str(clan_id))
+
+    stats = cache.stats
+    assert (stats.evictions, stats.size) == (1, 2)
+    assert cache.validators(cache.make_key(api_server.url, "EU/clan/0/info", None, None)) == {}
+
+    reopened = DiskCache(tmp_path / "cache.sqlite3", max_bytes=body_size)
+    API(server=Server.DEMO, tokens=APP_TOKEN, cache=reopened).clans(region="EU").get_info(clan_id="0")
+    assert (reopened.stats.evictions, reopened.stats.size) == (2, 1)
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from pyscx import API, Server
+from pyscx.crawler import CLANS, MEMBERS, PROFILES, CrawlCheckpoint, Crawler
+from pyscx.exceptions import MissingTokenError
+from pyscx.objects import Clan, FullCharacterInfo
+from pyscx.storage import SnapshotStore
+from pyscx.token import Token, TokenType
+
+
+TOKENS = [
+    Token(value="app-token", type=TokenType.APPLICATION),
+    Token(value="user-token", type=TokenType.USER),
+]
+CLAN_COUNT = 250
+MEMBERS_PER_CLAN = 2
+
+
+@pytest.fixture
+def world(api_server, valid_clan_data, valid_clan_member_data, valid_character_profile_data):
+    clans = [{**valid_clan_data, "id": f"clan-{index}", "name": f"Clan #{index}"} for index in range(CLAN_COUNT)]
+
+    def list_clans(params, headers):
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 20))
+        return 200, {"totalClans": len(clans), "data": clans[offset : offset + limit]}
+
+    api_server.routes["/EU/clans"] = list_clans
+    for clan in clans:
+        api_server.routes[f"/EU/clan/{clan['id']}/members"] = [
+            {**valid_clan_member_data, "name": f"{clan['id']}-{index}"} for index in range(MEMBERS_PER_CLAN)
+        ]
+        for index in range(MEMBERS_PER_CLAN):
+            name = f"{clan['id']}-{index}"
+            api_server.routes[f"/EU/character/by-name/{name}/profile"] = {
+                **valid_character_profile_data,
+                "username": name,
+            }
+    return api_server
+
+
+def requested(server, part: str) -> list[str]:
+    return [path for path, _, _ in server.calls if part in path]
+
+
+def test_crawl(world):
+    store = SnapshotStore(":memory:")
+    crawler = Crawler(API(server=Server.DEMO, tokens=TOKENS), ":memory:", regions=["eu"], store=store)
+
+    stats = crawler.run()
+
+    profiles = CLAN_COUNT * MEMBERS_PER_CLAN
+    assert stats[CLANS].processed == 2 and stats[CLANS].produced == CLAN_COUNT
+    assert stats[MEMBERS].processed == CLAN_COUNT and stats[PROFILES].processed == profiles
+    assert all(stage.backlog == 0 and stage.busy == 0 and stage.failed == 0 for stage in stats.values())
+    assert len(requested(world, "/profile")) == profiles
+    assert crawler.checkpoint.counts()[PROFILES] == {"pending": 0, "done": profiles, "failed": 0}
+    assert store.latest(Clan, "EU", "clan-7").name == "Clan #7"
+    assert store.latest(FullCharacterInfo, "EU", "clan-7-1") is not None
+
+
+def test_interrupted_crawl_resumes(world, tmp_path):
+    api = API(server=Server.DEMO, tokens=TOKENS)
+    path = tmp_path / "crawl.sqlite3"
+    fetched = []
+    lock = threading.Lock()
+
+    def interrupt(stage, region, objects):
+        with lock:
+            fetched.append(stage)
+            if fetched.count(PROFILES) == 100:
+                crawler.stop()
+
+    crawler = Crawler(api, path, regions=["EU"], queue_size=10, on_result=interrupt)
+    first = crawler.run()
+    crawler.checkpoint.close()
+    assert 100 <= first[PROFILES].processed < CLAN_COUNT * MEMBERS_PER_CLAN
+
+    world.calls.clear()
+    resumed = Crawler(api, path, regions=["EU"]).run()
+
+    profiles = requested(world, "/profile")
+    assert first[PROFILES].processed + resumed[PROFILES].processed == CLAN_COUNT * MEMBERS_PER_CLAN
+    assert len(profiles) == len(set(profiles)) == resumed[PROFILES].processed
+    assert first[MEMBERS].processed + resumed[MEMBERS].processed == CLAN_COUNT
+
+
+def test_failed_tasks_are_recorded(world):
+    del world.routes["/EU/clan/clan-3/members"]
+    crawler = Crawler(API(server=Server.DEMO, tokens=TOKENS), ":memory:", regions=["EU"])
+
+    stats = crawler.run()
+
+    assert stats[MEMBERS].failed == 1
+    assert list(crawler.checkpoint.failures()) == [(MEMBERS, "EU", "clan-3")]
+    assert crawler.checkpoint.retry_failed() == 1
+
+    world.routes["/EU/clan/clan-3/members"] = []
+    assert crawler.run()[MEMBERS].processed == 1
+    assert crawler.checkpoint.failures() == {}
+
+
+def test_checkpoint():
+    checkpoint = CrawlCheckpoint(":memory:")
+
+    assert checkpoint.add([(CLANS, "EU", "0"), (CLANS, "EU", "0")]) == [(CLANS, "EU", "0")]
+    added = checkpoint.complete((CLANS, "EU", "0"), [(MEMBERS, "EU", "1"), (CLANS, "EU", "0")])
+
+    assert added == [(MEMBERS, "EU", "1")]
+    assert [task for _, task in checkpoint.pending()] == [(MEMBERS, "EU", "1")]
+    assert checkpoint.pending(until=1) == []
+    assert checkpoint.counts()[CLANS] == {"pending": 0, "done": 1, "failed": 0}
+
+
+def test_crawl_requires_both_tokens():
+    with pytest.raises(MissingTokenError):
+        Crawler(API(server=Server.DEMO, tokens=TOKENS[:1]), ":memory:", regions=["EU"]).run()
+    with pytest.raises(ValueError):
+        Crawler(API(server=Server.DEMO, tokens=TOKENS), ":memory:", workers={"unknown": 1})
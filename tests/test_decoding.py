@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server, decoding
+from pyscx.objects import AuctionRedeemedLot, Emission
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+CLAN_ID = "647d6c53-b3d7-4d30-8d08-de874eb1d845"
+
+
+@pytest.fixture
+def routes(
+    api_server,
+    valid_region_data,
+    valid_emission_data,
+    valid_active_lot_data,
+    valid_redeemed_lot_data,
+    valid_clan_data,
+    valid_clan_member_data,
+    valid_user_character_data,
+    valid_character_profile_data,
+):
+    history = [{**valid_redeemed_lot_data, "price": price} for price in range(5)]
+    api_server.routes.update(
+        {
+            "/regions": [valid_region_data],
+            "/EU/emission": valid_emission_data,
+            "/EU/friends/Test-1": ["Test-2"],
+            "/EU/auction/1kv2/history": lambda params, headers: (
+                200,
+                {"total": 5, "prices": history[int(params.get("offset", 0)) :][: int(params.get("limit", 200))]},
+            ),
+            "/EU/auction/1kv2/lots": {"total": 1, "lots": [valid_active_lot_data]},
+            "/EU/characters": [valid_user_character_data],
+            "/EU/character/by-name/Test-1/profile": valid_character_profile_data,
+            f"/EU/clan/{CLAN_ID}/info": valid_clan_data,
+            f"/EU/clan/{CLAN_ID}/members": [valid_clan_member_data],
+            "/EU/clans": {"totalClans": 1, "data": [valid_clan_data]},
+        }
+    )
+    return api_server
+
+
+API_METHODS_TEST_CASES = [
+    ("regions", "get_all", {}),
+    ("emissions", "get_info", {}),
+    ("friends", "get_all", {"character_name": "Test-1"}),
+    ("auction", "get_item_history", {"item_id": "1kv2"}),
+    ("auction", "get_item_lots", {"item_id": "1kv2"}),
+    ("characters", "get_all", {}),
+    ("characters", "get_profile", {"character_name": "Test-1"}),
+    ("clans", "get_info", {"clan_id": CLAN_ID}),
+    ("clans", "get_members", {"clan_id": CLAN_ID}),
+    ("clans", "get_all", {}),
+]
+
+
+@pytest.mark.parametrize(
+    "group, method, kwargs",
+    API_METHODS_TEST_CASES,
+    ids=[f"{g}.{m}()" for g, m, _ in API_METHODS_TEST_CASES],
+)
+def test_fast_parsing_matches_strict(routes, group, method, kwargs):
+    strict = API(server=Server.DEMO, tokens=[USER_TOKEN, APP_TOKEN])
+    fast = API(server=Server.DEMO, tokens=[USER_TOKEN, APP_TOKEN], fast_parsing=True)
+
+    expected = getattr(getattr(strict, group)(region="EU"), method)(**kwargs)
+    result = getattr(getattr(fast, group)(region="EU"), method)(**kwargs)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_fast_parsing_pagination(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, fast_parsing=True)
+
+    lots = list(api.auction(region="EU").iter_history(item_id="1kv2", limit=2))
+
+    assert [lot.price for lot in lots] == [0, 1, 2, 3, 4]
+    assert all(isinstance(lot, AuctionRedeemedLot) for lot in lots)
+    assert len(routes.calls) == 3
+
+
+def test_fast_parsing_without_orjson(routes, monkeypatch):
+    monkeypatch.setattr(decoding, "orjson", None)
+    api = API(server=Server.DEMO, tokens=USER_TOKEN, fast_parsing=True)
+
+    assert api.friends(region="EU").get_all(character_name="Test-1") == ["Test-2"]
+
+
+def test_async_fast_parsing(routes):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, fast_parsing=True) as api:
+            emission = await api.emissions(region="EU").get_info()
+            lots = [lot async for lot in api.auction(region="EU").iter_history(item_id="1kv2", limit=2)]
+            return emission, lots
+
+    emission, lots = asyncio.run(fetch())
+
+    assert isinstance(emission, Emission)
+    assert [lot.price for lot in lots] == [0, 1, 2, 3, 4]
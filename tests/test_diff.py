@@ -0,0 +1,84 @@
+import pytest
+
+from pyscx.diff import (
+    ClanAppeared,
+    ClanDisappeared,
+    ClanListDiffer,
+    LevelChanged,
+    MemberJoined,
+    MemberLeft,
+    RankChanged,
+    RosterDiffer,
+)
+from pyscx.objects import Clan, ClanMember, ClanMemberRank
+
+
+@pytest.fixture
+def member(valid_clan_member_data):
+    def make(name: str, rank: str = "RECRUIT") -> ClanMember:
+        return ClanMember(**{**valid_clan_member_data, "name": name, "rank": rank})
+
+    return make
+
+
+@pytest.fixture
+def clan(valid_clan_data):
+    def make(clan_id: str, level: int = 1) -> Clan:
+        return Clan(**{**valid_clan_data, "id": clan_id, "level": level})
+
+    return make
+
+
+def test_roster_events(member):
+    differ = RosterDiffer()
+    assert differ.observe("clan", [member("A"), member("B"), member("C", "OFFICER")]) == []
+
+    events = differ.observe("clan", [member("C", "COLONEL"), member("A"), member("D")])
+
+    assert events == [
+        MemberJoined("clan", member("D")),
+        MemberLeft("clan", "B", ClanMemberRank.RECRUIT),
+        RankChanged("clan", member("C", "COLONEL"), ClanMemberRank.OFFICER),
+    ]
+
+
+def test_unchanged_roster_skips_the_diff(member, monkeypatch):
+    differ = RosterDiffer()
+    differ.observe("clan", [member("A"), member("B")])
+    monkeypatch.setattr(MemberJoined, "__init__", None)
+
+    assert differ.observe("clan", [member("B"), member("A")]) == []
+
+
+def test_initial_roster(member):
+    differ = RosterDiffer()
+
+    assert differ.observe("clan", [member("A")], initial=True) == [MemberJoined("clan", member("A"))]
+
+
+def test_roster_memory_is_bounded(member):
+    differ = RosterDiffer(max_clans=2)
+    for clan_id in "abc":
+        differ.observe(clan_id, [member("A")])
+
+    assert len(differ) == 2
+    # The forgotten clan starts over from a new baseline.
+    assert differ.observe("a", [member("B")]) == []
+
+
+def test_clan_list_events(clan):
+    differ = ClanListDiffer()
+    differ.observe([clan("1"), clan("2"), clan("3")])
+
+    events = differ.observe([clan("3", level=2), clan("1"), clan("4")])
+
+    assert events == [ClanAppeared(clan("4")), ClanDisappeared("2"), LevelChanged(clan("3", level=2), 1)]
+    assert differ.observe([clan("4"), clan("1"), clan("3", level=2)]) == []
+
+
+def test_partial_clan_list(clan):
+    differ = ClanListDiffer()
+    differ.observe([clan("1"), clan("2")])
+
+    assert differ.observe([clan("2", level=5)], complete=False) == [LevelChanged(clan("2", level=5), 1)]
+    assert differ.observe([clan("1"), clan("2", level=5)]) == []
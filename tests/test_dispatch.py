@@ -0,0 +1,63 @@
+import inspect
+import re
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server, methods
+from pyscx.exceptions import InvalidMethodGroup
+from pyscx.http import ENDPOINT_TEMPLATES, endpoint_template
+from pyscx.methods import ClansMethods, MethodsGroupFabric
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+@pytest.mark.parametrize("api_class", [API, AsyncAPI])
+def test_groups_are_reused(api_class):
+    api = api_class(server=Server.DEMO, tokens=APP_TOKEN)
+
+    assert api.clans is api.clans
+    assert api.clans(region="EU") is api.clans(region="EU")
+    assert api.clans(region="EU") is not api.clans(region="RU")
+    assert api.clans(region="EU").region == "EU"
+    assert api.clans("EU").group_name == "clans"
+    assert api.regions().group_name == "regions"
+
+
+def test_group_names():
+    assert ClansMethods.group_name == "clans"
+    assert [group.group_name for group in MethodsGroupFabric._method_groups.values()] == list(
+        MethodsGroupFabric._method_groups
+    )
+
+
+def test_invalid_group():
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    with pytest.raises(InvalidMethodGroup):
+        api.guilds
+    with pytest.raises(AttributeError):
+        api._missing
+
+
+def test_bound_regions_are_capped(monkeypatch):
+    monkeypatch.setattr(MethodsGroupFabric, "MAX_BOUND_REGIONS", 2)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    groups = [api.clans(region=f"R{i}") for i in range(4)]
+
+    assert [group.region for group in groups] == ["R0", "R1", "R2", "R3"]
+    assert api.clans(region="R1") is groups[1]
+    assert api.clans(region="R3") is not groups[3]
+
+
+def test_methods_pass_endpoint_templates(api_server, valid_clan_data):
+    api_server.routes["/EU/clan/1/info"] = valid_clan_data
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    endpoint_template.cache_clear()
+
+    api.clans(region="EU").get_info(clan_id="1")
+
+    assert endpoint_template.cache_info().misses == 0
+    assert set(re.findall(r'endpoint="([^"]+)"', inspect.getsource(methods))) == set(ENDPOINT_TEMPLATES)
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.emission import (
+    AsyncEmissionWatcher,
+    EmissionEventType,
+    EmissionSchedule,
+    EmissionWatcher,
+    is_active,
+)
+from pyscx.objects import Emission
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+T0 = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def emission(previous_start: datetime, previous_end: datetime, current_start: datetime | None = None) -> dict:
+    data = {"previousStart": previous_start.isoformat(), "previousEnd": previous_end.isoformat()}
+    if current_start is not None:
+        data["currentStart"] = current_start.isoformat()
+    return data
+
+
+IDLE = emission(T0, T0 + timedelta(minutes=5))
+ACTIVE = emission(T0, T0 + timedelta(minutes=5), current_start=T0 + timedelta(hours=1))
+ENDED = emission(T0 + timedelta(hours=1), T0 + timedelta(hours=1, minutes=5))
+
+
+def test_is_active():
+    assert not is_active(Emission(**IDLE))
+    assert is_active(Emission(**ACTIVE))
+    assert not is_active(Emission(**ENDED))
+
+
+def test_schedule_transitions_and_cadence():
+    schedule = EmissionSchedule(min_interval=5, max_interval=300, active_interval=10, window=600)
+
+    assert schedule.update(Emission(**IDLE)) is None
+    assert schedule.next_delay(T0 + timedelta(minutes=10)) == 300
+    assert schedule.update(Emission(**ACTIVE)) is EmissionEventType.STARTED
+    assert schedule.next_delay(T0 + timedelta(hours=1)) == 10
+    assert schedule.update(Emission(**ENDED)) is EmissionEventType.ENDED
+
+    # The next emission is expected an hour after the last one, fast polling starts 10 minutes earlier.
+    assert schedule.period == 3600
+    assert schedule.next_delay(T0 + timedelta(hours=1, minutes=45)) == 300
+    assert schedule.next_delay(T0 + timedelta(hours=1, minutes=48)) == 120
+    assert schedule.next_delay(T0 + timedelta(hours=1, minutes=55)) == 5
+    assert schedule.next_delay(T0 + timedelta(hours=3)) == 5
+
+
+def test_first_poll_reports_ongoing_emission():
+    schedule = EmissionSchedule()
+
+    assert schedule.update(Emission(**ACTIVE)) is EmissionEventType.STARTED
+
+
+@pytest.fixture
+def emissions(api_server):
+    states = [IDLE, ACTIVE, ACTIVE, ENDED]
+
+    def next_state(params, headers):
+        return 200, states.pop(0) if len(states) > 1 else states[0]
+
+    api_server.routes["/EU/emission"] = next_state
+    return api_server
+
+
+def test_watcher_fans_out_to_subscribers(emissions):
+    watcher = EmissionWatcher(API(server=Server.DEMO, tokens=APP_TOKEN), region="EU")
+    received, errors = [], []
+    watcher.on_error = errors.append
+    watcher.subscribe(lambda event: received.append(("first", event.type)))
+
+    @watcher.subscribe
+    def failing(event):
+        raise RuntimeError("boom")
+
+    watcher.subscribe(lambda event: received.append(("second", event.type)))
+
+    for _ in range(4):
+        watcher.poll()
+
+    assert received == [
+        ("first", EmissionEventType.STARTED),
+        ("second", EmissionEventType.STARTED),
+        ("first", EmissionEventType.ENDED),
+        ("second", EmissionEventType.ENDED),
+    ]
+    assert len(errors) == 2
+
+
+def test_watcher_thread(emissions):
+    schedule = EmissionSchedule(min_interval=0.01, max_interval=0.01, active_interval=0.01)
+    watcher = EmissionWatcher(API(server=Server.DEMO, tokens=APP_TOKEN), region="EU", schedule=schedule)
+    ended = threading.Event()
+    watcher.subscribe(lambda event: event.type is EmissionEventType.ENDED and ended.set())
+
+    watcher.start()
+    try:
+        assert ended.wait(timeout=5)
+    finally:
+        watcher.stop(timeout=5)
+
+
+def test_async_watcher(emissions):
+    schedule = EmissionSchedule(min_interval=0.01, max_interval=0.01, active_interval=0.01)
+
+    async def watch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            watcher = AsyncEmissionWatcher(api, region="EU", schedule=schedule)
+            received = []
+            ended = asyncio.Event()
+
+            async def on_event(event):
+                received.append(event.type)
+                if event.type is EmissionEventType.ENDED:
+                    ended.set()
+
+            watcher.subscribe(on_event)
+            watcher.start()
+            await asyncio.wait_for(ended.wait(), timeout=5)
+            await watcher.stop()
+            return received
+
+    assert asyncio.run(watch()) == [EmissionEventType.STARTED, EmissionEventType.ENDED]
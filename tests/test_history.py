@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.history import PriceHistory
+from pyscx.objects import AuctionRedeemedLot
+from pyscx.token import Token, TokenType
+
+
+np = pytest.importorskip("numpy")
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+RECORDS = [
+    {"amount": 2, "price": 300, "time": "2024-01-01T12:00:03Z", "additional": {"qlt": 1}},
+    {"amount": 1, "price": 100, "time": "2024-01-01T12:00:02.500Z", "additional": {}},
+    {"amount": 4, "price": 400, "time": "2024-01-01T15:00:01+03:00", "additional": {}},
+    {"amount": 1, "price": 200, "time": "2024-01-01T12:00:00Z", "additional": {}},
+]
+
+
+@pytest.fixture
+def history() -> PriceHistory:
+    return PriceHistory.from_records(RECORDS)
+
+
+def test_columns(history):
+    assert history.price.dtype == np.int64 and history.amount.dtype == np.int64
+    assert history.time.dtype == np.dtype("datetime64[ms]")
+    assert history.time[2] == np.datetime64("2024-01-01T12:00:01")
+    assert list(history.additional) == [{"qlt": 1}, None, None, None]
+
+
+def test_rows_match_models(history):
+    assert list(history) == [AuctionRedeemedLot(**record) for record in RECORDS]
+    assert history[-1] == AuctionRedeemedLot(**RECORDS[-1])
+
+
+def test_slicing_shares_memory(history):
+    head = history[:2]
+
+    assert isinstance(head, PriceHistory) and len(head) == 2
+    assert np.shares_memory(head.price, history.price)
+    assert list(history[history.amount > 1].price) == [300, 400]
+
+
+def test_aggregates(history):
+    ordered = history.sort_by_time()
+
+    assert list(ordered.price) == [200, 400, 100, 300]
+    assert history.vwap() == 1000 / 8
+    assert list(history.percentile([0, 100])) == [100.0, 200.0]
+    assert list(ordered.rolling_median(window=3)) == [100.0, 100.0]
+    assert len(history.between(start=np.datetime64("2024-01-01T12:00:02"))) == 2
+    assert np.isnan(history[:0].vwap())
+
+
+def test_concat_and_from_lots(history):
+    joined = PriceHistory.concat([history[:1], history[1:]])
+
+    assert list(joined) == list(history)
+    assert list(PriceHistory.from_lots(history)) == list(history)
+
+
+def test_get_history_columns(api_server):
+    api_server.routes["/EU/auction/1kv2/history"] = {"total": 4, "prices": RECORDS}
+
+    for fast_parsing in (False, True):
+        api = API(server=Server.DEMO, tokens=APP_TOKEN, fast_parsing=fast_parsing)
+        history = api.auction(region="EU").get_history_columns(item_id="1kv2")
+        assert isinstance(history, PriceHistory)
+        assert list(history.price) == [300, 100, 400, 200]
+
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.auction(region="EU").get_history_columns(item_id="1kv2")
+
+    assert list(asyncio.run(fetch()).amount) == [2, 1, 4, 1]
@@ -0,0 +1,95 @@
+import asyncio
+import math
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.cache import ResponseCache
+from pyscx.metrics import Histogram, InMemoryExporter
+from pyscx.retry import RetryPolicy
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+LOTS = "{region}/auction/{item}/lots"
+CLAN_INFO = "{region}/clan/{clan-id}/info"
+
+
+@pytest.fixture
+def routes(api_server, valid_active_lot_data, valid_clan_data):
+    attempts = []
+
+    def flaky_clan(params, headers):
+        attempts.append(1)
+        return (503, {"title": "Unavailable"}) if len(attempts) == 1 else (200, valid_clan_data)
+
+    api_server.routes["/EU/auction/1kv2/lots"] = {"total": 2, "lots": [valid_active_lot_data] * 2}
+    api_server.routes["/EU/clan/1/info"] = flaky_clan
+    return api_server
+
+
+@pytest.mark.parametrize("fast_parsing", [False, True], ids=["strict", "fast"])
+def test_request_metrics(routes, fast_parsing):
+    metrics = InMemoryExporter()
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, metrics=metrics, fast_parsing=fast_parsing)
+
+    api.auction(region="EU").get_item_lots(item_id="1kv2")
+    api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    assert metrics.counter(LOTS, "requests") == 2
+    assert metrics.counter(LOTS, "status.200") == 2
+    assert metrics.histogram(LOTS, "latency").count == 2
+    assert metrics.histogram(LOTS, "size").min > 100
+    assert metrics.histogram(LOTS, "validate_time").count == 2
+    assert (metrics.histogram(LOTS, "decode_time") is None) == fast_parsing
+
+
+def test_retry_and_cache_metrics(routes):
+    metrics = InMemoryExporter()
+    api = API(
+        server=Server.DEMO,
+        tokens=APP_TOKEN,
+        metrics=metrics,
+        cache=ResponseCache(),
+        retry=RetryPolicy(backoff_factor=0, jitter=False),
+    )
+
+    api.clans(region="EU").get_info(clan_id="1")
+    api.clans(region="EU").get_info(clan_id="1")
+
+    counters = metrics.summary()[CLAN_INFO]["counters"]
+    assert counters == {
+        "requests": 2,
+        "cache_misses": 1,
+        "cache_hits": 1,
+        "status.503": 1,
+        "status.200": 1,
+        "retries": 1,
+    }
+
+
+def test_async_metrics(routes):
+    metrics = InMemoryExporter()
+
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, metrics=metrics) as api:
+            await api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    asyncio.run(fetch())
+
+    summary = metrics.summary()[LOTS]
+    assert summary["counters"] == {"requests": 1, "status.200": 1}
+    assert summary["latency"]["count"] == 1
+    assert summary["decode_time"]["count"] == summary["validate_time"]["count"] == 1
+
+
+def test_histogram_quantiles():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.add(value / 1000)
+
+    assert histogram.count == 100 and histogram.min == 0.001 and histogram.max == 0.1
+    assert math.isclose(histogram.mean, 0.0505)
+    assert 0.05 <= histogram.quantile(0.5) <= 0.05 * 1.2
+    assert 0.099 <= histogram.quantile(0.99) <= 0.1
+    assert math.isnan(Histogram().quantile(0.5))
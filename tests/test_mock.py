@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+import requests
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.mock import MockAPIServer
+from pyscx.objects import AuctionLot, CharacterInfo, Clan, ClanMember, Emission, FullCharacterInfo, Region
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+
+
+@pytest.fixture
+def mock_server():
+    with MockAPIServer(history_size=450, lots_size=30, clans_size=250, members_size=7) as server:
+        yield server
+
+
+def test_every_endpoint(mock_server):
+    api = API(server=Server.DEMO, tokens=[APP_TOKEN, USER_TOKEN], base_url=mock_server.url)
+
+    assert [region.id for region in api.regions().get_all()] == ["RU", "EU", "NA", "SEA"]
+    assert isinstance(api.regions().get_all()[0], Region)
+    assert isinstance(api.emissions(region="EU").get_info(), Emission)
+    assert len(api.friends(region="EU").get_all(character_name="Test-1")) == 20
+    assert len(api.characters(region="EU").get_all()) == 3
+    assert all(isinstance(character, CharacterInfo) for character in api.characters(region="EU").get_all())
+    assert isinstance(api.characters(region="EU").get_profile(character_name="Test-1"), FullCharacterInfo)
+    assert isinstance(api.clans(region="EU").get_info(clan_id="1"), Clan)
+    assert all(isinstance(member, ClanMember) for member in api.clans(region="EU").get_members(clan_id="1"))
+    assert len(api.auction(region="EU").get_item_lots(item_id="1kv2")) == 20
+    assert all(isinstance(lot, AuctionLot) for lot in api.auction(region="EU").get_item_lots(item_id="1kv2"))
+
+
+def test_pagination(mock_server):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, base_url=mock_server.url, fast_parsing=True)
+
+    history = list(api.auction(region="EU").iter_history(item_id="1kv2"))
+    clans = list(api.clans(region="EU").iter_all(limit=100))
+
+    assert len(history) == 450
+    assert [lot.time for lot in history] == sorted((lot.time for lot in history), reverse=True)
+    assert len({clan.id for clan in clans}) == 250
+    assert mock_server.requests == 3 + 3
+
+
+def test_payloads_are_deterministic(mock_server):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, base_url=mock_server.url)
+    with MockAPIServer(lots_size=30) as other:
+        other_api = API(server=Server.DEMO, tokens=APP_TOKEN, base_url=other.url)
+
+        assert api.auction(region="EU").get_item_lots(item_id="1kv2") == other_api.auction(
+            region="EU"
+        ).get_item_lots(item_id="1kv2")
+
+
+def test_quota_and_errors():
+    with MockAPIServer(quota=2, quota_window=60) as server:
+        headers = {"Authorization": "Bearer app-token"}
+        statuses = [requests.get(f"{server.url}/EU/emission", headers=headers).status_code for _ in range(3)]
+        rejected = requests.get(f"{server.url}/EU/emission", headers=headers)
+
+        assert statuses == [200, 200, 429]
+        assert rejected.headers["X-RateLimit-Remaining"] == "0"
+        assert float(rejected.headers["Retry-After"]) > 0
+        assert server.rejected == 2
+
+        assert requests.get(f"{server.url}/EU/emission").status_code == 401
+        other = {"Authorization": "Bearer other-token"}
+        assert requests.get(f"{server.url}/XX/emission", headers=other).status_code == 404
+        assert requests.get(f"{server.url}/EU/unknown", headers=headers).status_code == 404
+
+
+def test_async_client(mock_server):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, base_url=mock_server.url) as api:
+            return [lot async for lot in api.auction(region="EU").iter_lots(item_id="1kv2", limit=7)]
+
+    assert len(asyncio.run(fetch())) == 30
+
+
+def test_custom_routes():
+    def not_modified(params, headers):
+        return 304, None, {"ETag": headers.get("If-None-Match", "")}
+
+    with MockAPIServer(routes={"/EU/emission": {"title": "Custom"}}, record=True) as server:
+        server.routes["/EU/clan/1/info"] = not_modified
+        headers = {"Authorization": "Bearer app-token"}
+
+        assert requests.get(f"{server.url}/EU/emission").json() == {"title": "Custom"}
+        cached = requests.get(f"{server.url}/EU/clan/1/info", headers={**headers, "If-None-Match": '"v1"'})
+        assert (cached.status_code, cached.content, cached.headers["ETag"]) == (304, b"", '"v1"')
+        assert requests.get(f"{server.url}/EU/clan/2/info?limit=5", headers=headers).status_code == 200
+
+    assert [(path, params) for path, params, _ in server.calls] == [
+        ("/EU/emission", {}),
+        ("/EU/clan/1/info", {}),
+        ("/EU/clan/2/info", {"limit": "5"}),
+    ]
+    assert server.calls[1][2]["If-None-Match"] == '"v1"'
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.methods import MAX_PAGE_LIMIT
+from pyscx.objects import AuctionLot, Clan
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+def paginated(items: list[dict], key: str, total_key: str = "total"):
+    def route(params, headers):
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 20))
+        return 200, {total_key: len(items), key: items[offset : offset + limit]}
+
+    return route
+
+
+@pytest.fixture
+def lots(api_server, valid_active_lot_data):
+    items = [{**valid_active_lot_data, "amount": i} for i in range(450)]
+    api_server.routes["/EU/auction/1kv2/lots"] = paginated(items, "lots")
+    return items
+
+
+@pytest.mark.parametrize("prefetch", [False, True], ids=["sequential", "prefetch"])
+def test_iter_lots(api_server, lots, prefetch):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = list(api.auction(region="EU").iter_lots(item_id="1kv2", prefetch=prefetch))
+
+    assert [lot.amount for lot in result] == list(range(450))
+    assert all(isinstance(lot, AuctionLot) for lot in result)
+    assert [params for _, params, _ in api_server.calls] == [
+        {"offset": "0", "limit": str(MAX_PAGE_LIMIT)},
+        {"offset": "200", "limit": str(MAX_PAGE_LIMIT)},
+        {"offset": "400", "limit": str(MAX_PAGE_LIMIT)},
+    ]
+
+
+def test_iter_lots_is_lazy(api_server, lots):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    iterator = api.auction(region="EU").iter_lots(item_id="1kv2", limit=10)
+    assert api_server.calls == []
+
+    first = [next(iterator) for _ in range(10)]
+    assert [lot.amount for lot in first] == list(range(10))
+    assert len(api_server.calls) == 1
+
+
+def test_iter_all_clans(api_server, valid_clan_data):
+    clans = [{**valid_clan_data, "id": str(i)} for i in range(5)]
+    api_server.routes["/EU/clans"] = paginated(clans, "data", total_key="totalClans")
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = list(api.clans(region="EU").iter_all(limit=2, offset=1))
+
+    assert [clan.id for clan in result] == ["1", "2", "3", "4"]
+    assert all(isinstance(clan, Clan) for clan in result)
+
+
+def test_iter_empty_history(api_server):
+    api_server.routes["/EU/auction/1kv2/history"] = paginated([], "prices")
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    assert list(api.auction(region="EU").iter_history(item_id="1kv2")) == []
+    assert len(api_server.calls) == 1
+
+
+@pytest.mark.parametrize("prefetch", [False, True], ids=["sequential", "prefetch"])
+def test_async_iter_lots(api_server, lots, prefetch):
+    async def collect():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return [lot async for lot in api.auction(region="EU").iter_lots(item_id="1kv2", prefetch=prefetch)]
+
+    result = asyncio.run(collect())
+
+    assert [lot.amount for lot in result] == list(range(450))
+    assert len(api_server.calls) == 3
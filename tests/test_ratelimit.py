@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+from requests.exceptions import HTTPError
+
+from pyscx import API, Server
+from pyscx.exceptions import DeadlineExceeded
+from pyscx.ratelimit import RateLimiter, TokenBucket, retry_after
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_burst_then_pacing():
+    bucket = TokenBucket(interval=1.0, burst=3, clock=FakeClock())
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, 1.0, 2.0]
+
+
+def test_bucket_update_spreads_remaining_quota():
+    clock = FakeClock()
+    bucket = TokenBucket(interval=0.1, burst=1, clock=clock)
+
+    bucket.update(limit=100, remaining=15, reset_in=10.0, margin=5)
+
+    assert bucket.interval == 1.0
+    assert (bucket.limit, bucket.remaining) == (100, 15)
+
+
+def test_bucket_exhausted_quota_holds_until_reset():
+    clock = FakeClock()
+    bucket = TokenBucket(interval=0.1, burst=1, clock=clock)
+
+    bucket.update(limit=100, remaining=3, reset_in=30.0, margin=5)
+
+    assert bucket.reserve() == 30.0
+
+
+def test_bucket_is_thread_safe():
+    bucket = TokenBucket(interval=1.0, burst=1, clock=FakeClock())
+    waits = []
+
+    def reserve():
+        for _ in range(100):
+            waits.append(bucket.reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == [float(i) for i in range(800)]
+
+
+@pytest.mark.parametrize(
+    "make_reset",
+    [lambda: "30", lambda: str(time.time() + 30), lambda: str(int((time.time() + 30) * 1000))],
+    ids=["seconds", "timestamp", "timestamp_ms"],
+)
+def test_seconds_until_reset(make_reset):
+    assert RateLimiter.seconds_until(make_reset()) == pytest.approx(30.0, abs=0.5)
+
+
+def test_retry_after():
+    assert retry_after({"Retry-After": "7"}) == 7.0
+    assert retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after({"Retry-After": "soon"}) is None
+    assert retry_after({}) is None
+
+
+def test_limiter_tracks_quota_headers(api_server, valid_emission_data):
+    quota = {"X-RateLimit-Limit": "400", "X-RateLimit-Remaining": "105", "X-RateLimit-Reset": "50"}
+    api_server.routes["/EU/emission"] = lambda params, headers: (200, valid_emission_data, quota)
+    limiter = RateLimiter(margin=5)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, rate_limiter=limiter)
+
+    api.emissions(region="EU").get_info()
+
+    bucket = limiter.bucket(limiter.make_key(api_server.url, {"Authorization": "Bearer app-token"}))
+    assert (bucket.limit, bucket.remaining) == (400, 105)
+    assert bucket.interval == pytest.approx(0.5)
+    assert len(limiter._buckets) == 1
+
+
+def test_limiter_holds_after_too_many_requests(api_server):
+    api_server.routes["/regions"] = lambda params, headers: (429, {}, {"Retry-After": "12"})
+    limiter = RateLimiter(burst=1)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, rate_limiter=limiter)
+
+    with pytest.raises(HTTPError):
+        api.regions().get_all()
+
+    assert limiter.reserve(limiter.make_key(api_server.url)) == pytest.approx(12, abs=0.5)
+
+
+def test_limiter_respects_deadline(api_server, valid_emission_data):
+    api_server.routes["/EU/emission"] = valid_emission_data
+    limiter = RateLimiter(requests=1, period=10, burst=1)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, rate_limiter=limiter)
+    api.emissions(region="EU").get_info()
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        api.emissions(region="EU").get_info(deadline=0.2)
+
+    assert time.monotonic() - started < 0.1
+    assert len(api_server.calls) == 1
+    assert limiter.reserve(limiter.make_key(api_server.url, {"Authorization": "Bearer app-token"})) < 10
+
+
+def test_bucket_reserves_only_within_limit():
+    bucket = TokenBucket(interval=1.0, burst=1, clock=FakeClock())
+    bucket.reserve()
+
+    assert bucket.reserve(within=0.5) == 1.0
+    assert bucket.reserve(within=1.0) == 1.0
+    assert bucket.reserve() == 2.0
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from requests.exceptions import HTTPError
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.objects import Clan
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+REGIONS = ["RU", "EU", "NA", "SEA"]
+
+
+@pytest.fixture
+def regions(api_server, valid_clan_data):
+    api_server.routes["/regions"] = [{"id": region, "name": region.lower()} for region in REGIONS]
+    for region in REGIONS:
+        if region != "NA":
+            clans = [{**valid_clan_data, "id": f"{region}-{i}"} for i in range(2)]
+            api_server.routes[f"/{region}/clans"] = {"totalClans": 2, "data": clans}
+    return api_server
+
+
+def test_fan_out_to_all_regions(regions):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = api.clans.all_regions().get_all()
+
+    assert [item.key for item in result] == REGIONS
+    assert set(result.values) == {"RU", "EU", "SEA"}
+    assert isinstance(result.errors["NA"], HTTPError)
+    merged = result.merged()
+    assert [(region, clan.id) for region, clan in merged][:3] == [("RU", "RU-0"), ("RU", "RU-1"), ("EU", "EU-0")]
+    assert all(isinstance(clan, Clan) for _, clan in merged)
+
+
+def test_region_list_is_cached(regions):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    api.clans.all_regions().get_all()
+    api.clans.all_regions().iter_all()
+
+    assert [path for path, _, _ in regions.calls].count("/regions") == 1
+
+
+def test_explicit_regions_and_iterators(regions):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    result = api.clans.all_regions(regions=["EU", "SEA"]).iter_all()
+
+    assert [len(clans) for clans in result.values.values()] == [2, 2]
+    assert all(path != "/regions" for path, _, _ in regions.calls)
+
+
+def test_unknown_method(regions):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    with pytest.raises(AttributeError):
+        api.clans.all_regions().get_everything
+
+
+def test_async_fan_out(regions):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.clans.all_regions().get_all(), await api.clans.all_regions().iter_all()
+
+    result, iterated = asyncio.run(fetch())
+
+    assert set(result.values) == set(iterated.values) == {"RU", "EU", "SEA"}
+    assert set(result.errors) == {"NA"}
+    assert [path for path, _, _ in regions.calls].count("/regions") == 1
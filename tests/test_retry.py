@@ -0,0 +1,155 @@
+import asyncio
+from itertools import count
+
+import pytest
+import requests
+from requests.exceptions import HTTPError
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.retry import RetryPolicy
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+def flaky(payload, failures: list[tuple[int, dict[str, str]]]):
+    attempts = count()
+
+    def route(params, headers):
+        attempt = next(attempts)
+        if attempt < len(failures):
+            status, extra = failures[attempt]
+            return status, {"title": "Error"}, extra
+        return 200, payload
+
+    return route
+
+
+def test_backoff_grows_exponentially():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_jitter_bounds():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+    assert all(2 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+def test_retry_recovers_and_reports(api_server, valid_region_data):
+    api_server.routes["/regions"] = flaky([valid_region_data], [(503, {}), (429, {"Retry-After": "0"})])
+    events = []
+    policy = RetryPolicy(max_attempts=3, backoff_factor=0, on_retry=events.append)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=policy)
+
+    regions = api.regions().get_all()
+
+    assert regions[0].id == valid_region_data["id"]
+    assert len(api_server.calls) == 3
+    assert [(event.attempt, event.status_code) for event in events] == [(1, 503), (2, 429)]
+    assert events[1].delay == 0
+
+
+def test_retry_gives_up(api_server):
+    api_server.routes["/regions"] = flaky([], [(500, {})] * 5)
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=RetryPolicy(max_attempts=2, backoff_factor=0))
+
+    with pytest.raises(HTTPError) as exc_info:
+        api.regions().get_all()
+
+    assert exc_info.value.response.status_code == 500
+    assert len(api_server.calls) == 2
+
+
+def test_retry_skips_client_errors(api_server):
+    api_server.routes["/regions"] = flaky([], [(404, {})])
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=RetryPolicy(backoff_factor=0))
+
+    with pytest.raises(HTTPError):
+        api.regions().get_all()
+
+    assert len(api_server.calls) == 1
+
+
+def test_retry_skips_long_retry_after(api_server):
+    api_server.routes["/regions"] = flaky([], [(429, {"Retry-After": "3600"})])
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=RetryPolicy(max_retry_after=60))
+
+    with pytest.raises(HTTPError):
+        api.regions().get_all()
+
+    assert len(api_server.calls) == 1
+
+
+def test_retry_on_connection_error(api_server, monkeypatch, valid_region_data):
+    api_server.routes["/regions"] = [valid_region_data]
+    attempts = count()
+    original = requests.Session.get
+
+    def get(self, url, **kwargs):
+        if next(attempts) == 0:
+            raise requests.ConnectionError("Connection reset by peer")
+        return original(self, url, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    events = []
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=RetryPolicy(backoff_factor=0, on_retry=events.append))
+
+    assert api.regions().get_all()[0].id == valid_region_data["id"]
+    assert isinstance(events[0].error, requests.ConnectionError)
+    assert events[0].status_code is None
+
+
+def test_async_retry(api_server, valid_region_data):
+    api_server.routes["/regions"] = flaky([valid_region_data], [(502, {})])
+    events = []
+
+    async def fetch():
+        policy = RetryPolicy(backoff_factor=0, on_retry=events.append)
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, retry=policy) as api:
+            return await api.regions().get_all()
+
+    assert asyncio.run(fetch())[0].id == valid_region_data["id"]
+    assert [event.status_code for event in events] == [502]
+
+
+def rejects_first_token(payload):
+    def route(params, headers):
+        if headers.get("Authorization") == "Bearer app-token-0":
+            return 429, {"title": "Too Many Requests"}, {"Retry-After": "0"}
+        return 200, payload
+
+    return route
+
+
+POOLED_TOKENS = [Token(value=f"app-token-{index}", type=TokenType.APPLICATION) for index in range(2)]
+
+
+def test_retry_picks_another_token_after_429(api_server, valid_active_lot_data):
+    lots = {"total": 1, "lots": [valid_active_lot_data]}
+    api_server.routes["/EU/auction/1kv2/lots"] = rejects_first_token(lots)
+    api = API(server=Server.DEMO, tokens=POOLED_TOKENS, retry=RetryPolicy(max_attempts=3, backoff_factor=0))
+
+    assert len(api.auction(region="EU").get_item_lots(item_id="1kv2")) == 1
+    assert [headers["Authorization"] for _, _, headers in api_server.calls] == [
+        "Bearer app-token-0",
+        "Bearer app-token-1",
+    ]
+
+
+def test_async_retry_picks_another_token_after_429(api_server, valid_active_lot_data):
+    lots = {"total": 1, "lots": [valid_active_lot_data]}
+    api_server.routes["/EU/auction/1kv2/lots"] = rejects_first_token(lots)
+
+    async def fetch():
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0)
+        async with AsyncAPI(server=Server.DEMO, tokens=POOLED_TOKENS, retry=policy) as api:
+            return await api.auction(region="EU").get_item_lots(item_id="1kv2")
+
+    assert len(asyncio.run(fetch())) == 1
+    assert [headers["Authorization"] for _, _, headers in api_server.calls] == [
+        "Bearer app-token-0",
+        "Bearer app-token-1",
+    ]
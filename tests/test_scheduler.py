@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.exceptions import DeadlineExceeded, RequestShed
+from pyscx.ratelimit import RateLimiter
+from pyscx.scheduler import BATCH, INTERACTIVE, PriorityClass, RequestScheduler
+from pyscx.token import Token, TokenType
+from pyscx.transport import Deadline
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+KEY = ("https://dapi.stalcraft.net", None)
+
+
+def scheduler(requests: float, burst: int = 1, **kwargs) -> RequestScheduler:
+    return RequestScheduler(rate_limiter=RateLimiter(requests=requests, period=1, burst=burst), **kwargs)
+
+
+def test_weighted_fair_share():
+    unlimited = scheduler(requests=10**6, burst=10**6)
+    with unlimited._condition:
+        tickets = [unlimited._submit(KEY, name, None) for name in [BATCH] * 20 + [INTERACTIVE] * 20]
+        lane = tickets[0].lane
+        order = []
+        while lane.select(time.monotonic()) is not None:
+            ticket = lane.select(time.monotonic())
+            assert unlimited._poll(ticket) == 0.0
+            order.append(ticket.priority.name)
+
+    assert order[:18].count(BATCH) == 2
+    assert order[-10:] == [BATCH] * 10
+
+
+def test_interactive_jumps_ahead_of_crawl():
+    paced = scheduler(requests=40)
+    granted = []
+
+    def crawl():
+        paced.acquire(KEY, BATCH)
+        granted.append(BATCH)
+
+    workers = [threading.Thread(target=crawl) for _ in range(30)]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    paced.acquire(KEY, INTERACTIVE)
+    waited = time.monotonic() - started
+    backlog = paced.queued(BATCH)
+    for worker in workers:
+        worker.join()
+
+    assert waited < 0.15
+    assert backlog > 15
+    assert len(granted) == 30 and paced.queued() == 0
+
+
+def test_shed_when_queue_is_full():
+    small = scheduler(requests=1, classes=[PriorityClass(BATCH, max_queue=1)])
+    small.acquire(KEY)
+
+    with small._condition:
+        small._submit(KEY, BATCH, None)
+        with pytest.raises(RequestShed):
+            small._submit(KEY, BATCH, None)
+    assert small.shed == {BATCH: 1}
+
+
+def test_shed_when_deadline_cannot_be_met():
+    slow = scheduler(requests=1, classes=[PriorityClass(BATCH), PriorityClass(INTERACTIVE, max_wait=0.5)])
+    slow.acquire(KEY)
+
+    with pytest.raises(RequestShed):
+        slow.acquire(KEY, BATCH, Deadline(0.5))
+    with pytest.raises(RequestShed):
+        slow.acquire(KEY, INTERACTIVE)
+    with pytest.raises(ValueError):
+        slow.acquire(KEY, "unknown")
+    assert slow.shed == {BATCH: 1, INTERACTIVE: 1} and slow.queued() == 0
+
+
+def test_deadline_expires_in_queue():
+    paced = scheduler(requests=10)
+    paced.acquire(KEY)
+    threading.Timer(0.02, paced.observe, (KEY, 429, {"Retry-After": "1"})).start()
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        paced.acquire(KEY, INTERACTIVE, Deadline(0.3))
+    assert time.monotonic() - started < 0.6
+    assert paced.queued() == 0
+
+
+@pytest.fixture
+def routes(api_server, valid_clan_data):
+    api_server.routes["/EU/clan/1/info"] = valid_clan_data
+    api_server.routes["/EU/clans"] = {"totalClans": 1, "data": [valid_clan_data]}
+    return api_server
+
+
+def test_api_with_scheduler(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, scheduler=scheduler(requests=1000, burst=10))
+
+    api.clans(region="EU").get_info(clan_id="1", priority=INTERACTIVE)
+    list(api.clans(region="EU").iter_all(priority=BATCH))
+
+    assert len(routes.calls) == 2
+    assert all("priority" not in params for _, params, _ in routes.calls)
+    with pytest.raises(ValueError):
+        api.clans(region="EU").get_info(clan_id="1", priority="unknown")
+
+
+def test_async_api_with_scheduler(routes):
+    shared = scheduler(requests=50)
+
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, scheduler=shared) as api:
+            group = api.clans(region="EU")
+            return await asyncio.gather(*(group.get_info(clan_id="1", priority=INTERACTIVE) for _ in range(5)))
+
+    started = time.monotonic()
+    clans = asyncio.run(fetch())
+
+    assert [clan.name for clan in clans] == ["Clan #1"] * 5
+    assert time.monotonic() - started >= 0.07
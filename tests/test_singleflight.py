@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.exceptions import DeadlineExceeded
+from pyscx.singleflight import SingleFlight
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+USER_TOKEN = Token(value="user-token", type=TokenType.USER)
+
+
+@pytest.fixture
+def slow_clan(api_server, valid_clan_data, valid_clan_member_data):
+    def clan_info(params, headers):
+        time.sleep(0.2)
+        return 200, valid_clan_data
+
+    def clan_members(params, headers):
+        time.sleep(0.2)
+        return 200, [valid_clan_member_data, valid_clan_member_data]
+
+    api_server.routes["/EU/clan/1/info"] = clan_info
+    api_server.routes["/EU/clan/2/info"] = clan_info
+    api_server.routes["/EU/clan/1/members"] = clan_members
+    return api_server
+
+
+def test_concurrent_identical_calls_share_one_request(slow_clan):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        clans = list(executor.map(lambda _: api.clans(region="EU").get_info(clan_id="1"), range(10)))
+
+    assert len(slow_clan.calls) == 1
+    assert all(clan is clans[0] for clan in clans)
+    assert (api._http.single_flight.calls, api._http.single_flight.shared) == (1, 9)
+
+
+def test_different_calls_are_not_shared(slow_clan):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda clan_id: api.clans(region="EU").get_info(clan_id=clan_id), "1212"))
+        list(executor.map(lambda token: api.clans(region="EU").get_info(clan_id="1", token=token), "ab"))
+
+    assert len(slow_clan.calls) == 4
+
+
+def test_shared_lists_are_copied_for_every_caller(slow_clan):
+    api = API(server=Server.DEMO, tokens=USER_TOKEN, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first, second = executor.map(lambda _: api.clans(region="EU").get_members(clan_id="1"), range(2))
+    first.clear()
+
+    assert len(slow_clan.calls) == 1
+    assert len(second) == 2
+
+
+def test_pooled_tokens_are_shared(slow_clan):
+    tokens = [APP_TOKEN, Token(value="other-app-token", type=TokenType.APPLICATION)]
+    api = API(server=Server.DEMO, tokens=tokens, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: api.clans(region="EU").get_info(clan_id="1"), range(4)))
+
+    assert len(slow_clan.calls) == 1
+
+
+def test_follower_stops_waiting_at_its_deadline(slow_clan):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(api.clans(region="EU").get_info, clan_id="1")
+        time.sleep(0.05)
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            api.clans(region="EU").get_info(clan_id="1", deadline=0.05)
+        assert time.monotonic() - started < 0.15
+        leader.result()
+
+    assert len(slow_clan.calls) == 1
+
+
+def test_sequential_calls_are_not_shared(slow_clan):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, coalesce=True)
+
+    api.clans(region="EU").get_info(clan_id="1")
+    api.clans(region="EU").get_info(clan_id="1")
+
+    assert len(slow_clan.calls) == 2
+
+
+def test_errors_are_shared():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except RuntimeError as error:
+            errors.append(error)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    assert flight._inflight == {}
+
+
+def test_async_coalescing(slow_clan):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, coalesce=True) as api:
+            group = api.clans(region="EU")
+            return await asyncio.gather(*(group.get_info(clan_id="1") for _ in range(10)))
+
+    clans = asyncio.run(fetch())
+
+    assert len(slow_clan.calls) == 1
+    assert all(clan is clans[0] for clan in clans)
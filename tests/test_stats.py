@@ -0,0 +1,109 @@
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from pyscx.objects import CharacterStatType, FullCharacterInfo
+
+
+np = pytest.importorskip("numpy")
+
+from pyscx.stats import StatMatrix  # noqa: E402
+
+
+STATS = [
+    {"id": "kills", "type": "INTEGER", "value": {"value": 42}},
+    {"id": "accuracy", "type": "DECIMAL", "value": {"value": 0.1}},
+    {"id": "first-kill", "type": "DATE", "value": {"value": "2024-01-01T00:00:00Z"}},
+    {"id": "playtime", "type": "DURATION", "value": {"value": 90_000}},
+    {"id": "empty", "type": "INTEGER", "value": {}},
+]
+
+
+def profile(base: dict, name: str, stats: list[dict]) -> dict:
+    return {**base, "username": name, "stats": stats}
+
+
+@pytest.fixture
+def character(valid_character_profile_data) -> FullCharacterInfo:
+    return FullCharacterInfo(**profile(valid_character_profile_data, "Test-1", STATS))
+
+
+def test_stat_index(character):
+    assert character.stat("kills") is character.stats[0]
+    assert character.stat("missing") is None
+
+
+def test_typed_accessors(character):
+    assert character.get_int("kills") == 42
+    assert character.get_decimal("accuracy") == Decimal("0.1")
+    assert character.get_datetime("first-kill") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert character.get_timedelta("playtime") == timedelta(seconds=90)
+    assert character.get_int("empty") is None and character.get_int("missing") is None
+    with pytest.raises(TypeError):
+        character.get_int("playtime")
+
+
+def test_index_survives_round_trip(character):
+    copy = FullCharacterInfo.model_validate_json(character.model_dump_json(by_alias=True))
+
+    assert copy == character
+    assert copy.get_int("kills") == 42
+
+
+@pytest.fixture
+def records(valid_character_profile_data) -> list[dict]:
+    return [
+        profile(valid_character_profile_data, "a", STATS),
+        profile(valid_character_profile_data, "b", [{"id": "kills", "type": "INTEGER", "value": {"value": 7}}]),
+        profile(valid_character_profile_data, "c", [{"id": "kills", "type": "INTEGER", "value": {"value": 99}}]),
+    ]
+
+
+def test_matrix(records):
+    matrix = StatMatrix.from_records(records)
+
+    assert matrix.shape == (3, 5)
+    assert matrix.stat_ids == ["kills", "accuracy", "first-kill", "playtime", "empty"]
+    assert matrix.types[:4] == list(CharacterStatType) and matrix.types[4] is None
+    assert list(matrix.column("kills")) == [42.0, 7.0, 99.0]
+    assert matrix.column("playtime")[0] == 90.0 and np.isnan(matrix.column("playtime")[1])
+    assert matrix.column("first-kill")[0] == datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def test_matrix_from_profiles_matches_records(records):
+    profiles = [FullCharacterInfo(**record) for record in records]
+
+    expected = StatMatrix.from_records(records, stat_ids=["playtime", "kills"])
+    matrix = StatMatrix.from_profiles(profiles, stat_ids=["playtime", "kills"])
+
+    assert matrix.stat_ids == ["playtime", "kills"]
+    assert np.array_equal(matrix.values, expected.values, equal_nan=True)
+
+
+def test_dates_without_offset_are_utc(valid_character_profile_data, monkeypatch):
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    stat = {"id": "first-kill", "type": "DATE", "value": {"value": "2024-01-01T00:00:00"}}
+    record = profile(valid_character_profile_data, "a", [stat])
+    expected = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    try:
+        assert FullCharacterInfo(**record).get_datetime("first-kill") == expected
+        assert StatMatrix.from_records([record]).column("first-kill")[0] == expected.timestamp()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_leaderboard(records):
+    matrix = StatMatrix.from_records(records)
+
+    assert matrix.top("kills", n=2) == [("c", 99.0), ("a", 42.0)]
+    assert matrix.top("kills", n=5, ascending=True) == [("b", 7.0), ("a", 42.0), ("c", 99.0)]
+    assert matrix.top("playtime") == [("a", 90.0)]
+    assert list(matrix.rank("kills")) == [2.0, 3.0, 1.0]
+    assert np.isnan(matrix.rank("accuracy")[1])
+    with pytest.raises(KeyError):
+        matrix.column("missing")
@@ -0,0 +1,107 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from pyscx.objects import AuctionLot, AuctionRedeemedLot, Clan, ClanMember
+from pyscx.storage import SnapshotStore, lot_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(tmp_path / "snapshots.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def clans(valid_clan_data):
+    return [Clan(**{**valid_clan_data, "id": f"clan-{i}", "level": i}) for i in range(3)]
+
+
+def test_point_lookup_returns_latest_state(store, clans):
+    store.put("eu", clans, fetched_at=100)
+    store.put("EU", Clan(**{**clans[1].raw(), "level": 50}), fetched_at=200)
+
+    assert store.latest(Clan, "EU", "clan-1").level == 50
+    assert store.latest(Clan, "EU", "clan-1", at=150) == clans[1]
+    assert store.latest(Clan, "EU", "clan-1", at=200).level == 50
+    assert store.latest(Clan, "RU", "clan-1") is None
+    assert store.latest(ClanMember, "EU", "clan-1") is None
+
+
+def test_range_query(store, clans):
+    for fetched_at in (100, 200, 300):
+        store.put("EU", clans, fetched_at=fetched_at)
+
+    snapshots = store.query(Clan, "EU", start=150, end=300)
+
+    assert [(s.key, s.fetched_at) for s in snapshots] == [(f"clan-{i}", 200.0) for i in range(3)]
+    assert [s.object for s in snapshots] == clans
+    assert len(store.query(Clan, "EU", key="clan-2")) == 3
+    assert len(store.query(Clan, "EU", limit=4)) == 4
+
+
+def test_datetime_bounds(store, clans):
+    moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store.put("EU", clans, fetched_at=moment)
+
+    assert len(store.query(Clan, "EU", start=moment)) == 3
+    assert store.query(Clan, "EU", end=moment) == []
+
+
+def test_columns(store, clans):
+    store.put("EU", clans, fetched_at=100)
+
+    columns = store.columns(Clan, "EU")
+
+    assert columns["key"] == ["clan-0", "clan-1", "clan-2"]
+    assert columns["level"] == [0, 1, 2]
+    assert columns["member_count"] == [clan.member_count for clan in clans]
+    assert set(columns) == {"key", "fetched_at", *Clan.model_fields}
+
+
+def test_models_without_default_key(store, valid_redeemed_lot_data):
+    lot = AuctionRedeemedLot(**valid_redeemed_lot_data)
+
+    with pytest.raises(ValueError):
+        store.put("EU", [lot])
+
+    assert store.put("EU", [lot, lot], key="1kv2") == 2
+    assert [s.object for s in store.query(AuctionRedeemedLot, "EU", key="1kv2")] == [lot, lot]
+
+
+def test_lots_are_keyed_per_lot_and_indexed_by_item(store, valid_active_lot_data):
+    lots = [
+        AuctionLot(**{**valid_active_lot_data, "itemId": item_id, "startTime": f"2025-02-11T00:0{i}:00Z"})
+        for item_id in ("1kv2", "y3jq")
+        for i in range(2)
+    ]
+    store.put("EU", lots, fetched_at=100)
+    store.put("EU", AuctionLot(**{**lots[0].raw(), "currentPrice": 500}), fetched_at=200)
+
+    assert store.latest(AuctionLot, "EU", lot_key(lots[0])).current_price == 500
+    assert store.latest(AuctionLot, "EU", lot_key(lots[1])) == lots[1]
+    assert [s.object for s in store.query(AuctionLot, "EU", item_id="1kv2", end=150)] == lots[:2]
+    assert store.columns(AuctionLot, "EU", item_id="y3jq")["key"] == [lot_key(lot) for lot in lots[2:]]
+
+
+def test_item_column_is_added_to_old_stores(tmp_path, clans):
+    path = tmp_path / "old.sqlite3"
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE snapshots (model TEXT, region TEXT, key TEXT, fetched_at REAL, data TEXT)")
+    db.close()
+
+    store = SnapshotStore(path)
+    store.put("EU", clans)
+
+    assert len(store.query(Clan, "EU", item_id=None)) == 3
+    store.close()
+
+
+def test_delete(store, clans):
+    store.put("EU", clans, fetched_at=100)
+    store.put("EU", clans, fetched_at=200)
+
+    assert store.delete(Clan, "EU", before=150) == 3
+    assert len(store.query(Clan, "EU")) == 3
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.sync import HistoryWatermarks
+from pyscx.token import Token, TokenType
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+def sale(second: int, price: int) -> dict:
+    return {"amount": 1, "price": price, "time": f"2024-01-01T12:00:{second:02d}Z", "additional": {}}
+
+
+@pytest.fixture
+def history(api_server):
+    # The API returns the newest sales first.
+    sales = [sale(second, price=second) for second in reversed(range(10))]
+
+    def page(params, headers):
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 200))
+        return 200, {"total": len(sales), "prices": sales[offset : offset + limit]}
+
+    api_server.routes["/EU/auction/1kv2/history"] = page
+    api_server.sales = sales
+    return api_server
+
+
+def test_sync_returns_only_new_sales(history):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    watermarks = HistoryWatermarks()
+
+    first = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=3)
+    assert [lot.price for lot in first] == list(reversed(range(10)))
+    assert len(history.calls) == 4
+
+    history.calls.clear()
+    assert api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=3) == []
+    assert len(history.calls) == 1
+
+    history.calls.clear()
+    history.sales[:0] = [sale(12, price=120), sale(11, price=110), sale(11, price=111)]
+    delta = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=3)
+    assert [lot.price for lot in delta] == [120, 110, 111]
+    assert len(history.calls) == 2
+
+
+def test_sales_recorded_during_the_sync(api_server):
+    sales = [sale(second, price=second) for second in reversed(range(10))]
+
+    def page(params, headers):
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 200))
+        body = {"total": len(sales), "prices": sales[offset : offset + limit]}
+        if offset == 3:
+            # Two sales are recorded between the second and the third page.
+            sales[:0] = [sale(11, price=110), sale(10, price=100)]
+        return 200, body
+
+    api_server.routes["/EU/auction/1kv2/history"] = page
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    watermarks = HistoryWatermarks()
+
+    first = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=3)
+    second = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=3)
+
+    assert [lot.price for lot in first] == list(reversed(range(10)))
+    assert [lot.price for lot in second] == [110, 100]
+
+
+def test_sales_at_the_watermark_moment(history):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    watermarks = HistoryWatermarks()
+    api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks)
+
+    # Another sale made in the same second as the latest seen one.
+    history.sales.insert(0, sale(9, price=99))
+    delta = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks)
+
+    assert [lot.price for lot in delta] == [99]
+    assert len(watermarks.get("eu", "1kv2").seen) == 2
+
+
+def test_watermarks_survive_dump_and_load(history):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    watermarks = HistoryWatermarks()
+    api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks)
+
+    restored = HistoryWatermarks.load(json.loads(json.dumps(watermarks.dump())))
+
+    assert restored.get("EU", "1kv2") == watermarks.get("EU", "1kv2")
+    assert api.auction(region="EU").sync_history(item_id="1kv2", watermarks=restored) == []
+
+
+def test_watermark_time_must_be_aware(history):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    watermarks = HistoryWatermarks()
+
+    with pytest.raises(ValueError):
+        watermarks.set("EU", "1kv2", datetime(2024, 1, 1, 12, 0, 5))
+    watermarks.set("EU", "1kv2", datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc))
+
+    new_lots = api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks)
+    assert [lot.price for lot in new_lots] == [9, 8, 7, 6, 5]
+
+
+def test_async_sync_history(history):
+    watermarks = HistoryWatermarks()
+
+    async def sync():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.auction(region="EU").sync_history(item_id="1kv2", watermarks=watermarks, limit=4)
+
+    assert len(asyncio.run(sync())) == 10
+    history.sales.insert(0, sale(30, price=300))
+    assert [lot.price for lot in asyncio.run(sync())] == [300]
@@ -0,0 +1,90 @@
+import pytest
+
+from pyscx import API, Server, Token, TokenPool, TokenType
+from pyscx.exceptions import MissingTokenError
+
+
+APP_TOKENS = [Token(value=f"app-{i}", type=TokenType.APPLICATION) for i in range(3)]
+USER_TOKEN = Token(value="user", type=TokenType.USER)
+
+
+def authorizations(server) -> list[str]:
+    return [headers["Authorization"].removeprefix("Bearer ") for _, _, headers in server.calls]
+
+
+def test_pool_keeps_all_tokens_of_a_type():
+    pool = TokenPool([*APP_TOKENS, USER_TOKEN, APP_TOKENS[0]])
+
+    assert len(pool) == 4
+    assert [state.token for state in pool.states(TokenType.APPLICATION)] == APP_TOKENS
+    assert [pool[TokenType.APPLICATION] for _ in range(4)] == ["app-0", "app-1", "app-2", "app-0"]
+    assert pool[TokenType.USER] == "user"
+
+
+def test_pool_missing_type():
+    pool = TokenPool(USER_TOKEN)
+
+    assert TokenType.APPLICATION not in pool
+    with pytest.raises(KeyError):
+        pool[TokenType.APPLICATION]
+
+
+def test_pool_unknown_strategy():
+    with pytest.raises(ValueError):
+        TokenPool(APP_TOKENS, strategy="random")
+
+
+def test_api_rotates_tokens(api_server, valid_clan_data):
+    api_server.routes["/EU/clan/1/info"] = valid_clan_data
+    api = API(server=Server.DEMO, tokens=APP_TOKENS)
+
+    for _ in range(6):
+        api.clans(region="EU").get_info(clan_id="1")
+
+    assert authorizations(api_server) == ["app-0", "app-1", "app-2"] * 2
+
+
+def test_rejected_token_cools_down(api_server, valid_clan_data):
+    def clan_info(params, headers):
+        if headers["Authorization"] == "Bearer app-1":
+            return 429, {"title": "Too Many Requests"}, {"Retry-After": "30"}
+        return 200, valid_clan_data
+
+    api_server.routes["/EU/clan/1/info"] = clan_info
+    pool = TokenPool(APP_TOKENS)
+    api = API(server=Server.DEMO, tokens=pool)
+
+    for _ in range(7):
+        try:
+            api.clans(region="EU").get_info(clan_id="1")
+        except Exception:
+            pass
+
+    assert authorizations(api_server) == ["app-0", "app-1", "app-2", "app-0", "app-2", "app-0", "app-2"]
+    assert [state.failures for state in pool.states(TokenType.APPLICATION)] == [0, 1, 0]
+
+
+def test_least_loaded_follows_reported_quota(api_server, valid_clan_data):
+    quotas = {"Bearer app-0": "10", "Bearer app-1": "50", "Bearer app-2": "30"}
+    api_server.routes["/EU/clan/1/info"] = lambda params, headers: (
+        200,
+        valid_clan_data,
+        {"X-RateLimit-Remaining": quotas[headers["Authorization"]]},
+    )
+    api = API(server=Server.DEMO, tokens=TokenPool(APP_TOKENS, strategy="least_loaded"))
+
+    for _ in range(4):
+        api.clans(region="EU").get_info(clan_id="1")
+
+    # Unknown quotas are tried first, then the token with the most remaining requests is used.
+    assert authorizations(api_server) == ["app-0", "app-1", "app-2", "app-1"]
+
+
+def test_missing_token_error_with_pool():
+    api = API(server=Server.DEMO, tokens=TokenPool(APP_TOKENS))
+
+    with pytest.raises(MissingTokenError):
+        api.friends(region="EU").get_all(character_name="Test-1")
+    with pytest.raises(MissingTokenError):
+        api.get_token(TokenType.USER)
+    assert api.get_token(TokenType.APPLICATION) == "app-0"
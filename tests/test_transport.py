@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.exceptions import DeadlineExceeded
+from pyscx.retry import RetryPolicy
+from pyscx.token import Token, TokenType
+from pyscx.transport import Deadline, Transport
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+def slow(payload, delay: float):
+    def route(params, headers):
+        time.sleep(delay)
+        return 200, payload
+
+    return route
+
+
+@pytest.fixture
+def routes(api_server, valid_clan_data, valid_redeemed_lot_data):
+    def unavailable(params, headers):
+        return 503, {"title": "Unavailable"}
+
+    api_server.routes["/EU/clan/1/info"] = valid_clan_data
+    api_server.routes["/EU/clan/slow/info"] = slow(valid_clan_data, 1.0)
+    api_server.routes["/EU/clan/down/info"] = unavailable
+    api_server.routes["/EU/auction/1kv2/history"] = slow({"total": 10, "prices": [valid_redeemed_lot_data]}, 0.1)
+    return api_server
+
+
+def test_session_settings(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, transport=Transport(pool_maxsize=7, compression=False))
+
+    api.clans(region="EU").get_info(clan_id="1")
+
+    adapter = api._http.get_adapter("https://eapi.stalcraft.net")
+    assert adapter._pool_maxsize == 7
+    assert routes.calls[-1][2]["Accept-Encoding"] == "identity"
+
+
+def test_defaults(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+
+    api.clans(region="EU").get_info(clan_id="1")
+
+    assert api._http.transport.timeout == (5.0, 30.0)
+    assert "gzip" in routes.calls[-1][2]["Accept-Encoding"]
+    assert routes.calls[-1][2]["Connection"] == "keep-alive"
+
+
+def test_keep_alive_disabled(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, transport=Transport(keep_alive=None))
+
+    api.clans(region="EU").get_info(clan_id="1")
+
+    assert routes.calls[-1][2]["Connection"] == "close"
+
+
+def test_read_timeout_bounded_by_deadline(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, transport=Transport(deadline=0.2))
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        api.clans(region="EU").get_info(clan_id="slow")
+    assert time.monotonic() - started < 0.8
+
+
+def test_deadline_covers_retries(routes):
+    events = []
+    retry = RetryPolicy(
+        max_attempts=100, backoff_factor=0.05, jitter=False, max_backoff=0.05, on_retry=events.append
+    )
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, retry=retry)
+
+    with pytest.raises(DeadlineExceeded):
+        api.clans(region="EU").get_info(clan_id="down", deadline=0.3)
+    assert 2 <= len(routes.calls) < 10
+    # The retry given up for the deadline is not reported.
+    assert len(events) == len(routes.calls) - 1
+
+
+def test_deadline_covers_pagination(routes):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN)
+    lots = []
+
+    with pytest.raises(DeadlineExceeded):
+        for lot in api.auction(region="EU").iter_history(item_id="1kv2", limit=1, deadline=0.25):
+            lots.append(lot)
+
+    assert 1 <= len(lots) <= 3
+    assert all("deadline" not in params for _, params, _ in routes.calls)
+
+
+def test_async_deadline(routes):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN, transport=Transport(deadline=0.2)) as api:
+            assert api._http.pool_size == 100
+            await api.clans(region="EU").get_info(clan_id="1")
+            await api.clans(region="EU").get_info(clan_id="slow")
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(fetch())
+    assert time.monotonic() - started < 0.8
+
+
+def test_deadline_clamps_timeouts():
+    deadline = Deadline(2.0)
+
+    connect, read = deadline.clamp((5.0, 1.0))
+
+    assert 1.9 < connect <= 2.0 and read == 1.0
+    assert Deadline.after(None) is None
+    assert not deadline.expired and Deadline(0).expired
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from pyscx import API, AsyncAPI, Server
+from pyscx.objects import AuctionLot, AuctionRedeemedLot, CharacterInfo, Clan, ClanMember, FullCharacterInfo
+from pyscx.token import Token, TokenType
+from pyscx.views import ModelView, view_class
+
+
+APP_TOKEN = Token(value="app-token", type=TokenType.APPLICATION)
+
+
+@pytest.mark.parametrize(
+    "model, fixture",
+    [
+        (AuctionLot, "valid_active_lot_data"),
+        (AuctionRedeemedLot, "valid_redeemed_lot_data"),
+        (Clan, "valid_clan_data"),
+        (ClanMember, "valid_clan_member_data"),
+        (CharacterInfo, "valid_user_character_data"),
+        (FullCharacterInfo, "valid_character_profile_data"),
+    ],
+)
+def test_view_matches_model(request, model, fixture):
+    data = request.getfixturevalue(fixture)
+    view, instance = view_class(model)(data), model(**data)
+
+    for name in model.model_fields:
+        value = getattr(view, name)
+        if isinstance(value, ModelView):
+            value = value.to_model()
+        elif isinstance(value, list):
+            value = [item.to_model() if isinstance(item, ModelView) else item for item in value]
+        assert value == getattr(instance, name)
+    assert view.to_model() == instance
+    assert view.raw() is data
+
+
+def test_fields_are_converted_on_first_access(valid_active_lot_data):
+    view = view_class(AuctionLot)(valid_active_lot_data)
+
+    assert view.buyout_price == 10000
+    assert view.additional is valid_active_lot_data["additional"]
+    assert set(view._values) == {"buyout_price", "additional"}
+    assert view.current_price is None
+    assert view.start_time is view.start_time
+    with pytest.raises(AttributeError):
+        view.buyout_price = 1
+
+
+def test_missing_required_field(valid_clan_data):
+    view = view_class(Clan)({key: value for key, value in valid_clan_data.items() if key != "tag"})
+
+    assert view.name == "Clan #1"
+    with pytest.raises(ValidationError):
+        view.tag
+
+
+@pytest.fixture
+def routes(api_server, valid_clan_data, valid_redeemed_lot_data):
+    api_server.routes["/EU/clans"] = {"totalClans": 2, "data": [valid_clan_data] * 2}
+    api_server.routes["/EU/clan/1/info"] = valid_clan_data
+    api_server.routes["/EU/auction/1kv2/history"] = {"total": 3, "prices": [valid_redeemed_lot_data] * 3}
+    return api_server
+
+
+@pytest.mark.parametrize("fast_parsing", [False, True], ids=["strict", "fast"])
+def test_lazy_results(routes, fast_parsing):
+    api = API(server=Server.DEMO, tokens=APP_TOKEN, fast_parsing=fast_parsing)
+
+    clans = api.clans(region="EU").get_all(lazy=True)
+    clan = api.clans(region="EU").get_info(clan_id="1", lazy=True)
+    history = list(api.auction(region="EU").iter_history(item_id="1kv2", lazy=True))
+
+    assert [type(view).__name__ for view in clans] == ["ClanView", "ClanView"]
+    assert clans[0].member_count == clan.member_count == 1
+    assert len(history) == 3 and history[0].price == 1000
+    assert [item.to_model() for item in clans] == api.clans(region="EU").get_all()
+    assert all("lazy" not in params for _, params, _ in routes.calls)
+
+
+def test_async_lazy_results(routes):
+    async def fetch():
+        async with AsyncAPI(server=Server.DEMO, tokens=APP_TOKEN) as api:
+            return await api.clans(region="EU").get_all(lazy=True)
+
+    clans = asyncio.run(fetch())
+
+    assert clans[0].name == "Clan #1"